@@ -0,0 +1,82 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import bpy
+import time
+
+# Bake estimates shared by the DataBaker & the VATBaker: timing, calibration & report. Each baker keeps its own cost model in its Functions module
+
+###################
+### CALIBRATION ###
+
+# calibration constants of every baker on this machine, measured once per session: { baker name : { operation : seconds per element } }
+calibrations = {}
+
+CALIBRATION_GRID = 64 # the micro-benchmark mesh is a grid of 64x64 quads
+
+def get_calibration(name, measure_calibration):
+    """ Return the calibration constants of a baker, running its micro-benchmark on first use """
+    if name not in calibrations:
+        calibrations[name] = measure_calibration()
+    return calibrations[name]
+
+def time_operation(operation, repeat):
+    """ Return the fastest of several runs of an operation, in seconds """
+    best_time = float("inf")
+    for run_index in range(repeat):
+        start_time = time.perf_counter()
+        operation()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+def new_calibration_mesh(name):
+    """ Return a new, throwaway grid mesh of CALIBRATION_GRID x CALIBRATION_GRID quads. Remove it once measured """
+    grid = CALIBRATION_GRID
+
+    coords = [(x, y, 0.0) for x in range(grid + 1) for y in range(grid + 1)]
+    faces = []
+    for x in range(grid):
+        for y in range(grid):
+            first_corner = x * (grid + 1) + y
+            faces.append((first_corner, first_corner + grid + 1, first_corner + grid + 2, first_corner + 1))
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(coords, [], faces)
+    return mesh
+
+##############
+### REPORT ###
+def add_report_estimate(add_bake_report, estimate, memory_budget):
+    """
+    Add the projected memory & time of an estimate to a baker's report. Baker specific fields are added by the baker.
+
+    :param add_bake_report: the baker's add_bake_report function
+    :param estimate: projected memory in bytes & time in seconds, None if it wasn't projected
+    :param memory_budget: maximum projected memory in megabytes, 0 for no budget
+    :return: is the projected memory over budget?
+    :rtype: bool
+    """
+    memory = estimate["memory"] / (1024.0 * 1024.0)
+    over_budget = memory_budget > 0 and memory > memory_budget
+
+    add_bake_report("estimated", True)
+    add_bake_report("estimate_memory", memory)
+    if estimate["time"] is not None:
+        add_bake_report("estimate_time", estimate["time"])
+    add_bake_report("estimate_over_budget", over_budget)
+
+    return over_budget
+
+def get_over_budget_message(estimate, memory_budget):
+    """ Message of a bake refused because of its memory budget """
+    return "Bake is projected to use %0.1f MB, over the %d MB memory budget" % (estimate["memory"] / (1024.0 * 1024.0), memory_budget)
@@ -22,6 +22,10 @@ import numpy as np
 import xml.etree.ElementTree as ET
 import uuid
 import time
+import hashlib
+
+from . import Properties
+from . import Estimate
 
 XYZUNITVECTOR = mathutils.Vector((1.0, 1.0, 1.0))
 HALFXYZVECTOR = mathutils.Vector((0.5, 0.5, 0.5))
@@ -31,6 +35,11 @@ XYZVECTORS = {
     "Y": mathutils.Vector((0.0, 1.0, 0.0)),
     "Z": mathutils.Vector((0.0, 0.0, 1.0)),
 }
+XYZINDICES = {
+    "X": 0,
+    "Y": 1,
+    "Z": 2,
+}
 
 #######################################################################################
 ###################################### FUNCTIONS ######################################
@@ -84,10 +93,23 @@ def reset_bake_report():
 
     report.meshes_count = 0
     report.empties_count = 0
+    report.reused_meshes_count = 0
+
+    report.estimated = False
+    report.estimate_meshes = 0
+    report.estimate_empties = 0
+    report.estimate_loops = 0
+    report.estimate_uv_layers = 0
+    report.estimate_memory = 0.0
+    report.estimate_time = 0.0
+    report.estimate_over_budget = False
 
     report.xml = False
     report.xml_path = ""
 
+    report.timings.clear()
+    report.total_time = 0.0
+
 def add_bake_report(prop_name, prop_value):
     """ """
     setattr(bpy.context.scene.DataBakerReport, prop_name, prop_value)
@@ -101,6 +123,76 @@ def add_bake_report_uv(ID, name):
     report_uvmap.ID = ID
     report_uvmap.name = name
 
+def get_property_group_dict(property_group):
+    """ Convert a property group to plain python values. Pointers are converted to their name, collections to lists """
+    values = {}
+    for prop in property_group.bl_rna.properties:
+        if prop.identifier == "rna_type":
+            continue
+
+        value = getattr(property_group, prop.identifier)
+        if prop.type == "POINTER":
+            values[prop.identifier] = value.name if value else None
+        elif prop.type == "COLLECTION":
+            values[prop.identifier] = [get_property_group_dict(item) for item in value]
+        elif prop.type == "ENUM" and prop.is_enum_flag:
+            values[prop.identifier] = sorted(value)
+        elif getattr(prop, "is_array", False):
+            values[prop.identifier] = list(value)
+        else:
+            values[prop.identifier] = value
+
+    return values
+
+def get_bake_report_dict(context):
+    """
+    Return the report of the last bake as plain python values, e.g. to serialize it to JSON.
+
+    :param context: Blender current execution context
+    :return: report values
+    :rtype: dict
+    """
+    return get_property_group_dict(context.scene.DataBakerReport)
+
+###############
+### TIMINGS ###
+
+# element counters of the running bake stage. None outside of a timed stage
+bake_counters = None
+
+def begin_bake_timing():
+    """ Reset the element counters and return the stage start time """
+    global bake_counters
+    bake_counters = {
+        "bake_data_calls": 0,
+        "loops": 0,
+        "uv_layers": 0,
+    }
+    return time.perf_counter()
+
+def end_bake_timing(name, start_time, meshes_count = 0):
+    """ Add the wall time & element counters of a bake stage to the report """
+    global bake_counters
+    counters = bake_counters if bake_counters is not None else {}
+    bake_counters = None
+
+    report = bpy.context.scene.DataBakerReport
+
+    report_timing = report.timings.add()
+    report_timing.name = name
+    report_timing.time = time.perf_counter() - start_time
+    report_timing.meshes = meshes_count
+    report_timing.loops = counters.get("loops", 0)
+    report_timing.uv_layers = counters.get("uv_layers", 0)
+    report_timing.bake_data_calls = counters.get("bake_data_calls", 0)
+
+    report.total_time += report_timing.time
+
+def count_bake(counter, value = 1):
+    """ Increment an element counter of the running bake stage, if any """
+    if bake_counters is not None:
+        bake_counters[counter] += value
+
 ###################
 ### MULTIPLIERS ###
 def get_position_data_needs_multiplier(context):
@@ -116,16 +208,17 @@ def get_position_data_multiplier(context):
 
     objs = [settings.transform_obj] if settings.transform_obj else context.selected_objects # baking a specified object's location or each object's location?
 
+    # only allow selected objects of types MESH or EMPTY to be processed, but allow all types for the specified object, if any
+    objs = [obj for obj in objs if obj.type == 'MESH' or obj.type == 'EMPTY' or settings.transform_obj != None]
+
     largest_component = 0.0
-        
-    for obj in objs:
-        # only allow selected objects of types MESH or EMPTY to be processed, but allow all types for the specified object, if any
-        if obj.type == 'MESH' or obj.type == 'EMPTY' or settings.transform_obj != None:
-            obj_location = obj.matrix_world.to_translation()
-            if settings.origin:
-                obj_location -= settings.origin.matrix_world.to_translation() # make position relative to a specified origin, if any
-            
-            largest_component = max(largest_component, max(math.fabs(obj_location.x), max(math.fabs(obj_location.y), math.fabs(obj_location.z))))
+
+    if objs:
+        obj_locations = get_world_matrices(objs)[:, :3, 3]
+        if settings.origin:
+            obj_locations = obj_locations - np.array(settings.origin.matrix_world.to_translation()) # make position relative to a specified origin, if any
+
+        largest_component = float(np.abs(obj_locations).max())
    
     if largest_component > 0.0:
         largest_component += settings.precision_offset
@@ -140,38 +233,17 @@ def get_shapekey_offset_data_needs_multiplier(context):
     settings = context.scene.DataBakerSettings
     return settings.shapekey_offset and (settings.shapekey_offset_channel_mode == "AB_PACKED" or settings.shapekey_offset_channel_mode == "XYZ_PACKED" or settings.shapekey_offset_x_mode == "VCOL" or settings.shapekey_offset_y_mode == "VCOL" or settings.shapekey_offset_z_mode == "VCOL")
 
-def get_shapekey_offset_data_multiplier(context):
-    """ Loop through all selected objects to return the largest absolute X, Y or Z shapekey offset """
+def get_shapekey_offset_data_multiplier(context, objs = None):
+    """ Loop through all selected objects (or the given objects) to return the largest absolute X, Y or Z shapekey offset """
     
     settings = context.scene.DataBakerSettings
 
     largest_component = 0.0
     
-    for obj in context.selected_objects:
-        if obj.data.shape_keys and (settings.shapekey_name in obj.data.shape_keys.key_blocks) and (settings.shapekey_rest_name in obj.data.shape_keys.key_blocks):
-            """
-            initial_shape_keys = []
-            for shape_key in obj.data.shape_keys.key_blocks:
-                initial_shape_keys.append((shape_key.name, shape_key.value)) # cache shapekeys
-                if shape_key.name == settings.shapekey_name:
-                    shape_key.value = 1.0
-                else:
-                    shape_key.value = 0.0
-            """
-            for face in obj.data.polygons:
-                for loop_id in face.loop_indices:
-                    vertex_index = obj.data.loops[loop_id].vertex_index
-
-                    shapekey_vertex_pos = obj.data.shape_keys.key_blocks[settings.shapekey_name].data[vertex_index].co
-                    shapekey_rest_vertex_pos = obj.data.shape_keys.key_blocks[settings.shapekey_rest_name].data[vertex_index].co
-
-                    offset = shapekey_vertex_pos - shapekey_rest_vertex_pos
-
-                    largest_component = max(largest_component, max(math.fabs(offset.x), max(math.fabs(offset.y), math.fabs(offset.z))))
-            """
-            for shape_key_name, shape_key_value in initial_shape_keys:
-                obj.data.shape_keys.key_blocks[shape_key_name].value = shape_key_value # restore shapekeys
-            """
+    for obj in (objs if objs is not None else context.selected_objects):
+        if has_shapekey_offset(obj, settings):
+            offsets, offsets_largest_component = get_shapekey_offsets(obj, settings.shapekey_name, settings.shapekey_rest_name)
+            largest_component = max(largest_component, offsets_largest_component)
 
     if largest_component > 0.0:
         largest_component += settings.precision_offset
@@ -195,38 +267,18 @@ def get_parent_position_data_multiplier(context):
     if settings.parent_max_depth <= 0:
         return 0.0
 
-    manual_max_depth = max(min(settings.parent_depth, settings.parent_max_depth), 1.0)
-
-    objs = [settings.transform_obj] if settings.transform_obj else context.selected_object # baking a specified object's parent's location or all selected object's parent's location?
+    objs = [settings.transform_obj] if settings.transform_obj else context.selected_objects # baking a specified object's parent's location or all selected object's parent's location?
     
     # if we pack parent's position using ABPacking OR XYZPacking OR Individual + Vertex Color, we need to normalize the baked positions to [0:1] and thus first need to find the most distant position's X/Y/Z component as a global divisor
     largest_component = 0.0
-    
-    for obj in objs:
-        parent_obj = obj
-
-        # walk up the hierarchy until we can't find a parent but no more than the specified max hierarchy depth
-        for depth_index in range(settings.parent_max_depth):
-            # if object is valid AND so is its parent AND that parent is either a MESH or an EMPTY
-            if parent_obj and parent_obj.parent and (parent_obj.parent.type == 'MESH' or parent_obj.parent.type == 'EMPTY'):
-                # only process the desired depth if in manual mode
-                if settings.parent_mode == "MANUAL":
-                    if depth_index != (manual_max_depth + 1):
-                        continue
-                
-                # have we found a new parent?
-                parent_obj = parent_obj.parent
-                if parent_obj == None:
-                    break
-                
-                parent_obj_location = parent_obj.matrix_world.to_translation()
-                if settings.origin:
-                    parent_obj_location -= settings.origin.matrix_world.to_translation()
 
-                # cache the largest absolute position X/Y/Z component
-                largest_component = max(largest_component, max(math.fabs(parent_obj_location.x), max(math.fabs(parent_obj_location.y), math.fabs(parent_obj_location.z))))
-            else:
-                break
+    ancestors, hierarchy = get_parent_hierarchy(objs, settings.parent_max_depth)
+    baked_ancestors = np.unique(hierarchy[:, get_bake_parent_depths(settings)])
+    baked_ancestors = baked_ancestors[baked_ancestors >= 0]
+
+    if len(baked_ancestors) > 0:
+        # cache the largest absolute position X/Y/Z component
+        largest_component = float(np.abs(get_parent_locations(settings, get_world_matrices(ancestors))[baked_ancestors]).max())
 
     if largest_component > 0:
         largest_component += settings.precision_offset
@@ -240,19 +292,89 @@ def get_parent_position_data_multiplier(context):
 def get_packed_xyz_vector(unit_vector):
     """ Algorithm to pack three normalized floats into one. Results in *severe* precision loss and probably isn't practical to encode data like positions """
 
-    return (math.ceil(unit_vector.x * 100) * 10) + (math.ceil(unit_vector.y * 100) * 0.1) + (math.ceil(unit_vector.z * 100) * 0.001)
+    return float(get_packed_xyz_vectors((unit_vector,))[0])
 
 def get_packed_ab_vector(unit_vector, a_component, b_component):
     """ Algorithm to pack two normalized floats into one. Gives acceptable precision loss unless numbers are large-ish """
 
-    a = unit_vector.x if a_component == "X" else unit_vector.y if a_component == "Y" else unit_vector.z
-    a = math.floor(a * (4096 - 1)) * 4096    
+    return float(get_packed_ab_vectors((unit_vector,), a_component, b_component)[0])
+
+def get_packed_xyz_vectors(unit_vectors):
+    """
+    Array version of get_packed_xyz_vector.
+
+    :param unit_vectors: (N, 3) normalized floats. Stored as single precision like mathutils vectors, packing math is done in double precision
+    :return: N packed floats
+    :rtype: numpy.ndarray
+    """
+
+    unit_vectors = np.asarray(unit_vectors, dtype=np.float32).astype(np.float64)
+
+    return (np.ceil(unit_vectors[:, 0] * 100) * 10) + (np.ceil(unit_vectors[:, 1] * 100) * 0.1) + (np.ceil(unit_vectors[:, 2] * 100) * 0.001)
+
+def get_packed_ab_vectors(unit_vectors, a_component, b_component):
+    """
+    Array version of get_packed_ab_vector.
+
+    :param unit_vectors: (N, 3) normalized floats. Stored as single precision like mathutils vectors, packing math is done in double precision
+    :param a_component: X, Y or Z component stored in the high bits
+    :param b_component: X, Y or Z component stored in the low bits
+    :return: N packed floats
+    :rtype: numpy.ndarray
+    """
+
+    unit_vectors = np.asarray(unit_vectors, dtype=np.float32).astype(np.float64)
+
+    a = unit_vectors[:, XYZINDICES.get(a_component, 2)]
+    a = np.floor(a * (4096 - 1)) * 4096
+
+    b = unit_vectors[:, XYZINDICES.get(b_component, 2)]
+    b = np.floor(b * (4096 - 1))
 
-    b = unit_vector.x if b_component == "X" else unit_vector.y if b_component == "Y" else unit_vector.z
-    b = math.floor(b * (4096 - 1))
-    
     return (a + b)
 
+def get_unpacked_xyz_vectors(packed_values):
+    """
+    Inverse of get_packed_xyz_vectors, as a shader would unpack the data. Used to check round-trip precision in bulk.
+
+    :param packed_values: N packed floats
+    :return: (N, 3) normalized floats, each component quantized to 0.01. Values read back from 32bits floats will lose most of the Z component
+    :rtype: numpy.ndarray
+
+    Only components in ]0:1] round-trip: they pack to integers in [1:100]. A component of exactly 0 packs to 0 and the packing
+    is then not injective, a 0 component followed by a component of 1 colliding with the previous component raised by 0.01,
+    e.g. (0, 1, 0) and (0.01, 0, 0) both pack to 10 and unpack to (0, 0.99, 1), (1, 0, 1) unpacks to (0.99, 1, 1)
+    """
+
+    packed_values = np.asarray(packed_values, dtype=np.float64)
+
+    # components in ]0:1] were rounded up to integers in [1:100], so the sum of the lower components lies in [0.101:10.1]
+    x = np.clip(np.ceil((packed_values - 10.1) / 10 - 1e-6), 0, 100)
+    remainder = packed_values - x * 10
+
+    y = np.clip(np.ceil((remainder - 0.1) / 0.1 - 1e-4), 0, 100)
+    remainder = remainder - y * 0.1
+
+    z = np.clip(np.round(remainder / 0.001), 0, 100)
+
+    return np.stack((x, y, z), axis=1) * 0.01
+
+def get_unpacked_ab_vectors(packed_values):
+    """
+    Inverse of get_packed_ab_vectors, as a shader would unpack the data. Used to check round-trip precision in bulk.
+
+    :param packed_values: N packed floats
+    :return: (N, 2) normalized floats, the A then B components
+    :rtype: numpy.ndarray
+    """
+
+    packed_values = np.asarray(packed_values, dtype=np.float64)
+
+    a = np.floor(packed_values / 4096)
+    b = packed_values - a * 4096
+
+    return np.stack((a, b), axis=1) / (4096 - 1)
+
 ############
 ### BAKE ###
 def get_bake_axis(quat, component, sign, remap, default = "Z"):
@@ -268,6 +390,39 @@ def get_bake_axis(quat, component, sign, remap, default = "Z"):
 
     return axis_to_bake
 
+def get_bake_axes(matrices, component, sign, remap, default = "Z"):
+    """
+    Array version of get_bake_axis, working on world matrices rather than quaternions.
+
+    :param matrices: (N, 4, 4) world matrices, see get_world_matrices
+    :return: (N, 3) axes
+    :rtype: numpy.ndarray
+    """
+
+    # rotated axes are the normalized columns of the matrices. Negative scales flip the rotation, like Matrix.to_quaternion does
+    rotations = matrices[:, :3, :3]
+    axes_to_bake = rotations[:, :, XYZINDICES.get(component, 2)].copy()
+
+    lengths = np.linalg.norm(axes_to_bake, axis=1)
+    valid = lengths > 0.0
+    axes_to_bake[valid] /= lengths[valid, np.newaxis]
+    axes_to_bake[np.linalg.det(rotations) < 0.0] *= -1.0
+
+    if component != "X" and component != "Y":
+        axes_to_bake *= np.array(sign)
+
+    axes_to_bake[np.linalg.norm(axes_to_bake, axis=1) < 0.001] = np.array(XYZVECTORS[default]) # safe to normalize?
+
+    if remap:
+        axes_to_bake = (axes_to_bake + 1.0) * 0.5 # remap vectors from [-1:1] to [0:1]
+
+    return axes_to_bake
+
+def get_world_matrices(objs):
+    """ Gather the world matrices of objects into a single (N, 4, 4) array """
+
+    return np.array([obj.matrix_world for obj in objs], dtype=np.float64).reshape(-1, 4, 4)
+
 def get_bake_selection(context):
     """
     Modify & ensure the active & selected objects can lead to a valid bake and return the list of objects to include in the bake.
@@ -295,6 +450,14 @@ def get_bake_selection(context):
     """
     Bake will probably need to do a lot of UV processing so ensure the required UVMaps can be accessed or else, created
     """
+    success, msg, uv_indices, vcol_channels, normals = get_bake_channel_map(context)
+    if not success:
+        return (False, msg, None, None)
+
+    success, msg = check_bake_uvmap_count(objs_to_bake, uv_indices, settings.uvmap_name, settings.merge_mesh)
+    if not success:
+        return (False, msg, None, None)
+
     uvmap_name = settings.uvmap_name if settings.uvmap_name != "" else "UVMap.BakedData"
     bake_uvmaps = []
 
@@ -312,20 +475,6 @@ def get_bake_selection(context):
     if settings.invert_v:
         add_bake_report("mesh_uvmap_invert_v", True)
 
-    obj_uvmaps = []
-    for obj in objs_to_bake:
-        if any(uvmap_name in obj.data.uv_layers for uvmap_name in bake_uvmaps): # UVMap exists?
-            pass
-        elif len(obj.data.uv_layers) >= 8: # ensure UVMap can be created
-            return (False, obj.name + " has the maximum amount of uvmaps already", None, None)
-
-        for uvlayer in obj.data.uv_layers: # gather uvmaps as if objects were joined
-            if uvlayer.name not in obj_uvmaps:
-                obj_uvmaps.append(uvlayer.name)
-
-    if not any(uvmap_name in obj_uvmaps for uvmap_name in bake_uvmaps) and settings.merge_mesh and len(obj_uvmaps) >= 8:
-        return (False, "Joined mesh is projected to have more than the maximum amount of uvmaps", None, None)
-
     context.view_layer.objects.active = None # blank canvas
 
     return (True, "", objs_to_bake, active_obj)
@@ -347,24 +496,66 @@ def get_bake_name(context, active_object):
     name = replace_tags(name, tags)
     return name
 
+def duplicate_bake_selection(objs_to_bake):
+    """
+    Duplicate objects and their data through the data API, without operators. Duplicates are linked to the collections of their original and parented to each other like their originals were.
+
+    :param objs_to_bake: objects to duplicate
+    :return: duplicated objects, in the same order
+    :rtype: list
+    """
+    duplicates = {}
+    for obj in objs_to_bake:
+        duplicate = obj.copy()
+        if obj.data is not None:
+            duplicate.data = obj.data.copy()
+        duplicates[obj] = duplicate
+
+    # parent duplicates among themselves, obj.copy() keeps matrix_parent_inverse
+    for obj, duplicate in duplicates.items():
+        if obj.parent in duplicates:
+            duplicate.parent = duplicates[obj.parent]
+
+    # link all duplicates at once, per collection
+    collection_objs = {}
+    for obj, duplicate in duplicates.items():
+        for collection in obj.users_collection:
+            collection_objs.setdefault(collection, []).append(duplicate)
+
+    for collection, objs in collection_objs.items():
+        collection_link = collection.objects.link
+        for obj in objs:
+            collection_link(obj)
+
+    return list(duplicates.values())
+
+def make_single_user_bake_selection(objs_to_bake):
+    """ Give objects sharing their data a copy of it. The last user keeps the original data, like bpy.ops.object.make_single_user """
+    for obj in objs_to_bake:
+        if obj.data is not None and obj.data.users > 1:
+            obj.data = obj.data.copy()
+
 def pre_process_bake_selection(context, objs_to_bake):
     """ """
 
     settings = context.scene.DataBakerSettings
 
     if settings.duplicate_mesh or settings.make_single_user:
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in reversed(objs_to_bake): # @NOTE why reversed?
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-
         if settings.duplicate_mesh:
-            bpy.ops.object.duplicate_move(OBJECT_OT_duplicate={"linked":False, "mode":'TRANSLATION'}, TRANSFORM_OT_translate={"value":(0, 0, 0), "orient_type":'GLOBAL', "orient_matrix":((1, 0, 0), (0, 1, 0), (0, 0, 1)), "orient_matrix_type":'GLOBAL', "constraint_axis":(False, False, False), "mirror":False, "use_proportional_edit":False, "proportional_edit_falloff":'SMOOTH', "proportional_size":1, "use_proportional_connected":False, "use_proportional_projected":False, "snap":False, "snap_elements":{'INCREMENT'}, "use_snap_project":False, "snap_target":'CLOSEST', "use_snap_self":True, "use_snap_edit":True, "use_snap_nonedit":True, "use_snap_selectable":False, "snap_point":(0, 0, 0), "snap_align":False, "snap_normal":(0, 0, 0), "gpencil_strokes":False, "cursor_transform":False, "texture_space":False, "remove_on_cancel":False, "view2d_edge_pan":False, "release_confirm":False, "use_accurate":False, "use_automerge_and_split":False})
+            duplicates = duplicate_bake_selection(objs_to_bake)
+            inherit_bake_hashes(objs_to_bake, duplicates)
+            objs_to_bake = duplicates
+            context.view_layer.update() # single depsgraph update for all duplicates
+        else:
+            make_single_user_bake_selection(objs_to_bake)
 
-        bpy.ops.object.make_single_user(object=True, obdata=True, material=False, animation=False, obdata_animation=False)
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in objs_to_bake:
+            obj.select_set(True)
+        context.view_layer.objects.active = objs_to_bake[0] if objs_to_bake else None
 
     if (len(context.selected_objects) <= 0):
-        return (False, "No mesh or empty selected", None)
+        return (False, "No mesh or empty selected", None, None)
 
     context.view_layer.objects.active = context.selected_objects[0]
 
@@ -376,6 +567,252 @@ def pre_process_bake_selection(context, objs_to_bake):
 
     return (True, "", meshes, empties)
 
+def read_world_normals(obj):
+    """ Return the corner normals of a mesh object, rotated to world space """
+    normals = np.empty(len(obj.data.loops) * 3, dtype=np.float32)
+    obj.data.corner_normals.foreach_get("vector", normals)
+    normals = normals.reshape(-1, 3).astype(np.float64)
+
+    normal_matrix = np.linalg.inv(np.array(obj.matrix_world)[:3, :3]).T
+    normals = normals @ normal_matrix.T
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+
+    return normals / np.where(lengths > 0.0, lengths, 1.0)
+
+# generic attributes carried over by merge_bake_meshes: { data type : (foreach property, components, dtype) }
+MERGE_ATTRIBUTE_TYPES = {
+    "FLOAT": ("value", 1, np.float32),
+    "INT": ("value", 1, np.int32),
+    "INT8": ("value", 1, np.int32),
+    "BOOLEAN": ("value", 1, bool),
+    "FLOAT2": ("vector", 2, np.float32),
+    "INT32_2D": ("value", 2, np.int32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR": ("color", 4, np.float32),
+    "BYTE_COLOR": ("color", 4, np.float32),
+    "QUATERNION": ("value", 4, np.float32),
+}
+
+# attributes merge_bake_meshes writes itself, internal ones (starting with '.') are skipped too
+MERGE_SKIPPED_ATTRIBUTES = {"position", "material_index", "sharp_face"}
+
+def get_attribute_domain_size(data, domain):
+    """ Return the amount of elements of a mesh attribute domain """
+    return {"POINT": len(data.vertices), "EDGE": len(data.edges), "FACE": len(data.polygons), "CORNER": len(data.loops)}[domain]
+
+def merge_bake_meshes(meshes, name):
+    """
+    Merge mesh objects into the last one, in world space, replacing bpy.ops.object.join & transform_apply.
+    Each mesh keeps its loops contiguous and in their original order so baked layers line up exactly. UVMaps, color attributes, generic attributes, vertex groups & shapekeys are matched by name,
+    materials are merged, seams are kept.
+
+    :param meshes: mesh objects to merge
+    :param name: name of the merged object & mesh
+    :return: merged object
+    :rtype: bpy.types.Object
+    """
+    merged_obj = meshes[-1] # like the active object receiving a join
+
+    coords, edges, seams, loop_vertices, loop_edges, loop_starts, material_indices, smooths = [], [], [], [], [], [], [], []
+    materials = []
+    uv_names, color_infos, attribute_infos, shapekey_infos = [], {}, {}, {}
+    vertex_group_weights = {} # { name : ([vertex index], [weight]) }
+    vertex_offset, edge_offset, loop_offset = 0, 0, 0
+
+    for mesh in meshes:
+        data = mesh.data
+        mesh_loop_vertices, mesh_loop_starts, mesh_loop_totals = read_mesh_topology(data)
+
+        coords.append(read_world_coords(mesh))
+
+        mesh_edges = np.empty(len(data.edges) * 2, dtype=np.int32)
+        data.edges.foreach_get("vertices", mesh_edges)
+        edges.append(mesh_edges + vertex_offset)
+
+        mesh_seams = np.empty(len(data.edges), dtype=bool)
+        data.edges.foreach_get("use_seam", mesh_seams)
+        seams.append(mesh_seams)
+
+        mesh_loop_edges = np.empty(len(data.loops), dtype=np.int32)
+        data.loops.foreach_get("edge_index", mesh_loop_edges)
+        loop_vertices.append(mesh_loop_vertices + vertex_offset)
+        loop_edges.append(mesh_loop_edges + edge_offset)
+        loop_starts.append(mesh_loop_starts + loop_offset)
+
+        # remap material indices to the merged material list
+        material_remap = []
+        for material_slot in mesh.material_slots:
+            if material_slot.material not in materials:
+                materials.append(material_slot.material)
+            material_remap.append(materials.index(material_slot.material))
+
+        mesh_material_indices = np.empty(len(data.polygons), dtype=np.int32)
+        data.polygons.foreach_get("material_index", mesh_material_indices)
+        if material_remap:
+            mesh_material_indices = np.array(material_remap, dtype=np.int32)[np.clip(mesh_material_indices, 0, len(material_remap) - 1)]
+        material_indices.append(mesh_material_indices)
+
+        mesh_smooths = np.empty(len(data.polygons), dtype=bool)
+        data.polygons.foreach_get("use_smooth", mesh_smooths)
+        smooths.append(mesh_smooths)
+
+        for uv_layer in data.uv_layers:
+            if uv_layer.name not in uv_names:
+                uv_names.append(uv_layer.name)
+
+        for color_attribute in data.color_attributes:
+            color_infos.setdefault(color_attribute.name, (color_attribute.data_type, color_attribute.domain))
+
+        for attribute in data.attributes:
+            if attribute.name.startswith(".") or attribute.name in MERGE_SKIPPED_ATTRIBUTES or attribute.data_type not in MERGE_ATTRIBUTE_TYPES:
+                continue
+            attribute_infos.setdefault(attribute.name, (attribute.data_type, attribute.domain))
+
+        # weights can only be read per vertex
+        if mesh.vertex_groups:
+            vertex_group_names = [vertex_group.name for vertex_group in mesh.vertex_groups]
+            for vertex in data.vertices:
+                for vertex_group in vertex.groups:
+                    indices, weights = vertex_group_weights.setdefault(vertex_group_names[vertex_group.group], ([], []))
+                    indices.append(vertex.index + vertex_offset)
+                    weights.append(vertex_group.weight)
+
+        if data.shape_keys:
+            for shape_key in data.shape_keys.key_blocks:
+                shapekey_infos.setdefault(shape_key.name, shape_key.value)
+
+        vertex_offset += len(data.vertices)
+        edge_offset += len(data.edges)
+        loop_offset += len(data.loops)
+
+    merged_data = bpy.data.meshes.new(name)
+
+    merged_data.vertices.add(vertex_offset)
+    merged_data.vertices.foreach_set("co", np.concatenate(coords).astype(np.float32).ravel())
+    merged_data.edges.add(edge_offset)
+    merged_data.edges.foreach_set("vertices", np.concatenate(edges))
+    merged_data.edges.foreach_set("use_seam", np.concatenate(seams))
+    merged_data.loops.add(loop_offset)
+    merged_data.loops.foreach_set("vertex_index", np.concatenate(loop_vertices))
+    merged_data.loops.foreach_set("edge_index", np.concatenate(loop_edges))
+
+    loop_starts = np.concatenate(loop_starts)
+    merged_data.polygons.add(len(loop_starts))
+    merged_data.polygons.foreach_set("loop_start", loop_starts)
+    merged_data.polygons.foreach_set("material_index", np.concatenate(material_indices))
+    merged_data.polygons.foreach_set("use_smooth", np.concatenate(smooths))
+
+    for material in materials:
+        merged_data.materials.append(material)
+
+    merged_data.update()
+
+    for uv_name in uv_names:
+        uvs = []
+        for mesh in meshes:
+            uv_layer = mesh.data.uv_layers.get(uv_name)
+            mesh_uvs = np.zeros(len(mesh.data.loops) * 2, dtype=np.float32)
+            if uv_layer:
+                uv_layer.data.foreach_get("uv", mesh_uvs)
+            uvs.append(mesh_uvs)
+
+        merged_data.uv_layers.new(name=uv_name).data.foreach_set("uv", np.concatenate(uvs))
+
+    for color_name, (data_type, domain) in color_infos.items():
+        cols = []
+        for mesh in meshes:
+            color_attribute = mesh.data.color_attributes.get(color_name)
+            mesh_cols = np.zeros(len(mesh.data.vertices if domain == "POINT" else mesh.data.loops) * 4, dtype=np.float32)
+            if color_attribute and color_attribute.domain == domain:
+                color_attribute.data.foreach_get(get_color_attribute_prop(color_attribute.data_type), mesh_cols)
+            cols.append(mesh_cols)
+
+        merged_data.color_attributes.new(name=color_name, type=data_type, domain=domain).data.foreach_set(get_color_attribute_prop(data_type), np.concatenate(cols))
+
+    # generic attributes: sharp edges, creases, bevel weights, custom data...
+    for attribute_name, (data_type, domain) in attribute_infos.items():
+        if attribute_name in uv_names or attribute_name in color_infos:
+            continue
+
+        prop, components, dtype = MERGE_ATTRIBUTE_TYPES[data_type]
+        values = []
+        for mesh in meshes:
+            attribute = mesh.data.attributes.get(attribute_name)
+            mesh_values = np.zeros(get_attribute_domain_size(mesh.data, domain) * components, dtype=dtype)
+            if attribute and attribute.domain == domain and attribute.data_type == data_type:
+                attribute.data.foreach_get(prop, mesh_values)
+            values.append(mesh_values)
+
+        merged_attribute = merged_data.attributes.get(attribute_name)
+        if merged_attribute is None:
+            merged_attribute = merged_data.attributes.new(name=attribute_name, type=data_type, domain=domain)
+        elif merged_attribute.domain != domain or merged_attribute.data_type != data_type:
+            continue
+        merged_attribute.data.foreach_set(prop, np.concatenate(values))
+
+    active_color = merged_obj.data.color_attributes.active_color
+    if active_color and active_color.name in merged_data.color_attributes:
+        merged_data.color_attributes.active_color = merged_data.color_attributes[active_color.name]
+
+    # custom normals (e.g. baked by bake_data in NORMALS mode)
+    if any(mesh.data.has_custom_normals for mesh in meshes):
+        normals = np.concatenate([read_world_normals(mesh) for mesh in meshes]).astype(np.float32)
+        merged_data.normals_split_custom_set(normals)
+
+    # shapekeys are read before the merged object loses its data
+    shapekey_coords = {}
+    for shapekey_name in shapekey_infos:
+        mesh_coords = []
+        for mesh in meshes:
+            matrix = np.array(mesh.matrix_world)
+            shapekeys = mesh.data.shape_keys
+            if shapekeys and shapekey_name in shapekeys.key_blocks:
+                local_coords = read_shapekey_coords(shapekeys.key_blocks[shapekey_name]).astype(np.float64)
+                mesh_coords.append((local_coords @ matrix[:3, :3].T) + matrix[:3, 3])
+            else:
+                mesh_coords.append(read_world_coords(mesh))
+        shapekey_coords[shapekey_name] = np.concatenate(mesh_coords).astype(np.float32).ravel()
+
+    # keep meshes & empties parented to merged meshes in place
+    merged_set = set(meshes)
+    children = [(child, child.matrix_world.copy()) for child in bpy.data.objects if child.parent in merged_set and child not in merged_set]
+
+    old_datas = [mesh.data for mesh in meshes]
+    for mesh in meshes[:-1]:
+        bpy.data.objects.remove(mesh, do_unlink=True)
+
+    merged_obj.data = merged_data
+    merged_obj.parent = None
+    merged_obj.matrix_world = mathutils.Matrix.Identity(4)
+    merged_obj.name = name
+
+    # vertices sharing a weight are added at once
+    for vertex_group_name, (indices, weights) in vertex_group_weights.items():
+        vertex_group = merged_obj.vertex_groups.get(vertex_group_name)
+        if vertex_group is None:
+            vertex_group = merged_obj.vertex_groups.new(name=vertex_group_name)
+
+        indices = np.array(indices, dtype=np.int32)
+        weights = np.array(weights, dtype=np.float32)
+        for weight in np.unique(weights):
+            vertex_group.add(indices[weights == weight].tolist(), float(weight), 'REPLACE')
+
+    for shapekey_name, value in shapekey_infos.items():
+        shape_key = merged_obj.shape_key_add(name=shapekey_name, from_mix=False)
+        shape_key.data.foreach_set("co", shapekey_coords[shapekey_name])
+        shape_key.value = value
+
+    for child, matrix in children:
+        child.parent = merged_obj
+        child.matrix_parent_inverse = mathutils.Matrix.Identity(4)
+        child.matrix_world = matrix
+
+    for old_data in old_datas:
+        if old_data.users == 0:
+            bpy.data.meshes.remove(old_data)
+
+    return merged_obj
+
 def post_process_bake_selection(context, meshes, empties):
     """ """
     bpy.ops.object.select_all(action='DESELECT')
@@ -386,23 +823,15 @@ def post_process_bake_selection(context, meshes, empties):
             empty.select_set(True)
         bpy.ops.object.delete(use_global=False, confirm=False)
 
-    if settings.merge_mesh:
-        for mesh in meshes:
-            mesh.select_set(True)
-            context.view_layer.objects.active = mesh
-
+    if settings.merge_mesh and len(meshes) > 0:
         name = settings.mesh_name if settings.mesh_name != "" else "BakedMesh.Data"
-        context.view_layer.objects.active.name      = name
-        context.view_layer.objects.active.data.name = name
+        merged_obj = merge_bake_meshes(meshes, name)
 
-        if len(meshes) > 1:
-            bpy.ops.object.join()
-        
-        # only report mesh if it has been merged
-        add_bake_report("mesh", context.view_layer.objects.active)
+        merged_obj.select_set(True)
+        context.view_layer.objects.active = merged_obj
 
-        bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+        # only report mesh if it has been merged
+        add_bake_report("mesh", merged_obj)
     else:
         for mesh in meshes:
             mesh.select_set(True)
@@ -412,12 +841,32 @@ def post_process_bake_selection(context, meshes, empties):
 
 def bake(context):
     """
-    Main bake function.
+    Main bake function. Runs the whole bake at once, see iter_bake.
 
     :param context: Blender current execution context
     :return: success, message verbose, message
     :rtype: tuple
     """
+    bake_steps = iter_bake(context)
+    try:
+        while True:
+            next(bake_steps)
+    except StopIteration as stop:
+        return stop.value
+
+def iter_bake(context):
+    """
+    Main bake function, as a generator so a bake can be spread over several calls and cancelled, see DATABAKER_OT_BakeData.
+    Yields (progress, cancellable, loops baked by the last chunk) between chunks of work. The caller may send back the amount of loops to bake in the next chunk,
+    None bakes each stage at once. Closing the generator while cancellable rolls the bake back, see rollback_bake.
+
+    :param context: Blender current execution context. It must stay valid across calls, pass bpy.context if the bake is spread over several operator calls
+    :return: success, message verbose, message
+    :rtype: tuple
+    """
+    # hand control back before any work, so the caller can size the first chunk
+    progress = {"chunk_loops": (yield (0.0, True, 0)), "loops": 0, "total": 0}
+
     bpy.ops.object.mode_set(mode="OBJECT")
     
     settings = context.scene.DataBakerSettings
@@ -428,13 +877,46 @@ def bake(context):
 
     bake_start_time = time.time()
 
+    stage_start_time = begin_bake_timing()
     success, msg, objs_to_bake, active_object = get_bake_selection(context)
+    end_bake_timing("selection", stage_start_time, len(objs_to_bake) if success else 0)
+    if not success:
+        add_bake_report("success", False)
+        add_bake_report("msg", msg)
+        return (False, 'ERROR', msg)
+
+    success, msg = check_bake_color_attribute(context, objs_to_bake)
     if not success:
         add_bake_report("success", False)
         add_bake_report("msg", msg)
         return (False, 'ERROR', msg)
 
+    # refuse to start a bake that wouldn't fit in the memory budget, the time projection is left to the dry run
+    if settings.memory_budget > 0:
+        stage_start_time = begin_bake_timing()
+        success, msg, estimate = get_bake_estimate(context, objs_to_bake, include_time = False)
+        end_bake_timing("estimate", stage_start_time, len(objs_to_bake))
+        if not success:
+            add_bake_report("success", False)
+            add_bake_report("msg", msg)
+            return (False, 'ERROR', msg)
+
+        if add_bake_report_estimate(estimate, settings.memory_budget):
+            msg = Estimate.get_over_budget_message(estimate, settings.memory_budget)
+            add_bake_report("success", False)
+            add_bake_report("msg", msg)
+            return (False, 'ERROR', msg)
+
+    # only meshes whose content changed since the last bake are baked again
+    incremental_bake = settings.incremental_bake and not get_incremental_bake_blockers(context)
+    if incremental_bake:
+        stage_start_time = begin_bake_timing()
+        hash_bake_selection(context, objs_to_bake)
+        end_bake_timing("hash", stage_start_time, len(objs_to_bake))
+
+    stage_start_time = begin_bake_timing()
     success, msg, meshes, empties = pre_process_bake_selection(context, objs_to_bake)
+    end_bake_timing("pre_process", stage_start_time, len(meshes) if success else 0)
     if not success:
         add_bake_report("success", False)
         add_bake_report("msg", msg)
@@ -446,20 +928,86 @@ def bake(context):
     ########
     # BAKE #
 
-    for bake_function in get_bake_functions():
-        bake_function(context, meshes, empties)
+    bake_functions = get_bake_functions()
+
+    # progress is counted in loops: layers are prepared, baked by every bake function & flushed
+    loops = sum(len(mesh.data.loops) for mesh in meshes)
+    progress["total"] = max(loops * (len(bake_functions) + 2), 1)
+
+    # features depending on the whole selection must see every mesh at once
+    chunked = not get_whole_selection_features(context)
+
+    begin_bake_buffers(get_bake_color_attribute(context))
+    begin_bake_cache()
+
+    # anything written to the meshes until the flush can be rolled back
+    bake_layers = {} if settings.duplicate_mesh else get_bake_layers(meshes)
+
+    try:
+        # every layer is created once, up front
+        success, msg, uv_indices, vcol_channels, normals = get_bake_channel_map(context)
+        yield from iter_bake_stage("prepare_layers", meshes, lambda chunk: prepare_bake_layers(chunk, uv_indices, len(vcol_channels) > 0, settings.uvmap_name, settings.invert_v), progress)
+
+        meshes_to_bake = meshes
+        if incremental_bake:
+            meshes_to_bake = reuse_baked_layers(meshes)
+            add_bake_report("reused_meshes_count", len(meshes) - len(meshes_to_bake))
+            progress["total"] -= (loops - sum(len(mesh.data.loops) for mesh in meshes_to_bake)) * len(bake_functions)
+
+        for bake_function in bake_functions:
+            yield from iter_bake_stage(bake_function.__name__, meshes_to_bake, lambda chunk: bake_function(context, chunk, empties), progress, chunked)
+
+        if incremental_bake:
+            store_baked_layers(meshes)
+    except GeneratorExit:
+        discard_bake_buffers()
+        rollback_bake(context, objs_to_bake, active_object, meshes, empties, bake_layers)
+        add_bake_report("success", False)
+        add_bake_report("msg", "Bake cancelled")
+        raise
+    except Exception:
+        discard_bake_buffers() # don't leave staging enabled for later, unrelated writes
+        raise
+    finally:
+        end_bake_cache() # topology is only valid until the selection is joined
+
+    # commit every layer to its mesh exactly once, meshes are modified from now on
+    try:
+        yield from iter_bake_stage("flush", meshes, lambda chunk: flush_bake_buffers(settings.uvmap_name, settings.invert_v, chunk), progress, cancellable = False)
+        flush_bake_buffers(settings.uvmap_name, settings.invert_v)
+    except GeneratorExit:
+        # not cancellable, but the caller may still close the bake, see DATABAKER_OT_BakeData.cancel
+        discard_bake_buffers()
+        add_bake_report("success", False)
+        add_bake_report("msg", "Bake interrupted while writing its layers")
+        raise
+    except Exception:
+        discard_bake_buffers()
+        raise
 
     ########
     # MESH #
 
+    stage_start_time = begin_bake_timing()
     success, msg, objs_to_export = post_process_bake_selection(context, meshes, empties)
+    end_bake_timing("merge", stage_start_time, len(meshes))
     if not success:
         add_bake_report("success", False)
         add_bake_report("msg", msg)
         return (False, 'ERROR', msg)
 
     if settings.export_mesh:
+        try:
+            yield (1.0, False, 0)
+        except GeneratorExit:
+            discard_bake_buffers()
+            add_bake_report("success", False)
+            add_bake_report("msg", "Bake interrupted before its export")
+            raise
+
+        stage_start_time = begin_bake_timing()
         success, msg, mesh_path = export_mesh(context, bake_name, objs_to_export)
+        end_bake_timing("fbx_export", stage_start_time, len(objs_to_export))
         if not success:
             add_bake_report("success", False)
             add_bake_report("msg", msg)
@@ -471,7 +1019,10 @@ def bake(context):
     # XML #
 
     if settings.export_xml:
+        # the xml can't hold its own export time, it is only reported
+        stage_start_time = begin_bake_timing()
         success, msg, path = export_xml(context)
+        end_bake_timing("xml_export", stage_start_time)
         add_bake_report("xml", True)
         add_bake_report("xml_path", path)
 
@@ -479,380 +1030,1277 @@ def bake(context):
 
     return (True, 'INFO', "Baked operation completed in %0.1fs" % (time.time() - bake_start_time))
 
-def bake_data(obj, bake_data, bake_mode, uv_index, uv_channel, uv_name, rgba, invert_v = True, bake_loop_id = -1):
-    """ Writes a float (data) to a specific UVMap at a specific channel of a given object, or to its vertex color at a specific color channel """
-
-    if uv_index < 0 or uv_index > 7:
-        return False
+def get_bake_chunk_end(meshes, chunk_start, chunk_loops):
+    """ Return the end of the chunk of meshes starting at chunk_start and holding at most chunk_loops loops, one mesh at least. None for a single chunk """
+    if chunk_loops is None:
+        return len(meshes)
 
-    if bake_mode == "UV":
-        # create & zero uvmap(s) if needed
-        while (uv_index > (len(obj.data.uv_layers) - 1)):
-            obj.data.uv_layers.new()
-            uvmap_index = len(obj.data.uv_layers) - 1
-            
-            for face in obj.data.polygons:
-                for loop_id in face.loop_indices:
-                    obj.data.uv_layers[uvmap_index].data[loop_id].uv = (0.0, 1.0 if invert_v else 0.0)
-        
-        uv_name = uv_name if uv_name != "" else "UVMap.BakedData"
-        uv_name += "." + str(uv_index)
-        obj.data.uv_layers[uv_index].name = uv_name
-    elif rgba == "R" or rgba == "G" or rgba == "B" or rgba == "A" or rgba == "RGB" or rgba == "RG":
-        if obj.data.vertex_colors:
-            vcol = obj.data.vertex_colors.active
-        else:
-            vcol = obj.data.vertex_colors.new()
-            
-            for face in obj.data.polygons:
-                for loop_id in face.loop_indices:
-                    vcol.data[loop_id].color = [0.0, 0.0, 0.0, 0.0]
+    chunk_end = chunk_start + 1
+    loops = len(meshes[chunk_start].data.loops)
+    while chunk_end < len(meshes) and loops + len(meshes[chunk_end].data.loops) <= chunk_loops:
+        loops += len(meshes[chunk_end].data.loops)
+        chunk_end += 1
 
-    elif bake_mode == "NORMALS":
-        #obj.data.use_auto_smooth = True # @DEPRECATED in 4.1, used to be required to use custom normals
+    return chunk_end
 
-        for face in obj.data.polygons:
-            face.use_smooth = True
+def iter_bake_stage(name, meshes, stage_function, progress, chunked = True, cancellable = True):
+    """
+    Run a bake stage over chunks of meshes sized by the caller of iter_bake, handing control back after each chunk. The stage timing excludes the time spent away.
 
-        # create and assign normal buffer
-        normals = []
-        for vertex in obj.data.vertices:
-            normals.append(bake_data)
+    :param name: stage name, see end_bake_timing
+    :param stage_function: function called with each chunk, a list of meshes
+    :param progress: progress of iter_bake, updated in place
+    :param chunked: False to process every mesh in a single chunk
+    :param cancellable: can the bake still be cancelled once this stage started?
+    """
+    stage_start_time = begin_bake_timing()
 
-        obj.data.normals_split_custom_set_from_vertices(normals)
-        return True
+    if not meshes:
+        stage_function(meshes) # stages still report
 
-    for face in obj.data.polygons:
-        for loop_id in face.loop_indices:
-            # override loop ID if one was specified. We might call this function *while* we loop through loop indices already to compute data to bake, based on polys or vertices, and so we wouldn't want to do that twice.
-            # we're going to exit early those for loops if that's the case and write data just that once on the specified loop index @NOTE fix hack
-            if (bake_loop_id >= 0):
-                loop_id = bake_loop_id
-            
-            if bake_mode == "UV":
-                # only set data on the specified UV channel (U or V) and preserve the other data
-                if (uv_channel == "U"):
-                    obj.data.uv_layers[uv_index].data[loop_id].uv[0] = bake_data
-                else:
-                    # need to flip UV's Y axis for Unreal!
-                    obj.data.uv_layers[uv_index].data[loop_id].uv[1] = (1.0 - bake_data) if invert_v else bake_data
-                
-            else:
-                # only set data on the specified rgba channel and preserve data on other channels
-                col = vcol.data[loop_id].color
-                if rgba == "R":
-                    col[0] = bake_data
-                elif rgba == "G":
-                    col[1] = bake_data
-                elif rgba == "B":
-                    col[2] = bake_data
-                elif rgba == "A":
-                    col[3] = bake_data
-                elif rgba == "RGB":
-                    col[0] = bake_data.x
-                    col[1] = bake_data.y
-                    col[2] = bake_data.z
-                elif rgba == "RG":
-                    col[0] = bake_data.x
-                    col[1] = bake_data.y
-    
-                vcol.data[loop_id].color = col
-            
-            # exit early if loop ID was specified and data written there just that once. We don't want to loop through loop indices here
-            if (bake_loop_id >= 0):
-                break
-        # exit early if loop ID was specified and data written there just that once. We don't want to loop through polygons here
-        if (bake_loop_id >= 0):
-            break
-        
-    return True
+    chunk_start = 0
+    while chunk_start < len(meshes):
+        chunk_end = get_bake_chunk_end(meshes, chunk_start, progress["chunk_loops"] if chunked else None)
+        stage_function(meshes[chunk_start:chunk_end])
 
-######################
-### BAKE FUNCTIONS ###
-def get_bake_functions():
-    """ """
-    return [
-        bake_position,
-        bake_axis,
-        bake_shapekey_offset,
-        bake_shapekey_normal,
-        bake_linear_mask,
-        bake_sphere_mask,
-        bake_random_value_per_collection,
-        bake_random_value_per_object,
-        bake_random_value_per_polygon,
-        bake_parent,
-        bake_fixed_value,
-        bake_direction
-    ]
+        chunk_loops = sum(len(mesh.data.loops) for mesh in meshes[chunk_start:chunk_end])
+        progress["loops"] += chunk_loops
+        chunk_start = chunk_end
 
-def bake_position(context, meshes, empties):
-    """ """
+        yield_start_time = time.perf_counter()
+        progress["chunk_loops"] = yield (min(progress["loops"] / progress["total"], 1.0), cancellable, chunk_loops)
+        stage_start_time += time.perf_counter() - yield_start_time
 
-    settings = context.scene.DataBakerSettings
+    end_bake_timing(name, stage_start_time, len(meshes))
 
-    if not settings.position:
-        return False
+def get_bake_layers(meshes):
+    """ Return the UVMap count & color attribute names of meshes, to remove the layers a bake added to them, see rollback_bake """
+    return {mesh: (len(mesh.data.uv_layers), {color_attribute.name for color_attribute in mesh.data.color_attributes}) for mesh in meshes}
 
-    signed_axis = mathutils.Vector((-1.0 if settings.invert_x else 1.0,
-                                    -1.0 if settings.invert_y else 1.0,
-                                    -1.0 if settings.invert_z else 1.0))
-    signed_scale = signed_axis * settings.scale
+def rollback_bake(context, objs_to_bake, active_object, meshes, empties, bake_layers):
+    """
+    Undo what a cancelled bake did before its flush: remove the duplicated objects, or the layers added to the baked meshes, and restore the selection.
+    Data made single-user isn't shared again.
 
-    # data might need a 'multiplier' to be normalized and packed/unpacked
-    packing_multiplier = get_position_data_multiplier(context) if get_position_data_needs_multiplier(context) else 1.0
-    packing_divisor = 1.0 / packing_multiplier
-    add_bake_report("position_multiplier", packing_multiplier)
+    :param bake_layers: layers the meshes had before the bake, empty if meshes are duplicates, see get_bake_layers
+    """
+    settings = context.scene.DataBakerSettings
 
-    for mesh in meshes:
-        ref_obj = settings.transform_obj if settings.transform_obj else mesh # use specified object if any, else use self
-        loc = ref_obj.matrix_world.to_translation() # get object's location and make it relative to specified origin, if any
-        if settings.origin:
-            loc -= settings.origin.matrix_world.to_translation()
-        loc_to_bake = loc * signed_scale
+    if settings.duplicate_mesh:
+        datas = [obj.data for obj in meshes]
+        for obj in meshes + empties:
+            bpy.data.objects.remove(obj, do_unlink=True)
 
-        if settings.position_channel_mode == "INDIVIDUAL":
-            # packing axis is only available if we pack X/Y/Z components individually
-            if settings.axis and settings.axis_channel_mode == "POSITION_PACKED":
-                quat = ref_obj.matrix_world.to_quaternion()
+        for data in datas:
+            if data.users == 0:
+                bpy.data.meshes.remove(data)
+    else:
+        for mesh, (uv_layers_count, color_attribute_names) in bake_layers.items():
+            while len(mesh.data.uv_layers) > uv_layers_count:
+                mesh.data.uv_layers.remove(mesh.data.uv_layers[-1])
 
-                axis_to_bake = get_bake_axis(quat, settings.axis_component, signed_axis, True)
+            for color_attribute in [color_attribute for color_attribute in mesh.data.color_attributes if color_attribute.name not in color_attribute_names]:
+                mesh.data.color_attributes.remove(color_attribute)
 
-                # round position & pack axis in fractional part
-                loc_to_bake.x = math.floor(loc_to_bake.x) + axis_to_bake.x
-                loc_to_bake.y = math.floor(loc_to_bake.y) + axis_to_bake.y
-                loc_to_bake.z = math.floor(loc_to_bake.z) + axis_to_bake.z
+    for obj in context.view_layer.objects:
+        obj.select_set(obj in objs_to_bake)
+    context.view_layer.objects.active = active_object
 
-            # X POSITION
-            if settings.position_x:
-                data_to_bake = loc_to_bake.x
+def bake_data(obj, bake_data, bake_mode, uv_index, uv_channel, uv_name, rgba, invert_v = True):
+    """
+    Writes data to a specific UVMap at a specific channel of a given object, or to its color attribute at a specific color channel.
+    Data is either a single value broadcast to every loop, or an array holding one value per loop (indexed by loop index).
+    While a bake is running, data is written into staging buffers which are committed once by flush_bake_buffers. Otherwise, it is committed right away.
+    """
 
-                if settings.position_x_mode == "VCOL":
-                    data_to_bake = data_to_bake * packing_divisor
-                    data_to_bake = (data_to_bake + 1) * 0.5
+    if uv_index < 0 or uv_index > 7:
+        return False
 
-                bake_data(mesh, data_to_bake, settings.position_x_mode, settings.position_x_uv_index, settings.position_x_uv_channel, settings.uvmap_name, settings.position_x_rgba, settings.invert_v)
+    count_bake("bake_data_calls")
+    if bake_mode == "UV" or bake_mode == "VCOL":
+        count_bake("loops", len(obj.data.loops))
 
-            # Y POSITION
-            if settings.position_y:
-                data_to_bake = loc_to_bake.y
+    staged = bake_buffers is not None
+    buffers = bake_buffers if staged else {}
 
-                if settings.position_y_mode == "VCOL":
-                    data_to_bake = data_to_bake * packing_divisor
-                    data_to_bake = (data_to_bake + 1) * 0.5
+    if bake_mode == "UV":
+        uvs = get_bake_buffer(buffers, obj, ("UV", uv_index), lambda: read_uv_buffer(obj, uv_index, invert_v))
+        write_bake_channel(uvs, bake_data, bake_mode, uv_channel, rgba, invert_v)
+    elif rgba == "R" or rgba == "G" or rgba == "B" or rgba == "A" or rgba == "RGB" or rgba == "RG":
+        cols = get_bake_buffer(buffers, obj, ("VCOL",), lambda: read_vcol_buffer(obj))
+        write_bake_channel(cols, bake_data, bake_mode, uv_channel, rgba, invert_v)
+    elif bake_mode == "NORMALS":
+        buffers.setdefault(obj, {})[("NORMALS",)] = np.asarray(bake_data, dtype=np.float32)[0:3]
 
-                bake_data(mesh, data_to_bake, settings.position_y_mode, settings.position_y_uv_index, settings.position_y_uv_channel, settings.uvmap_name, settings.position_y_rgba, settings.invert_v)
+    if not staged:
+        commit_bake_buffers(obj, buffers[obj], uv_name, invert_v)
+        
+    return True
 
-            # Z POSITION
-            if settings.position_z:
-                data_to_bake = loc_to_bake.z
+def bake_data_per_mesh(meshes, bake_data_per_mesh, bake_mode, uv_index, uv_channel, uv_name, rgba, invert_v = True):
+    """
+    Writes one value per mesh to a specific UVMap channel or color channel of every mesh, like bake_data. While a bake is running,
+    the staging buffers of the meshes are backed by a single array so the channel is written once for all of them.
+    """
 
-                if settings.position_z_mode == "VCOL":
-                    data_to_bake = data_to_bake * packing_divisor
-                    data_to_bake = (data_to_bake + 1) * 0.5
+    if uv_index < 0 or uv_index > 7 or bake_mode == "NORMALS":
+        return False
+
+    if bake_buffers is None:
+        for mesh_index, mesh in enumerate(meshes):
+            bake_data(mesh, float(bake_data_per_mesh[mesh_index]), bake_mode, uv_index, uv_channel, uv_name, rgba, invert_v)
+        return True
+
+    loop_counts = np.array([len(mesh.data.loops) for mesh in meshes], dtype=np.int64)
+    count_bake("bake_data_calls")
+    count_bake("loops", int(loop_counts.sum()))
+
+    if bake_mode == "UV":
+        block = get_bake_buffers_block(meshes, loop_counts, ("UV", uv_index), lambda mesh: read_uv_buffer(mesh, uv_index, invert_v))
+    else:
+        block = get_bake_buffers_block(meshes, loop_counts, ("VCOL",), read_vcol_buffer)
+
+    write_bake_channel(block, np.repeat(np.asarray(bake_data_per_mesh, dtype=np.float64), loop_counts), bake_mode, uv_channel, rgba, invert_v)
+
+    return True
+
+def get_bake_buffers_block(meshes, loop_counts, key, builder):
+    """ Concatenate the staging buffers of meshes into one array and make each buffer a view of it, so writing the array writes every buffer """
+    block = np.concatenate([get_bake_buffer(bake_buffers, mesh, key, lambda: builder(mesh)) for mesh in meshes]) if meshes else np.zeros((0, 2 if key[0] == "UV" else 4), dtype=np.float32)
 
-                bake_data(mesh, data_to_bake, settings.position_z_mode, settings.position_z_uv_index, settings.position_z_uv_channel, settings.uvmap_name, settings.position_z_rgba, settings.invert_v)
-        # PACKED
+    loop_ends = np.cumsum(loop_counts)
+    for mesh, loop_start, loop_end in zip(meshes, loop_ends - loop_counts, loop_ends):
+        bake_buffers[mesh][key] = block[loop_start:loop_end]
+
+    return block
+
+def write_bake_channel(buffer, bake_data, bake_mode, uv_channel, rgba, invert_v):
+    """ Write data to a channel of a (loops, 2) UV or (loops, 4) color staging buffer, preserving the other channels """
+    if bake_mode == "UV":
+        # only set data on the specified UV channel (U or V) and preserve the other data
+        if (uv_channel == "U"):
+            buffer[:, 0] = bake_data
         else:
-            remapped_loc = mathutils.Vector((
-                max(min(loc_to_bake.x * packing_divisor, 1.0), -1.0),
-                max(min(loc_to_bake.y * packing_divisor, 1.0), -1.0),
-                max(min(loc_to_bake.z * packing_divisor, 1.0), -1.0))
-                )
+            # need to flip UV's Y axis for Unreal!
+            buffer[:, 1] = (1.0 - np.asarray(bake_data, dtype=np.float64)) if invert_v else bake_data
+    # only set data on the specified rgba channel and preserve data on other channels
+    elif rgba == "R":
+        buffer[:, 0] = bake_data
+    elif rgba == "G":
+        buffer[:, 1] = bake_data
+    elif rgba == "B":
+        buffer[:, 2] = bake_data
+    elif rgba == "A":
+        buffer[:, 3] = bake_data
+    elif rgba == "RGB":
+        buffer[:, 0:3] = np.asarray(bake_data, dtype=np.float64)[..., 0:3]
+    elif rgba == "RG":
+        buffer[:, 0:2] = np.asarray(bake_data, dtype=np.float64)[..., 0:2]
 
-            normalized_loc = (remapped_loc + XYZUNITVECTOR) * 0.5
+###############
+### PLANNER ###
+def get_bake_channel_map(context):
+    """
+    Derive the complete channel map of the bake from get_bake_info, before anything is baked, and reject conflicting outputs.
 
-            data_to_bake = 0.0
-            # X/Y or X/Z or Y/Z POSITION
-            if settings.position_channel_mode == "AB_PACKED":
-                data_to_bake = get_packed_ab_vector(normalized_loc, settings.position_ab_packed_a_comp, settings.position_ab_packed_b_comp)
-            # XYZ POSITION
-            elif settings.position_channel_mode == "XYZ_PACKED":
-                data_to_bake = get_packed_xyz_vector(normalized_loc)
+    :param context: Blender current execution context
+    :return: success, message, sorted UVMap indices, vertex color channels, normals written?
+    :rtype: tuple
+    """
+    info_uv, info_vcol, info_normal = get_bake_info(context)
+
+    uv_channels = {}
+    for ID, uv_index, uv_channel, is_packed, is_32_bits, has_multiplier, channel_mode in info_uv:
+        if uv_index < 0 or uv_index > 7:
+            return (False, "%s is baked to UVMap %d, only UVMaps 0 to 7 exist" % (ID, uv_index), None, None, False)
+
+        if (uv_index, uv_channel) in uv_channels:
+            return (False, "%s and %s are both baked to UVMap %d channel %s" % (uv_channels[(uv_index, uv_channel)], ID, uv_index, uv_channel), None, None, False)
+        uv_channels[(uv_index, uv_channel)] = ID
+
+    vcol_channels = {}
+    for ID, rgba, has_multiplier in info_vcol:
+        for rgba_channel in rgba:
+            if rgba_channel in vcol_channels:
+                return (False, "%s and %s are both baked to vertex color channel %s" % (vcol_channels[rgba_channel], ID, rgba_channel), None, None, False)
+            vcol_channels[rgba_channel] = ID
+
+    uv_indices = sorted(set(uv_index for uv_index, uv_channel in uv_channels))
+
+    return (True, "", uv_indices, sorted(vcol_channels), len(info_normal) > 0)
+
+def check_bake_uvmap_count(objs, uv_indices, uv_name, merge):
+    """
+    Project the UVMaps every mesh will end up with, and the merged mesh if any, and reject the bake if any goes over the maximum of 8.
+    Baked UVMaps are renamed by commit_bake_buffers and UVMaps are matched by name when merging.
+
+    :return: success, message
+    :rtype: tuple
+    """
+    uv_name = uv_name if uv_name != "" else "UVMap.BakedData"
+
+    merged_uvmaps = set()
+    for obj in objs:
+        if obj.type != "MESH":
+            continue
+
+        obj_uvmaps = [uvlayer.name for uvlayer in obj.data.uv_layers]
+        for uv_index in uv_indices:
+            if uv_index < len(obj_uvmaps):
+                obj_uvmaps[uv_index] = uv_name + "." + str(uv_index)
+            else:
+                obj_uvmaps.extend(uv_name + "." + str(new_index) for new_index in range(len(obj_uvmaps), uv_index + 1))
+
+        if len(obj_uvmaps) > 8:
+            return (False, obj.name + " would need more than the maximum amount of uvmaps")
+
+        merged_uvmaps.update(obj_uvmaps)
+
+    if merge and len(merged_uvmaps) > 8:
+        return (False, "Joined mesh is projected to have more than the maximum amount of uvmaps (%d)" % len(merged_uvmaps))
+
+    return (True, "")
+
+def prepare_bake_layers(meshes, uv_indices, vcol, uv_name, invert_v):
+    """
+    Create & initialize every layer the bake needs on every mesh up front, with a single foreach_set per layer, so bake_data never has to create any.
+    Must be called once staging started, see begin_bake_buffers.
+    """
+    uv_name = uv_name if uv_name != "" else "UVMap.BakedData"
+    uv_count = (uv_indices[-1] + 1) if uv_indices else 0
+
+    zero_uvs = {} # per loop count
+    for mesh in meshes:
+        loop_count = len(mesh.data.loops)
+
+        for uv_index in range(len(mesh.data.uv_layers), uv_count):
+            uvmap = mesh.data.uv_layers.new(name=uv_name + "." + str(uv_index), do_init=False) # zeroed
+            count_bake("uv_layers")
+
+            if invert_v:
+                if loop_count not in zero_uvs:
+                    zero_uvs[loop_count] = np.tile(np.array((0.0, 1.0), dtype=np.float32), loop_count)
+                uvmap.data.foreach_set("uv", zero_uvs[loop_count])
+
+        if vcol and get_color_attribute(mesh, bake_color_attribute[0]) is None:
+            write_vcol_buffer(mesh, np.zeros((loop_count, 4), dtype=np.float32))
+
+###############
+### BUFFERS ###
+
+# per-mesh staging buffers filled during a bake: { mesh : { ("UV", uv_index) | ("VCOL",) | ("NORMALS",) : array } }
+bake_buffers = None
+
+# color attribute receiving vertex color data: name (active one if empty), domain, type
+DEFAULT_COLOR_ATTRIBUTE = ("", "CORNER", "BYTE_COLOR")
+bake_color_attribute = DEFAULT_COLOR_ATTRIBUTE
+
+def get_bake_color_attribute(context):
+    """
+    Return the color attribute vertex color data is baked to. In automatic mode, data is stored per point unless a feature baked to vertex color varies per face corner.
+    The domain & type only apply to new color attributes, existing ones are baked into as they are.
+
+    :param context: Blender current execution context
+    :return: name (active color attribute if empty), domain, type
+    :rtype: tuple
+    """
+    settings = context.scene.DataBakerSettings
+
+    domain = settings.color_attribute_domain
+    if domain == "AUTO":
+        domain = "CORNER" if settings.random_per_poly and settings.random_per_poly_mode == "VCOL" else "POINT"
+
+    return (settings.color_attribute_name, domain, settings.color_attribute_type)
+
+def check_bake_color_attribute(context, objs):
+    """
+    Refuse to bake per face corner data into an existing per point color attribute: it would only keep one value per vertex, and converting it would lose the user's colors.
+
+    :param context: Blender current execution context
+    :param objs: objects to bake
+    :return: success, message
+    :rtype: tuple
+    """
+    settings = context.scene.DataBakerSettings
+    if not (settings.random_per_poly and settings.random_per_poly_mode == "VCOL"):
+        return (True, "")
+
+    name = get_bake_color_attribute(context)[0]
+    for obj in objs:
+        if obj.type != "MESH":
+            continue
+
+        color_attribute = get_color_attribute(obj, name)
+        if color_attribute and color_attribute.domain == "POINT":
+            return (False, "Random per poly needs a Face Corner color attribute, '%s' of %s is per point" % (color_attribute.name, obj.name))
+
+    return (True, "")
+
+def begin_bake_buffers(color_attribute = DEFAULT_COLOR_ATTRIBUTE):
+    """ Start collecting bake_data writes into staging buffers, see get_bake_color_attribute """
+    global bake_buffers
+    global bake_color_attribute
+    bake_buffers = {}
+    bake_color_attribute = color_attribute
+
+def flush_bake_buffers(uv_name, invert_v, meshes = None):
+    """ Commit the staged buffers of meshes, every mesh by default, once per layer. Staging stops once every buffer was committed """
+    global bake_buffers
+    global bake_color_attribute
+
+    if bake_buffers is None:
+        return
+
+    objs = list(bake_buffers) if meshes is None else [mesh for mesh in meshes if mesh in bake_buffers]
+    for obj in objs:
+        commit_bake_buffers(obj, bake_buffers.pop(obj), uv_name, invert_v)
+
+    if not bake_buffers:
+        bake_buffers = None
+        bake_color_attribute = DEFAULT_COLOR_ATTRIBUTE
+
+def discard_bake_buffers():
+    """ Stop staging and drop any pending write """
+    global bake_buffers
+    global bake_color_attribute
+    bake_buffers = None
+    bake_color_attribute = DEFAULT_COLOR_ATTRIBUTE
+
+def get_bake_buffer(buffers, obj, key, builder):
+    """ Return the staging buffer of a mesh layer, building it on first access """
+    obj_buffers = buffers.setdefault(obj, {})
+    if key not in obj_buffers:
+        obj_buffers[key] = builder()
+    return obj_buffers[key]
+
+def read_uv_buffer(obj, uv_index, invert_v):
+    """ Read a UVMap into a (loops, 2) array, or return a zeroed buffer if the UVMap doesn't exist yet """
+    loop_count = len(obj.data.loops)
+
+    if uv_index < len(obj.data.uv_layers):
+        uvs = np.empty(loop_count * 2, dtype=np.float32)
+        obj.data.uv_layers[uv_index].data.foreach_get("uv", uvs)
+        return uvs.reshape(-1, 2)
+
+    return np.tile(np.array((0.0, 1.0 if invert_v else 0.0), dtype=np.float32), (loop_count, 1))
+
+def get_color_attribute(obj, name):
+    """ Return the named color attribute of a mesh object, or its active one if name is empty """
+    color_attributes = obj.data.color_attributes
+    return color_attributes.get(name) if name != "" else color_attributes.active_color
+
+def get_color_attribute_prop(data_type):
+    """ Byte colors are stored in sRGB, read & write them as is like legacy vertex colors """
+    return "color_srgb" if data_type == "BYTE_COLOR" else "color"
+
+def read_vcol_buffer(obj):
+    """ Read the bake color attribute into a (loops, 4) array, or return a zeroed buffer if there's none yet """
+    loop_count = len(obj.data.loops)
+
+    color_attribute = get_color_attribute(obj, bake_color_attribute[0])
+    if color_attribute and (color_attribute.domain == "POINT" or color_attribute.domain == "CORNER"):
+        cols = np.empty(len(color_attribute.data) * 4, dtype=np.float32)
+        color_attribute.data.foreach_get(get_color_attribute_prop(color_attribute.data_type), cols)
+        cols = cols.reshape(-1, 4)
+
+        # expand point colors to loops
+        if color_attribute.domain == "POINT":
+            cols = cols[get_mesh_topology(obj)[0]]
+        return cols
+
+    return np.zeros((loop_count, 4), dtype=np.float32)
+
+def write_vcol_buffer(obj, cols):
+    """ Write a (loops, 4) array to the bake color attribute, creating it with the bake domain & type if needed. An existing attribute keeps its domain & type """
+    name, domain, data_type = bake_color_attribute
+    color_attributes = obj.data.color_attributes
+
+    color_attribute = get_color_attribute(obj, name)
+    if color_attribute is None:
+        color_attribute = color_attributes.new(name=name if name != "" else "Color", type=data_type, domain=domain)
+        color_attributes.active_color = color_attribute
+
+    # per-vertex data is the same for every loop of a vertex, see check_bake_color_attribute
+    if color_attribute.domain == "POINT":
+        point_cols = np.zeros((len(obj.data.vertices), 4), dtype=np.float32)
+        point_cols[get_mesh_topology(obj)[0]] = cols
+        cols = point_cols
+
+    color_attribute.data.foreach_set(get_color_attribute_prop(color_attribute.data_type), cols.ravel())
+
+def commit_bake_buffers(obj, obj_buffers, uv_name, invert_v):
+    """ Write the staging buffers of a mesh to its UVMaps, vertex color & normals with a single foreach_set per layer """
+    loop_count = len(obj.data.loops)
+    uv_name = uv_name if uv_name != "" else "UVMap.BakedData"
+
+    uv_indices = sorted(key[1] for key in obj_buffers if key[0] == "UV")
+    for uv_index in uv_indices:
+        # create & zero uvmap(s) if needed
+        while (uv_index > (len(obj.data.uv_layers) - 1)):
+            uvmap = obj.data.uv_layers.new()
+            count_bake("uv_layers")
+            if (len(obj.data.uv_layers) - 1) not in uv_indices:
+                uvmap.data.foreach_set("uv", np.tile(np.array((0.0, 1.0 if invert_v else 0.0), dtype=np.float32), loop_count))
+
+        uvmap = obj.data.uv_layers[uv_index]
+        uvmap.name = uv_name + "." + str(uv_index)
+        uvmap.data.foreach_set("uv", obj_buffers[("UV", uv_index)].ravel())
+
+    if ("VCOL",) in obj_buffers:
+        write_vcol_buffer(obj, obj_buffers[("VCOL",)])
+
+    if ("NORMALS",) in obj_buffers:
+        #obj.data.use_auto_smooth = True # @DEPRECATED in 4.1, used to be required to use custom normals
+
+        obj.data.polygons.foreach_set("use_smooth", np.ones(len(obj.data.polygons), dtype=bool))
+
+        # create and assign normal buffer
+        normals = np.tile(obj_buffers[("NORMALS",)], (len(obj.data.vertices), 1))
+
+        obj.data.normals_split_custom_set_from_vertices(normals)
+
+#############
+### CACHE ###
+
+# per-bake cache of data derived from meshes (topology...), shared by all bake functions. None outside of a bake
+bake_cache = None
+
+def begin_bake_cache():
+    """ Start caching mesh derived data for the duration of a bake """
+    global bake_cache
+    bake_cache = {}
+
+def end_bake_cache():
+    """ Drop all cached data """
+    global bake_cache
+    bake_cache = None
+
+def get_bake_cache(key, builder):
+    """ Return the cached value for the given key, building it on first access. Values are built every time outside of a bake """
+    if bake_cache is None:
+        return builder()
+
+    if key not in bake_cache:
+        bake_cache[key] = builder()
+    return bake_cache[key]
+
+def get_mesh_topology(obj):
+    """
+    Return the topology of a mesh object, read once per bake.
+
+    :param obj: mesh object
+    :return: loop to vertex indices, polygon first loop indices, polygon loop counts
+    :rtype: tuple
+    """
+    return get_bake_cache(("TOPOLOGY", obj.data), lambda: read_mesh_topology(obj.data))
+
+def read_mesh_topology(mesh):
+    """ """
+    loop_vertices = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vertices)
+
+    loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    return (loop_vertices, loop_starts, loop_totals)
+
+def get_world_coords(obj):
+    """
+    Return the world space coordinates of a mesh object's vertices, transformed once per bake.
+
+    :param obj: mesh object
+    :return: (vertex count, 3) array
+    :rtype: numpy.ndarray
+    """
+    return get_bake_cache(("WORLD_COORDS", obj), lambda: read_world_coords(obj))
+
+def read_world_coords(obj):
+    """ """
+    coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+    obj.data.vertices.foreach_get("co", coords)
+    coords = coords.reshape(-1, 3).astype(np.float64)
+
+    matrix = np.array(obj.matrix_world)
+    return (coords @ matrix[:3, :3].T) + matrix[:3, 3]
+
+def has_shapekey_offset(obj, settings):
+    """ """
+    return obj.type == "MESH" and obj.data.shape_keys and (settings.shapekey_name in obj.data.shape_keys.key_blocks) and (settings.shapekey_rest_name in obj.data.shape_keys.key_blocks)
+
+def get_shapekey_offsets(obj, shapekey_name, shapekey_rest_name):
+    """
+    Return the offsets between two shapekeys, computed once per bake and shared by the multiplier computation and the offset bake.
+
+    :param obj: mesh object
+    :param shapekey_name: name of the shapekey
+    :param shapekey_rest_name: name of the rest shapekey
+    :return: (vertex count, 3) offsets array, largest absolute offset component of the vertices referenced by loops
+    :rtype: tuple
+    """
+    return get_bake_cache(("SHAPEKEY_OFFSETS", obj.data, shapekey_name, shapekey_rest_name), lambda: compute_shapekey_offsets(obj, shapekey_name, shapekey_rest_name))
+
+def compute_shapekey_offsets(obj, shapekey_name, shapekey_rest_name):
+    """ """
+    offsets = get_shapekey_coords(obj, shapekey_name) - get_shapekey_coords(obj, shapekey_rest_name)
+
+    # only vertices referenced by loops are baked
+    loop_vertices, loop_starts, loop_totals = get_mesh_topology(obj)
+    largest_component = float(np.abs(offsets[loop_vertices]).max()) if len(loop_vertices) > 0 else 0.0
+
+    return (offsets, largest_component)
+
+def get_shapekey_coords(obj, shapekey_name):
+    """
+    Return the coordinates of a shapekey, read once per bake.
+
+    :param obj: mesh object
+    :param shapekey_name: name of the shapekey
+    :return: (vertex count, 3) array
+    :rtype: numpy.ndarray
+    """
+    return get_bake_cache(("SHAPEKEY", obj.data, shapekey_name), lambda: read_shapekey_coords(obj.data.shape_keys.key_blocks[shapekey_name]))
+
+def read_shapekey_coords(shapekey):
+    """ """
+    coords = np.empty(len(shapekey.data) * 3, dtype=np.float32)
+    shapekey.data.foreach_get("co", coords)
+
+    return coords.reshape(-1, 3)
+
+def get_shapekey_normals(context, obj, shapekey_name, isolate = False):
+    """
+    Return the vertex normals of a mesh deformed by a shapekey, computed once per bake.
+
+    :param context: Blender current execution context
+    :param obj: mesh object
+    :param shapekey_name: name of the shapekey
+    :param isolate: mute every other shapekey while reading evaluated normals
+    :return: (vertex count, 3) array
+    :rtype: numpy.ndarray
+    """
+    settings = context.scene.DataBakerSettings
+
+    if settings.shapekey_normal_source == "COMPUTED":
+        return get_bake_cache(("SHAPEKEY_NORMALS", obj.data, shapekey_name), lambda: compute_shapekey_normals(obj, shapekey_name))
+
+    return get_bake_cache(("SHAPEKEY_NORMALS_EVALUATED", obj.data, shapekey_name, isolate), lambda: read_evaluated_shapekey_normals(context, obj, shapekey_name, isolate))
+
+def read_evaluated_shapekey_normals(context, obj, shapekey_name, isolate):
+    """ Enable the shapekey, evaluate the object and read its vertex normals back """
+
+    initial_shape_keys = []
+    for shape_key in obj.data.shape_keys.key_blocks:
+        initial_shape_keys.append((shape_key.name, shape_key.value)) # cache shapekeys
+        if shape_key.name == shapekey_name:
+            shape_key.value = 1.0
+        elif isolate:
+            shape_key.value = 0.0
+
+    # create converted mesh to read normals
+    dgraph = context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(dgraph)
+    mesh_eval = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=dgraph)
+
+    normals = np.empty(len(mesh_eval.vertices) * 3, dtype=np.float32)
+    mesh_eval.vertices.foreach_get("normal", normals)
+
+    # clear converted mesh
+    obj_eval.to_mesh_clear()
+
+    for shape_key_name, shape_key_value in initial_shape_keys:
+        obj.data.shape_keys.key_blocks[shape_key_name].value = shape_key_value # restore shapekeys
+
+    return normals.reshape(-1, 3)
+
+def compute_shapekey_normals(obj, shapekey_name):
+    """ Area weighted vertex normals computed from the shapekey coordinates. Modifiers are ignored and the depsgraph isn't touched """
+
+    coords = get_shapekey_coords(obj, shapekey_name).astype(np.float64)
+    loop_vertices, loop_starts, loop_totals = get_mesh_topology(obj)
+
+    # index of every polygon corner and of the next corner along the polygon
+    polygon_indices = np.repeat(np.arange(len(loop_totals)), loop_totals)
+    corner_indices = np.arange(len(polygon_indices)) - np.repeat(np.cumsum(loop_totals) - loop_totals, loop_totals)
+    corner_starts = np.repeat(loop_starts, loop_totals)
+    corner_totals = np.repeat(loop_totals, loop_totals)
+
+    corner_vertices = loop_vertices[corner_starts + corner_indices]
+    next_corner_vertices = loop_vertices[corner_starts + (corner_indices + 1) % corner_totals]
+
+    # newell's method, the length of each face normal is twice the polygon area
+    face_normals = np.zeros((len(loop_totals), 3))
+    np.add.at(face_normals, polygon_indices, np.cross(coords[corner_vertices], coords[next_corner_vertices]))
+
+    vertex_normals = np.zeros((len(coords), 3))
+    np.add.at(vertex_normals, corner_vertices, face_normals[polygon_indices])
+
+    lengths = np.linalg.norm(vertex_normals, axis=1)
+    valid = lengths > 0.0
+    vertex_normals[valid] /= lengths[valid, np.newaxis]
+
+    return vertex_normals.astype(np.float32)
+
+###################
+### INCREMENTAL ###
+
+# settings that only affect what happens to the baked meshes, not the baked data itself
+INCREMENTAL_IGNORED_SETTINGS = {
+    "rna_type",
+    "name",
+    "incremental_bake",
+    "duplicate_mesh",
+    "make_single_user",
+    "merge_mesh",
+    "clean_bake",
+    "memory_budget",
+    "mesh_name",
+    "export_mesh",
+    "export_mesh_file_name",
+    "export_mesh_file_path",
+    "export_mesh_file_override",
+    "export_xml",
+    "export_xml_mode",
+    "export_xml_file_name",
+    "export_xml_file_path",
+    "export_xml_override",
+}
+
+# content-addressed layers of the last bake: { content hash : { ("UV", uv_index) | ("VCOL",) | ("NORMALS",) : array } }. Cleared on file load
+baked_layers_store = {}
+
+BAKED_LAYERS_STORE_MAX_SIZE = 512 * 1024 * 1024 # bytes, meshes past it are baked again next time
+
+# content hashes of the meshes being baked: { object pointer : content hash }. Kept off the objects so nothing is written to the user's file
+bake_hashes = {}
+
+def clear_baked_layers():
+    """ Forget the layers & hashes of the previous bake, see Properties.clear_baked_layers_handler """
+    global baked_layers_store
+    global bake_hashes
+    baked_layers_store = {}
+    bake_hashes = {}
+
+def get_incremental_bake_blockers(context):
+    """
+    Return the enabled features whose output depends on the whole selection rather than on each mesh alone. Any of them forces a full bake.
+
+    :param context: Blender current execution context
+    :return: list of feature names
+    :rtype: list
+    """
+    settings = context.scene.DataBakerSettings
+
+    pos_multiplier, parent_pos_multiplier, shapekey_offset_multiplier = get_bake_multiplier_needs(context)
+
+    blockers = []
+    if pos_multiplier:
+        blockers.append("Position multiplier")
+    if parent_pos_multiplier:
+        blockers.append("Parent position multiplier")
+    if shapekey_offset_multiplier:
+        blockers.append("Shapekey offset multiplier")
+    blockers.extend(get_whole_selection_features(context))
+    if settings.random_per_poly:
+        blockers.append("Random per poly")
+
+    return blockers
+
+def get_whole_selection_features(context):
+    """
+    Return the enabled features that read every mesh of the selection while baking one. Their bake stages can't be split into chunks, see iter_bake_stage.
+
+    :param context: Blender current execution context
+    :return: list of feature names
+    :rtype: list
+    """
+    settings = context.scene.DataBakerSettings
+
+    features = []
+    if settings.sphere_mask and settings.sphere_mask_origin_mode != "SELF":
+        features.append("Sphere mask")
+    if settings.linear_mask and settings.linear_mask_obj_mode == "SELECTION":
+        features.append("Linear mask")
+    if settings.random_per_collection:
+        features.append("Random per collection")
+    if settings.random_per_object:
+        features.append("Random per object")
+
+    return features
+
+def update_object_hash(content_hash, obj, memo):
+    """ Hash an object's world matrix and, for meshes, its coordinates. Coordinates are hashed once per object """
+    content_hash.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+
+    if obj.type != "MESH":
+        return
+
+    if obj not in memo:
+        coords = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+        obj.data.vertices.foreach_get("co", coords)
+        memo[obj] = hashlib.sha1(coords.tobytes()).digest()
+    content_hash.update(memo[obj])
+
+def update_parents_hash(content_hash, obj, memo):
+    """ Hash the whole parent chain of an object """
+    parent_obj = obj.parent
+    while parent_obj is not None:
+        content_hash.update(parent_obj.name.encode())
+        update_object_hash(content_hash, parent_obj, memo)
+        parent_obj = parent_obj.parent
+
+def get_bake_settings_hash(context, memo):
+    """ Hash every setting affecting the baked data, including the transforms of the objects they point to """
+    settings = context.scene.DataBakerSettings
+
+    settings_hash = hashlib.sha1()
+    for prop in settings.bl_rna.properties:
+        if prop.identifier in INCREMENTAL_IGNORED_SETTINGS:
+            continue
+
+        value = getattr(settings, prop.identifier)
+        if prop.type == "POINTER":
+            settings_hash.update(repr((prop.identifier, value.name if value else None)).encode())
+            if value:
+                update_object_hash(settings_hash, value, memo)
+                update_parents_hash(settings_hash, value, memo)
+        else:
+            settings_hash.update(repr((prop.identifier, value)).encode())
+
+    return settings_hash.hexdigest()
+
+def get_mesh_content_hash(context, obj, settings_hash, memo):
+    """
+    Hash everything a mesh's baked data depends on: topology, coordinates, existing UVs & colors, relevant shapekeys, world matrix, parent chain and settings.
+
+    :param context: Blender current execution context
+    :param obj: mesh object
+    :param settings_hash: see get_bake_settings_hash
+    :param memo: per-bake dictionary shared by all calls
+    :return: hexadecimal hash
+    :rtype: str
+    """
+    settings = context.scene.DataBakerSettings
+    mesh = obj.data
+
+    content_hash = hashlib.sha1(settings_hash.encode())
+
+    for topology in read_mesh_topology(mesh):
+        content_hash.update(topology.tobytes())
+
+    update_object_hash(content_hash, obj, memo)
+    update_parents_hash(content_hash, obj, memo)
+
+    # layers written by a previous bake hold its own output, they don't invalidate it
+    baked_uv_name = (settings.uvmap_name if settings.uvmap_name != "" else "UVMap.BakedData") + "."
+
+    for uv_layer in mesh.uv_layers:
+        if uv_layer.name.startswith(baked_uv_name):
+            continue
+
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uvs)
+        content_hash.update(uv_layer.name.encode())
+        content_hash.update(uvs.tobytes())
+
+    baked_color_attribute = get_color_attribute(obj, get_bake_color_attribute(context)[0])
+    baked_color_name = baked_color_attribute.name if baked_color_attribute else None
+
+    for color_attribute in mesh.color_attributes:
+        if color_attribute.name == baked_color_name:
+            continue
+
+        cols = np.empty(len(color_attribute.data) * 4, dtype=np.float32)
+        color_attribute.data.foreach_get("color", cols)
+        content_hash.update(repr((color_attribute.name, color_attribute.domain, color_attribute.data_type)).encode())
+        content_hash.update(cols.tobytes())
+
+    if mesh.shape_keys:
+        for shape_key in mesh.shape_keys.key_blocks:
+            content_hash.update(repr((shape_key.name, shape_key.value, shape_key.mute)).encode())
+            if shape_key.name == settings.shapekey_name or shape_key.name == settings.shapekey_rest_name:
+                content_hash.update(read_shapekey_coords(shape_key).tobytes())
+
+    return content_hash.hexdigest()
+
+def hash_bake_selection(context, objs_to_bake):
+    """ Hash every mesh to bake into bake_hashes. Duplicates made by pre_process_bake_selection inherit it, see inherit_bake_hashes """
+    global bake_hashes
+
+    memo = {}
+    settings_hash = get_bake_settings_hash(context, memo)
+
+    bake_hashes = {}
+    for obj in objs_to_bake:
+        if obj.type == "MESH":
+            bake_hashes[obj.as_pointer()] = get_mesh_content_hash(context, obj, settings_hash, memo)
+
+def inherit_bake_hashes(objs, duplicates):
+    """ Give duplicates the content hash of their original """
+    for obj, duplicate in zip(objs, duplicates):
+        content_hash = bake_hashes.get(obj.as_pointer())
+        if content_hash is not None:
+            bake_hashes[duplicate.as_pointer()] = content_hash
+
+def reuse_baked_layers(meshes):
+    """
+    Stage the layers stored by the previous bake for every mesh whose content hash didn't change.
+
+    :param meshes: meshes to bake
+    :return: meshes that still need to be baked
+    :rtype: list
+    """
+    if bake_buffers is None:
+        return meshes
+
+    meshes_to_bake = []
+    for mesh in meshes:
+        stored_layers = baked_layers_store.get(bake_hashes.get(mesh.as_pointer()))
+        if stored_layers is None:
+            meshes_to_bake.append(mesh)
+            continue
+
+        bake_buffers[mesh] = {key: layer.copy() for key, layer in stored_layers.items()}
+
+    return meshes_to_bake
+
+def store_baked_layers(meshes):
+    """ Remember the staged layers of every mesh by content hash, replacing what the previous bake stored, up to BAKED_LAYERS_STORE_MAX_SIZE """
+    global baked_layers_store
+    global bake_hashes
+
+    if bake_buffers is None:
+        return
+
+    store = {}
+    store_size = 0
+    for mesh in meshes:
+        content_hash = bake_hashes.get(mesh.as_pointer())
+        if content_hash is None:
+            continue
+
+        layers = bake_buffers.get(mesh, {})
+        store_size += sum(layer.nbytes for layer in layers.values())
+        if store_size > BAKED_LAYERS_STORE_MAX_SIZE:
+            break
+
+        store[content_hash] = {key: layer.copy() for key, layer in layers.items()}
+
+    baked_layers_store = store
+    bake_hashes = {} # object pointers are only valid during the bake
+
+################
+### ESTIMATE ###
+
+def measure_estimate_calibration(repeat = 3):
+    """
+    Micro-benchmark the operations a bake is made of on a throwaway grid mesh, see Estimate.get_calibration.
+
+    :param repeat: runs per operation, the fastest one is kept
+    :return: seconds per loop to duplicate a mesh, create a UVMap, read the topology, run a bake function & write a layer
+    :rtype: dict
+    """
+    mesh = Estimate.new_calibration_mesh("DataBaker.Calibration")
+    try:
+        loop_count = len(mesh.loops)
+
+        def new_uv_layer():
+            mesh.uv_layers.remove(mesh.uv_layers.new(name="DataBaker.Calibration", do_init=False))
+
+        loop_vertices = read_mesh_topology(mesh)[0]
+        world_coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", world_coords)
+        world_coords = world_coords.reshape(-1, 3).astype(np.float64)
+        matrix = np.identity(3)
+        uvs = np.zeros(loop_count * 2, dtype=np.float32)
+        uv_layer = mesh.uv_layers.new(name="DataBaker.Calibration", do_init=False)
+
+        calibration = {
+            "copy": Estimate.time_operation(lambda: bpy.data.meshes.remove(mesh.copy()), repeat),
+            "uv_layer": Estimate.time_operation(new_uv_layer, repeat),
+            "read": Estimate.time_operation(lambda: read_mesh_topology(mesh), repeat),
+            "kernel": Estimate.time_operation(lambda: get_packed_xyz_vectors(world_coords[loop_vertices] @ matrix), repeat),
+            "write": Estimate.time_operation(lambda: uv_layer.data.foreach_set("uv", uvs), repeat),
+        }
+    finally:
+        bpy.data.meshes.remove(mesh)
+
+    return {name: operation_time / loop_count for name, operation_time in calibration.items()}
+
+def get_mesh_estimate_memory(mesh, uv_layers_count):
+    """ Approximate size in bytes of a mesh's data: positions, edges, faces, corner vertex & edge indices and UVMaps """
+    return len(mesh.vertices) * 12 + len(mesh.edges) * 8 + len(mesh.polygons) * 8 + len(mesh.loops) * (8 + 8 * uv_layers_count)
+
+def get_bake_estimate(context, objs, include_time = True):
+    """
+    Project the workload of baking objects with the current settings, without modifying anything.
+
+    :param context: Blender current execution context
+    :param objs: objects to bake
+    :param include_time: False to skip the time projection and its calibration, the memory projection alone is cheap
+    :return: success, message, estimate (meshes, empties, loops, UV layers to create, projected memory in bytes, projected time in seconds or None)
+    :rtype: tuple
+    """
+    settings = context.scene.DataBakerSettings
+
+    success, msg, uv_indices, vcol_channels, normals = get_bake_channel_map(context)
+    if not success:
+        return (False, msg, None)
+
+    info_uv, info_vcol, info_normal = get_bake_info(context)
+    outputs_count = len(info_uv) + len(info_vcol) + len(info_normal)
+    layers_count = len(uv_indices) + (1 if vcol_channels else 0)
+    uv_count = (uv_indices[-1] + 1) if uv_indices else 0
+
+    meshes = [obj.data for obj in objs if obj.type == "MESH"]
+
+    loops = 0
+    new_uv_layers = 0
+    new_uv_layers_loops = 0
+    meshes_memory = 0
+    for mesh in meshes:
+        loop_count = len(mesh.loops)
+        mesh_new_uv_layers = max(uv_count - len(mesh.uv_layers), 0)
+
+        loops += loop_count
+        new_uv_layers += mesh_new_uv_layers
+        new_uv_layers_loops += mesh_new_uv_layers * loop_count
+        meshes_memory += get_mesh_estimate_memory(mesh, len(mesh.uv_layers) + mesh_new_uv_layers)
+
+    ##########
+    # MEMORY #
+
+    # staging buffers of every mesh live until the flush: (loops, 2) float32 per UVMap, (loops, 4) float32 for vertex colors
+    buffers_memory = loops * (len(uv_indices) * 8 + (16 if vcol_channels else 0))
+    # cached topology & float64 world coordinates
+    cache_memory = sum(len(mesh.loops) * 4 + len(mesh.polygons) * 8 + len(mesh.vertices) * 24 for mesh in meshes)
+
+    memory = buffers_memory + cache_memory + new_uv_layers_loops * 8
+    if settings.duplicate_mesh:
+        memory += meshes_memory
+    if settings.merge_mesh:
+        memory += meshes_memory
+    if settings.incremental_bake:
+        memory += buffers_memory # stored for the next bake
+
+    ########
+    # TIME #
+
+    bake_time = None
+    if include_time:
+        calibration = Estimate.get_calibration("DataBaker", measure_estimate_calibration)
+
+        bake_time = loops * calibration["read"]
+        bake_time += loops * outputs_count * calibration["kernel"]
+        bake_time += loops * layers_count * calibration["write"]
+        bake_time += new_uv_layers_loops * calibration["uv_layer"]
+        if settings.duplicate_mesh:
+            bake_time += loops * calibration["copy"]
+        if settings.merge_mesh:
+            bake_time += loops * calibration["copy"]
+
+    estimate = {
+        "meshes": len(meshes),
+        "empties": sum(1 for obj in objs if obj.type == "EMPTY"),
+        "loops": loops,
+        "uv_layers": new_uv_layers,
+        "memory": memory,
+        "time": bake_time,
+    }
+
+    return (True, "", estimate)
+
+def add_bake_report_estimate(estimate, memory_budget):
+    """
+    Add an estimate to the report, see Estimate.add_report_estimate.
+
+    :param memory_budget: maximum projected memory in megabytes, 0 for no budget
+    :return: is the projected memory over budget?
+    :rtype: bool
+    """
+    add_bake_report("estimate_meshes", estimate["meshes"])
+    add_bake_report("estimate_empties", estimate["empties"])
+    add_bake_report("estimate_loops", estimate["loops"])
+    add_bake_report("estimate_uv_layers", estimate["uv_layers"])
+
+    return Estimate.add_report_estimate(add_bake_report, estimate, memory_budget)
+
+def estimate_bake(context):
+    """
+    Dry run: project the workload of baking the selection into the report, without modifying the scene.
+
+    :param context: Blender current execution context
+    :return: success, message verbose, message
+    :rtype: tuple
+    """
+    settings = context.scene.DataBakerSettings
+    reset_bake_report()
+
+    if context.view_layer.objects.active == None:
+        return (False, 'ERROR', "No active object")
+
+    objs = [obj for obj in context.selected_objects if obj.type == "MESH" or obj.type == "EMPTY"]
+    if not objs:
+        return (False, 'ERROR', "No object selected once filtered out")
+
+    success, msg, estimate = get_bake_estimate(context, objs)
+    if not success:
+        return (False, 'ERROR', msg)
+
+    over_budget = add_bake_report_estimate(estimate, settings.memory_budget)
+
+    msg = "Bake projected to take %0.1fs and use %0.1f MB" % (estimate["time"], estimate["memory"] / (1024.0 * 1024.0))
+    if over_budget:
+        return (True, 'WARNING', msg + ", over the %d MB memory budget" % settings.memory_budget)
+
+    return (True, 'INFO', msg)
+
+######################
+### BAKE FUNCTIONS ###
+def get_bake_functions():
+    """ """
+    return [
+        bake_position,
+        bake_axis,
+        bake_shapekey_offset,
+        bake_shapekey_normal,
+        bake_linear_mask,
+        bake_sphere_mask,
+        bake_random_value_per_collection,
+        bake_random_value_per_object,
+        bake_random_value_per_polygon,
+        bake_parent,
+        bake_fixed_value,
+        bake_direction
+    ]
+
+def bake_position(context, meshes, empties):
+    """ """
+
+    settings = context.scene.DataBakerSettings
+
+    if not settings.position:
+        return False
+
+    signed_axis = np.array((-1.0 if settings.invert_x else 1.0,
+                            -1.0 if settings.invert_y else 1.0,
+                            -1.0 if settings.invert_z else 1.0))
+    signed_scale = signed_axis * settings.scale
+
+    # data might need a 'multiplier' to be normalized and packed/unpacked
+    packing_multiplier = get_position_data_multiplier(context) if get_position_data_needs_multiplier(context) else 1.0
+    packing_divisor = 1.0 / packing_multiplier
+    add_bake_report("position_multiplier", packing_multiplier)
+
+    if not meshes:
+        return True
+
+    # gather all objects transforms at once
+    ref_objs = [settings.transform_obj if settings.transform_obj else mesh for mesh in meshes] # use specified object if any, else use self
+    matrices = get_world_matrices(ref_objs)
+
+    locs = matrices[:, :3, 3] # get objects location and make it relative to specified origin, if any
+    if settings.origin:
+        locs = locs - np.array(settings.origin.matrix_world.to_translation())
+    locs_to_bake = locs * signed_scale
+
+    if settings.position_channel_mode == "INDIVIDUAL":
+        # packing axis is only available if we pack X/Y/Z components individually
+        if settings.axis and settings.axis_channel_mode == "POSITION_PACKED":
+            axes_to_bake = get_bake_axes(matrices, settings.axis_component, signed_axis, True)
+
+            # round position & pack axis in fractional part
+            locs_to_bake = np.floor(locs_to_bake) + axes_to_bake
+
+        # X POSITION
+        x_data = locs_to_bake[:, 0]
+        if settings.position_x_mode == "VCOL":
+            x_data = (x_data * packing_divisor + 1) * 0.5
+
+        # Y POSITION
+        y_data = locs_to_bake[:, 1]
+        if settings.position_y_mode == "VCOL":
+            y_data = (y_data * packing_divisor + 1) * 0.5
+
+        # Z POSITION
+        z_data = locs_to_bake[:, 2]
+        if settings.position_z_mode == "VCOL":
+            z_data = (z_data * packing_divisor + 1) * 0.5
+
+        for mesh_index, mesh in enumerate(meshes):
+            if settings.position_x:
+                bake_data(mesh, x_data[mesh_index], settings.position_x_mode, settings.position_x_uv_index, settings.position_x_uv_channel, settings.uvmap_name, settings.position_x_rgba, settings.invert_v)
+            if settings.position_y:
+                bake_data(mesh, y_data[mesh_index], settings.position_y_mode, settings.position_y_uv_index, settings.position_y_uv_channel, settings.uvmap_name, settings.position_y_rgba, settings.invert_v)
+            if settings.position_z:
+                bake_data(mesh, z_data[mesh_index], settings.position_z_mode, settings.position_z_uv_index, settings.position_z_uv_channel, settings.uvmap_name, settings.position_z_rgba, settings.invert_v)
+    # PACKED
+    else:
+        remapped_locs = np.clip(locs_to_bake * packing_divisor, -1.0, 1.0)
+        normalized_locs = (remapped_locs + 1.0) * 0.5
+
+        packed_data = np.zeros(len(meshes))
+        # X/Y or X/Z or Y/Z POSITION
+        if settings.position_channel_mode == "AB_PACKED":
+            packed_data = get_packed_ab_vectors(normalized_locs, settings.position_ab_packed_a_comp, settings.position_ab_packed_b_comp)
+        # XYZ POSITION
+        elif settings.position_channel_mode == "XYZ_PACKED":
+            packed_data = get_packed_xyz_vectors(normalized_locs)
+
+        if settings.position_pack_only_if_non_null:
+            packed_data[np.linalg.norm(locs_to_bake, axis=1) < 0.01] = 0.0 # @NOTE might be interesting to report in case this behaves unexpectedly?
+
+        for mesh_index, mesh in enumerate(meshes):
+            bake_data(mesh, packed_data[mesh_index], "UV", settings.position_packed_uv_index, settings.position_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v)
+
+    return True   
+
+def bake_axis(context, meshes, empties):
+    """ """
+
+    settings = context.scene.DataBakerSettings
+    
+    if settings.axis == False or settings.axis_channel_mode == "POSITION_PACKED":
+        return False
+    
+    signed_axis = np.array((-1.0 if settings.invert_x else 1.0,
+                            -1.0 if settings.invert_y else 1.0,
+                            -1.0 if settings.invert_z else 1.0))
+
+    if not meshes:
+        return True
+
+    # gather all objects transforms at once
+    ref_objs = [settings.transform_obj if settings.transform_obj else mesh for mesh in meshes]
+    axes_to_bake = get_bake_axes(get_world_matrices(ref_objs), settings.axis_component, signed_axis, False)
+
+    if settings.axis_channel_mode == "INDIVIDUAL":
+        # AXIS X COMPONENT
+        x_data = axes_to_bake[:, 0]
+        if (settings.axis_x_mode == "VCOL"):
+            x_data = (x_data + 1) * 0.5
+
+        # AXIS Y COMPONENT
+        y_data = axes_to_bake[:, 1]
+        if (settings.axis_y_mode == "VCOL"):
+            y_data = (y_data + 1) * 0.5
+
+        # AXIS Z COMPONENT
+        z_data = axes_to_bake[:, 2]
+        if (settings.axis_z_mode == "VCOL"):
+            z_data = (z_data + 1) * 0.5
+
+        for mesh_index, mesh in enumerate(meshes):
+            if settings.axis_x:
+                bake_data(mesh, x_data[mesh_index], settings.axis_x_mode, settings.axis_x_uv_index, settings.axis_x_uv_channel, settings.uvmap_name, settings.axis_x_rgba, settings.invert_v)
+            if settings.axis_y:
+                bake_data(mesh, y_data[mesh_index], settings.axis_y_mode, settings.axis_y_uv_index, settings.axis_y_uv_channel, settings.uvmap_name, settings.axis_y_rgba, settings.invert_v)
+            if settings.axis_z:
+                bake_data(mesh, z_data[mesh_index], settings.axis_z_mode, settings.axis_z_uv_index, settings.axis_z_uv_channel, settings.uvmap_name, settings.axis_z_rgba, settings.invert_v)
+    # PACKED
+    else:
+        remapped_axes = (axes_to_bake + 1.0) * 0.5
+
+        packed_data = np.zeros(len(meshes))
+        # X/Y or X/Z or Y/Z AXIS
+        if settings.axis_channel_mode == "AB_PACKED":
+            packed_data = get_packed_ab_vectors(remapped_axes, settings.axis_ab_packed_a_comp, settings.axis_ab_packed_b_comp)
+        # XYZ AXIS
+        elif settings.axis_channel_mode == "XYZ_PACKED":
+            packed_data = get_packed_xyz_vectors(remapped_axes)
+
+        for mesh_index, mesh in enumerate(meshes):
+            bake_data(mesh, packed_data[mesh_index], "UV", settings.axis_packed_uv_index, settings.axis_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v)
+    return True
+
+def bake_shapekey_offset(context, meshes, empties):
+    """ """
+
+    settings = context.scene.DataBakerSettings
+    
+    if not settings.shapekey_offset:
+        return False
+    
+    signed_axis = np.array((-1.0 if settings.invert_x else 1.0,
+                            -1.0 if settings.invert_y else 1.0,
+                            -1.0 if settings.invert_z else 1.0), dtype=np.float32)
+    signed_scale = signed_axis * np.float32(settings.scale)
+
+    # make sure shapekey exists
+    shapekey_meshes = [mesh for mesh in meshes if has_shapekey_offset(mesh, settings)]
+
+    # data might need a 'multiplier' to be normalized and packed/unpacked. Offsets computed here are cached and encoded below
+    packing_multiplier = get_shapekey_offset_data_multiplier(context, shapekey_meshes) if get_shapekey_offset_data_needs_multiplier(context) else 1.0
+    packing_divisor = 1.0 / packing_multiplier
+    add_bake_report("shapekey_offset_multiplier", packing_multiplier)
 
-            if settings.position_pack_only_if_non_null:
-                if loc_to_bake.length < 0.01:
-                    data_to_bake = 0.0 # @NOTE might be interesting to report in case this behaves unexpectedly?
+    for mesh in shapekey_meshes:
+        # compute data per vertex, then expand it to loops
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
+        offsets, offsets_largest_component = get_shapekey_offsets(mesh, settings.shapekey_name, settings.shapekey_rest_name)
+        offsets = offsets * signed_scale
 
-            bake_data(mesh, data_to_bake, "UV", settings.position_packed_uv_index, settings.position_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v)
+        if settings.shapekey_offset_channel_mode == "INDIVIDUAL":
+            # packing normal is only available if we pack X/Y/Z components individually
+            if settings.shapekey_normal and settings.shapekey_normal_channel_mode == "OFFSET_PACKED":
+                normals = get_shapekey_normals(context, mesh, settings.shapekey_name, isolate = True) * signed_axis
 
-    return True   
+                # @hack prevent float from getting too close to 1 which causes issues with that packing method (fractional part of 1.0 is .0 which is incorrect)
+                fix_precision_issue = 0.025
 
-def bake_axis(context, meshes, empties):
-    """ """
+                xyz_packed_normal_conv_bias = (normals + 1.0) * (0.5 - fix_precision_issue) # remap normal from [-1:1] to [0:1]
 
-    settings = context.scene.DataBakerSettings
-    
-    if settings.axis == False or settings.axis_channel_mode == "POSITION_PACKED":
-        return False
-    
-    signed_axis = mathutils.Vector((-1.0 if settings.invert_x else 1.0,
-                                    -1.0 if settings.invert_y else 1.0,
-                                    -1.0 if settings.invert_z else 1.0))
+                # round offset & pack normal into the fractional part
+                offsets = np.floor(offsets) + xyz_packed_normal_conv_bias
 
-    for mesh in meshes:
-        ref_obj = settings.transform_obj if settings.transform_obj else mesh
-        
-        ref_obj_quat = ref_obj.matrix_world.to_quaternion()
-        
-        axis_to_bake = get_bake_axis(ref_obj_quat, settings.axis_component, signed_axis, False)
+            # X OFFSET
+            if settings.shapekey_offset_x:
+                data_to_bake = offsets[:, 0]
 
-        if settings.axis_channel_mode == "INDIVIDUAL":
-            # AXIS X COMPONENT
-            if settings.axis_x:
-                data_to_bake = axis_to_bake.x
-                
-                if (settings.axis_x_mode == "VCOL"):
+                if settings.shapekey_offset_x_mode == "VCOL":
+                    data_to_bake = data_to_bake * packing_divisor
                     data_to_bake = (data_to_bake + 1) * 0.5
 
-                bake_data(mesh, data_to_bake, settings.axis_x_mode, settings.axis_x_uv_index, settings.axis_x_uv_channel, settings.uvmap_name, settings.axis_x_rgba, settings.invert_v)
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_offset_x_mode, settings.shapekey_offset_x_uv_index, settings.shapekey_offset_x_uv_channel, settings.uvmap_name, settings.shapekey_offset_x_rgba, settings.invert_v)
 
-            # AXIS Y COMPONENT
-            if settings.axis_y:
-                data_to_bake = axis_to_bake.y
+            # Y OFFSET
+            if settings.shapekey_offset_y:
+                data_to_bake = offsets[:, 1]
 
-                if (settings.axis_y_mode == "VCOL"):
+                if settings.shapekey_offset_y_mode == "VCOL":
+                    data_to_bake = data_to_bake * packing_divisor
                     data_to_bake = (data_to_bake + 1) * 0.5
 
-                bake_data(mesh, data_to_bake, settings.axis_y_mode, settings.axis_y_uv_index, settings.axis_y_uv_channel, settings.uvmap_name, settings.axis_y_rgba, settings.invert_v)
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_offset_y_mode, settings.shapekey_offset_y_uv_index, settings.shapekey_offset_y_uv_channel, settings.uvmap_name, settings.shapekey_offset_y_rgba, settings.invert_v)
 
-            # AXIS Z COMPONENT
-            if settings.axis_z:
-                data_to_bake = axis_to_bake.z
+            # Z OFFSET
+            if settings.shapekey_offset_z:
+                data_to_bake = offsets[:, 2]
 
-                if (settings.axis_z_mode == "VCOL"):
+                if settings.shapekey_offset_z_mode == "VCOL":
+                    data_to_bake = data_to_bake * packing_divisor
                     data_to_bake = (data_to_bake + 1) * 0.5
 
-                bake_data(mesh, data_to_bake, settings.axis_z_mode, settings.axis_z_uv_index, settings.axis_z_uv_channel, settings.uvmap_name, settings.axis_z_rgba, settings.invert_v)
-        # PACKED
-        else:
-            RemappedAxis = (axis_to_bake + XYZUNITVECTOR) * 0.5
-            
-            # X/Y or X/Z or Y/Z AXIS
-            if settings.axis_channel_mode == "AB_PACKED":
-                data_to_bake = get_packed_ab_vector(RemappedAxis, settings.axis_ab_packed_a_comp, settings.axis_ab_packed_b_comp)                
-            # XYZ AXIS
-            elif settings.axis_channel_mode == "XYZ_PACKED":
-                data_to_bake = get_packed_xyz_vector(RemappedAxis)
-
-            bake_data(mesh, data_to_bake, "UV", settings.axis_packed_uv_index, settings.axis_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v)
-    return True
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_offset_z_mode, settings.shapekey_offset_z_uv_index, settings.shapekey_offset_z_uv_channel, settings.uvmap_name, settings.shapekey_offset_z_rgba, settings.invert_v)
 
-def bake_shapekey_offset(context, meshes, empties):
-    """ """
+        else:
+            remapped_offsets = np.clip(offsets * packing_divisor, -1.0, 1.0)
+            normalized_offsets = (remapped_offsets + 1.0) * 0.5
 
-    settings = context.scene.DataBakerSettings
-    
-    if not settings.shapekey_offset:
-        return False
-    
-    signed_axis = mathutils.Vector((-1.0 if settings.invert_x else 1.0,
-                                    -1.0 if settings.invert_y else 1.0,
-                                    -1.0 if settings.invert_z else 1.0))
-    signed_scale = signed_axis * settings.scale
+            data_to_bake = np.zeros(len(offsets))
+            # X/Y or X/Z or Y/Z OFFSET
+            if settings.shapekey_offset_channel_mode == "AB_PACKED":
+                data_to_bake = get_packed_ab_vectors(normalized_offsets, settings.shapekey_offset_ab_packed_a_comp, settings.shapekey_offset_ab_packed_b_comp)
+            # XYZ OFFSET
+            elif settings.shapekey_offset_channel_mode == "XYZ_PACKED":
+                data_to_bake = get_packed_xyz_vectors(normalized_offsets)
 
-    # data might need a 'multiplier' to be normalized and packed/unpacked
-    packing_multiplier = get_shapekey_offset_data_multiplier(context) if get_shapekey_offset_data_needs_multiplier(context) else 1.0
-    packing_divisor = 1.0 / packing_multiplier
-    add_bake_report("shapekey_offset_multiplier", packing_multiplier)
+            if settings.shapekey_offset_pack_only_if_non_null:
+                data_to_bake[np.linalg.norm(offsets, axis=1) < 0.01] = 0.0
 
-    for mesh in meshes:
-        # make sure shapekey exists
-        if mesh.data.shape_keys and (settings.shapekey_name in mesh.data.shape_keys.key_blocks) and (settings.shapekey_rest_name in mesh.data.shape_keys.key_blocks):
-            initial_shape_keys = []
-            for shape_key in mesh.data.shape_keys.key_blocks:
-                initial_shape_keys.append((shape_key.name, shape_key.value)) # cache shapekeys
-                if shape_key.name == settings.shapekey_name:
-                    shape_key.value = 1.0
-                else:
-                    shape_key.value = 0.0
-        
-            dgraph = context.evaluated_depsgraph_get()
-            obj_eval = mesh.evaluated_get(dgraph)
-            mesh_eval = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=dgraph)
-            
-            for face in mesh.data.polygons:
-                for loop_id in face.loop_indices:
-                    vertex_index = mesh.data.loops[loop_id].vertex_index
-                    
-                    shapekey_vertex_pos = mesh.data.shape_keys.key_blocks[settings.shapekey_name].data[vertex_index].co
-                    shapekey_rest_vertex_pos = mesh.data.shape_keys.key_blocks[settings.shapekey_rest_name].data[vertex_index].co
-                    
-                    offset = (shapekey_vertex_pos - shapekey_rest_vertex_pos) * signed_scale
-                                    
-                    if settings.shapekey_offset_channel_mode == "INDIVIDUAL":
-                        # packing normal is only available if we pack X/Y/Z components individually
-                        if settings.shapekey_normal and settings.shapekey_normal_channel_mode == "OFFSET_PACKED":
-                            normal = mesh_eval.vertices[vertex_index].normal * signed_axis
-                            
-                            # @hack prevent float from getting too close to 1 which causes issues with that packing method (fractional part of 1.0 is .0 which is incorrect)
-                            fix_precision_issue = 0.025
-
-                            xyz_packed_normal_conv_bias = (normal + XYZUNITVECTOR) * (0.5 - fix_precision_issue) # remap normal from [-1:1] to [0:1]
-
-                            # round offset & pack normal into the fractional part
-                            offset.x = math.floor(offset.x) + xyz_packed_normal_conv_bias.x
-                            offset.y = math.floor(offset.y) + xyz_packed_normal_conv_bias.y
-                            offset.z = math.floor(offset.z) + xyz_packed_normal_conv_bias.z
-                        
-                        # X OFFSET
-                        if settings.shapekey_offset_x:
-                            data_to_bake = offset.x
-                            
-                            if settings.shapekey_offset_x_mode == "VCOL":
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-
-                            bake_data(mesh, data_to_bake, settings.shapekey_offset_x_mode, settings.shapekey_offset_x_uv_index, settings.shapekey_offset_x_uv_channel, settings.uvmap_name, settings.shapekey_offset_x_rgba, settings.invert_v, loop_id)
-                            
-                        # Y OFFSET
-                        if settings.shapekey_offset_y:
-                            data_to_bake = offset.y
-
-                            if settings.shapekey_offset_y_mode == "VCOL":
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-
-                            bake_data(mesh, data_to_bake, settings.shapekey_offset_y_mode, settings.shapekey_offset_y_uv_index, settings.shapekey_offset_y_uv_channel, settings.uvmap_name, settings.shapekey_offset_y_rgba, settings.invert_v, loop_id)
-
-                        # Z OFFSET
-                        if settings.shapekey_offset_z:
-                            data_to_bake = offset.z
-
-                            if settings.shapekey_offset_z_mode == "VCOL":
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-
-                            bake_data(mesh, data_to_bake, settings.shapekey_offset_z_mode, settings.shapekey_offset_z_uv_index, settings.shapekey_offset_z_uv_channel, settings.uvmap_name, settings.shapekey_offset_z_rgba, settings.invert_v, loop_id)
-                    
-                    else:
-                        remapped_offset = mathutils.Vector((
-                                max(min(offset.x * packing_divisor, 1.0), -1.0),
-                                max(min(offset.y * packing_divisor, 1.0), -1.0),
-                                max(min(offset.z * packing_divisor, 1.0), -1.0))
-                            )
-
-                        normalized_offset = (remapped_offset + XYZUNITVECTOR) * 0.5
-                        
-                        data_to_bake = 0.0
-                        # X/Y or X/Z or Y/Z OFFSET
-                        if settings.shapekey_offset_channel_mode == "AB_PACKED":
-                            data_to_bake = get_packed_ab_vector(normalized_offset, settings.shapekey_offset_ab_packed_a_comp, settings.shapekey_offset_ab_packed_b_comp)
-                        # XYZ OFFSET
-                        elif settings.shapekey_offset_channel_mode == "XYZ_PACKED":
-                            data_to_bake = get_packed_xyz_vector(normalized_offset)
-                            
-                        if settings.shapekey_offsetPackOnlyIfNonNull:
-                            if offset.length < 0.01:
-                                data_to_bake = 0.0
-                        
-                        bake_data(mesh, data_to_bake, "UV", settings.shapekey_offset_packed_uv_index, settings.shapekey_offset_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v, loop_id)
-                        
-            # clear converted mesh
-            obj_eval.to_mesh_clear()
-
-            for shape_key_name, shape_key_value in initial_shape_keys:
-                mesh.data.shape_keys.key_blocks[shape_key_name].value = shape_key_value # restore shapekeys
+            bake_data(mesh, data_to_bake[loop_vertices], "UV", settings.shapekey_offset_packed_uv_index, settings.shapekey_offset_packed_uv_channel, settings.uvmap_name, 0, settings.invert_v)
     
     return True
 
@@ -864,82 +2312,62 @@ def bake_shapekey_normal(context, meshes, empties):
     if settings.shapekey_normal == False or settings.shapekey_normal_channel_mode == "OFFSET_PACKED":
         return False
 
-    signed_axis = mathutils.Vector((-1.0 if settings.invert_x else 1.0,
-                                    -1.0 if settings.invert_y else 1.0,
-                                    -1.0 if settings.invert_z else 1.0))
+    signed_axis = np.array((-1.0 if settings.invert_x else 1.0,
+                            -1.0 if settings.invert_y else 1.0,
+                            -1.0 if settings.invert_z else 1.0), dtype=np.float32)
 
     for mesh in meshes:
         # make sure shapekey exists
         if not mesh.data.shape_keys or not (settings.shapekey_name in mesh.data.shape_keys.key_blocks) or not (settings.shapekey_rest_name in mesh.data.shape_keys.key_blocks):
             continue
-        
-        # enable shapekey
-        shapekey_value_to_restore = mesh.data.shape_keys.key_blocks[settings.shapekey_name].value
-        mesh.data.shape_keys.key_blocks[settings.shapekey_name].value = 1
-        
-        # create converted mesh to read normals
-        dgraph = context.evaluated_depsgraph_get()
-        obj_eval = mesh.evaluated_get(dgraph)
-        mesh_eval = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=dgraph)
-        
-        for face in mesh.data.polygons:
-            for loop_id in face.loop_indices:
-                vertex_index = mesh.data.loops[loop_id].vertex_index
 
-                normal = mesh_eval.vertices[vertex_index].normal * signed_axis
+        # compute data per vertex, then expand it to loops
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
+        normals = get_shapekey_normals(context, mesh, settings.shapekey_name) * signed_axis
 
-                if settings.shapekey_normal_channel_mode == "INDIVIDUAL":
-                    # NORMAL X COMPONENT
-                    if settings.shapekey_normal_x:
-                        data_to_bake = normal.x
+        if settings.shapekey_normal_channel_mode == "INDIVIDUAL":
+            # NORMAL X COMPONENT
+            if settings.shapekey_normal_x:
+                data_to_bake = normals[:, 0]
 
-                        if (settings.shapekey_normal_x_mode == "VCOL"):
-                            data_to_bake = (data_to_bake + 1) * 0.5
+                if (settings.shapekey_normal_x_mode == "VCOL"):
+                    data_to_bake = (data_to_bake + 1) * 0.5
 
-                        bake_data(mesh, data_to_bake, settings.shapekey_normal_x_mode, settings.shapekey_normal_x_uv_index, settings.shapekey_normal_x_uv_channel, settings.uvmap_name, settings.shapekey_normal_x_rgba, settings.invert_v, loop_id)
-                    # NORMAL Y COMPONENT
-                    if settings.shapekey_normal_y:
-                        data_to_bake = normal.y
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_normal_x_mode, settings.shapekey_normal_x_uv_index, settings.shapekey_normal_x_uv_channel, settings.uvmap_name, settings.shapekey_normal_x_rgba, settings.invert_v)
+            # NORMAL Y COMPONENT
+            if settings.shapekey_normal_y:
+                data_to_bake = normals[:, 1]
 
-                        if (settings.shapekey_normal_y_mode == "VCOL"):
-                            data_to_bake = (data_to_bake + 1) * 0.5
+                if (settings.shapekey_normal_y_mode == "VCOL"):
+                    data_to_bake = (data_to_bake + 1) * 0.5
 
-                        bake_data(mesh, data_to_bake, settings.shapekey_normal_y_mode, settings.shapekey_normal_y_uv_index, settings.shapekey_normal_y_uv_channel, settings.uvmap_name, settings.shapekey_normal_y_rgba, settings.invert_v, loop_id)
-                    # NORMAL Z COMPONENT
-                    if settings.shapekey_normal_z:
-                        data_to_bake = normal.z
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_normal_y_mode, settings.shapekey_normal_y_uv_index, settings.shapekey_normal_y_uv_channel, settings.uvmap_name, settings.shapekey_normal_y_rgba, settings.invert_v)
+            # NORMAL Z COMPONENT
+            if settings.shapekey_normal_z:
+                data_to_bake = normals[:, 2]
 
-                        if (settings.shapekey_normal_z_mode == "VCOL"):
-                            data_to_bake = (data_to_bake + 1) * 0.5
+                if (settings.shapekey_normal_z_mode == "VCOL"):
+                    data_to_bake = (data_to_bake + 1) * 0.5
+
+                bake_data(mesh, data_to_bake[loop_vertices], settings.shapekey_normal_z_mode, settings.shapekey_normal_z_uv_index, settings.shapekey_normal_z_uv_channel, settings.uvmap_name, settings.shapekey_normal_z_rgba, settings.invert_v)
+        else:
+            clamped_normals = np.clip(normals, -1.0, 1.0)
+
+            # @hack prevent float from getting too close to 1 which seems to cause issues. @NOTE investigate to fix hack
+            fix_precision_issue = 0.025
+
+            remapped_normals = (clamped_normals + 1) * (0.5 - fix_precision_issue)
+
+            data_to_bake = np.zeros(len(normals))
+            # X/Y or X/Z or Y/Z normal
+            if settings.shapekey_normal_channel_mode == "AB_PACKED":
+                data_to_bake = get_packed_ab_vectors(remapped_normals, settings.shapekey_normal_ab_packed_a_comp, settings.shapekey_normal_ab_packed_b_comp)
+            # XYZ
+            elif settings.shapekey_normal_channel_mode == "XYZ_PACKED":
+                data_to_bake = get_packed_xyz_vectors(remapped_normals)
+
+            bake_data(mesh, data_to_bake[loop_vertices], "UV", settings.shapekey_normal_xyz_uv_index, settings.shapekey_normal_xyz_uv_channel, settings.uvmap_name, 0, settings.invert_v)
 
-                        bake_data(mesh, data_to_bake, settings.shapekey_normal_z_mode, settings.shapekey_normal_z_uv_index, settings.shapekey_normal_z_uv_channel, settings.uvmap_name, settings.shapekey_normal_z_rgba, settings.invert_v, loop_id)
-                else:
-                    clamped_normal = mathutils.Vector((
-                        max(min(normal.x, 1.0), -1.0),
-                        max(min(normal.y, 1.0), -1.0),
-                        max(min(normal.z, 1.0), -1.0)))
-                    
-                    # @hack prevent float from getting too close to 1 which seems to cause issues. @NOTE investigate to fix hack
-                    fix_precision_issue = 0.025
-
-                    remapped_normal = mathutils.Vector((
-                        (clamped_normal.x + 1) * (0.5 - fix_precision_issue),
-                        (clamped_normal.y + 1) * (0.5 - fix_precision_issue),
-                        (clamped_normal.z + 1) * (0.5 - fix_precision_issue)))
-                    # X/Y or X/Z or Y/Z normal
-                    if settings.shapekey_normal_channel_mode == "AB_PACKED":
-                        data_to_bake = get_packed_ab_vector(remapped_normal, settings.shapekey_normal_ab_packed_a_comp, settings.shapekey_normal_ab_packed_b_comp)
-                    # XYZ
-                    elif settings.shapekey_normal_channel_mode == "XYZ_PACKED":
-                        data_to_bake = get_packed_xyz_vector(remapped_normal)
-                    
-                    bake_data(mesh, data_to_bake, "UV", settings.shapekey_normal_xyz_uv_index, settings.shapekey_normal_xyz_uv_channel, settings.uvmap_name, 0, settings.invert_v, loop_id)
-                    
-        # clear converted mesh
-        obj_eval.to_mesh_clear()
-        
-        # restore shapekey
-        mesh.data.shape_keys.key_blocks[settings.shapekey_name].value = shapekey_value_to_restore
     return True
 
 def get_sphere_mask_max_dist(meshes, origin):
@@ -947,15 +2375,13 @@ def get_sphere_mask_max_dist(meshes, origin):
 
     vertex_max_dist = 0.0
     for mesh in meshes:
-        for face in mesh.data.polygons:
-            for loop_id in face.loop_indices:
-                vertex_index = mesh.data.loops[loop_id].vertex_index
+        # only vertices referenced by loops are baked
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
+        if len(loop_vertices) == 0:
+            continue
 
-                vertex_pos = mesh.matrix_world @ mesh.data.vertices[vertex_index].co
-                offset = vertex_pos - origin
-                vertex_dist = offset.length
-                if (vertex_dist > vertex_max_dist):
-                    vertex_max_dist = vertex_dist
+        offsets = get_world_coords(mesh)[loop_vertices] - np.array(origin)
+        vertex_max_dist = max(vertex_max_dist, float(np.sqrt((offsets * offsets).sum(axis=1).max())))
 
     return vertex_max_dist
 
@@ -990,50 +2416,93 @@ def bake_sphere_mask(context, meshes, empties):
 
         origin_pos_set = True
 
-    # precompute greatest vertex distance if need to, else we'll do this on per-object basis
+    # precompute greatest vertex distance if need to, else we'll do this once per origin group
     max_dist = get_sphere_mask_max_dist(meshes, origin_pos) if origin_pos_set else 0.0
 
+    # in parent mode, children of the same parent share their greatest vertex distance
+    parent_max_dists = {}
+    if settings.sphere_mask_origin_mode == "PARENT":
+        parent_children = {}
+        for mesh in meshes:
+            if mesh.parent:
+                parent_children.setdefault(mesh.parent, []).append(mesh)
+
+        for parent, children in parent_children.items():
+            parent_max_dists[parent] = get_sphere_mask_max_dist(children, parent.matrix_world.to_translation())
+
     for mesh in meshes:
-        if origin_pos_set:
-            pass
-        else:
-            origin_obj = mesh
-            
+        if not origin_pos_set:
             if settings.sphere_mask_origin_mode == "SELF":
                 origin_pos = mesh.matrix_world.to_translation()
-                
-                origin_objs = [origin_obj]
-                max_dist = get_sphere_mask_max_dist(origin_objs, origin_pos)
+                max_dist = get_sphere_mask_max_dist([mesh], origin_pos)
             elif settings.sphere_mask_origin_mode == "PARENT":
                 if mesh.parent:
-                    origin_obj = mesh.parent
                     origin_pos = mesh.parent.matrix_world.to_translation()
-
-                    origin_objs = []
-                    origin_objs = [child_obj for child_obj in origin_obj.children if child_obj in meshes] # make sure that child is part of our selected meshes
-
-                    max_dist = get_sphere_mask_max_dist(origin_objs, origin_pos)
+                    max_dist = parent_max_dists[mesh.parent]
                 else:
                     continue
-        
-        for face in mesh.data.polygons:
-            for loop_id in face.loop_indices:
-                vertex_index = mesh.data.loops[loop_id].vertex_index
-                vertex_pos = mesh.matrix_world @ mesh.data.vertices[vertex_index].co
-                offset = vertex_pos - origin_pos
-                vertex_dist = offset.length
 
-                if settings.sphere_mask_normalize or settings.sphere_mask_mode == "VCOL":
-                    vertex_dist = math.pow((vertex_dist / max_dist), settings.sphere_mask_falloff)
+        # compute data per vertex, then expand it to loops
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
+        offsets = get_world_coords(mesh) - np.array(origin_pos)
+        mask_data = np.sqrt((offsets * offsets).sum(axis=1))
+
+        if settings.sphere_mask_normalize or settings.sphere_mask_mode == "VCOL":
+            mask_data = np.power(mask_data / max_dist, settings.sphere_mask_falloff) if max_dist > 0.0 else np.zeros(len(mask_data))
 
-                if settings.sphere_mask_clamp or settings.sphere_mask_mode == "VCOL":
-                    vertex_dist = max(min(vertex_dist, 1.0), 0.0)
+        if settings.sphere_mask_clamp or settings.sphere_mask_mode == "VCOL":
+            mask_data = np.clip(mask_data, 0.0, 1.0)
 
-                data_to_bake = vertex_dist
-                bake_data(mesh, data_to_bake, settings.sphere_mask_mode, settings.sphere_mask_uv_index, settings.sphere_mask_uv_channel, settings.uvmap_name, settings.sphere_mask_rgba, settings.invert_v, loop_id)
+        bake_data(mesh, mask_data[loop_vertices], settings.sphere_mask_mode, settings.sphere_mask_uv_index, settings.sphere_mask_uv_channel, settings.uvmap_name, settings.sphere_mask_rgba, settings.invert_v)
     
     return True
 
+def get_linear_mask_axis(obj, axis, local):
+    """ Return the axis to project positions on, rotated by the object's rotation in local mode """
+
+    if not local:
+        return np.array(axis)
+
+    obj_rot = obj.rotation_quaternion if obj.rotation_mode == "QUATERNION" else obj.rotation_euler
+    return np.array(mathutils.Matrix.LocRotScale(None, obj_rot, None) @ axis)
+
+def get_linear_mask_bounds(obj, axis, local):
+    """
+    Return the min & max projections of a reference object on an axis, computed once per bake so that objects sharing a reference reuse them.
+
+    :param obj: reference object, either a mesh (its vertices are projected) or an empty (its origin & tip are projected)
+    :param axis: world axis
+    :param local: project on the object's local axis instead
+    :return: min & max projections or None if the object can't be used as a reference
+    :rtype: tuple
+    """
+    return get_bake_cache(("LINEAR_MASK_BOUNDS", obj, tuple(axis), local), lambda: compute_linear_mask_bounds(obj, axis, local))
+
+def compute_linear_mask_bounds(obj, axis, local):
+    """ """
+
+    projection_axis = get_linear_mask_axis(obj, axis, local)
+
+    if obj.type == "EMPTY":
+        obj_rot = obj.rotation_quaternion if obj.rotation_mode == "QUATERNION" else obj.rotation_euler
+
+        empty_loc = obj.matrix_world.to_translation()
+        empty_tip_offset = mathutils.Matrix.LocRotScale(None, obj_rot, obj.empty_display_size * obj.scale) @ axis
+        empty_tip_loc = empty_loc + empty_tip_offset # compute empty 'tip' location in world space
+
+        projections = np.array((empty_loc, empty_tip_loc)) @ projection_axis
+    elif obj.type == "MESH":
+        # only vertices referenced by loops are baked
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(obj)
+        if len(loop_vertices) == 0:
+            return None
+
+        projections = get_world_coords(obj)[loop_vertices] @ projection_axis
+    else:
+        return None
+
+    return (float(projections.min()), float(projections.max()))
+
 def bake_linear_mask(context, meshes, empties):
     """ """
 
@@ -1045,189 +2514,58 @@ def bake_linear_mask(context, meshes, empties):
     local_mode = (settings.linear_mask_obj_mode == "PARENT_LOCAL") or (settings.linear_mask_obj_mode == "SELF_LOCAL")
     parent_mode = (settings.linear_mask_obj_mode == "PARENT_WORLD") or (settings.linear_mask_obj_mode == "PARENT_LOCAL")
     
-    origin_pos = mathutils.Vector((0.0, 0.0, 0.0))
-    origin_pos_set = False
-
-    axis_min_bound = 0.0
-    axis_min_bound_set = False
-
-    axis_max_bound = 0.0
-    axis_max_bound_set = False
-    
     axis = XYZVECTORS["X"] if settings.linear_mask_axis == "X" else XYZVECTORS["Y"] if settings.linear_mask_axis == "Y" else XYZVECTORS["Z"]
-    
-    if settings.linear_mask_obj_mode == "SELECTION" or settings.linear_mask_obj_mode == "OBJECT":
-        # first we need to loop through all selected mesh objects and find the vertex which has the greatest distance to the specified origin so we can build a normalized [0:1] gradient
-        if settings.linear_mask_obj_mode == "SELECTION":
-            for mesh in meshes:
-                for face in mesh.data.polygons:
-                    for loop_id in face.loop_indices:
-                        vertex_index = obj.data.loops[loop_id].vertex_index
-
-                        vertex_loc = obj.matrix_world @ obj.data.vertices[vertex_index].co
-                        vertex_loc_projected = vertex_loc.dot(axis)
-
-                        if (vertex_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                            axis_min_bound = vertex_loc_projected
-                            axis_min_bound_set = True
-                        
-                        if (vertex_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                            axis_max_bound = vertex_loc_projected
-                            axis_max_bound_set = True
-        elif settings.linear_mask_obj_mode == "OBJECT":
-            if settings.linear_mask_obj is None:
-                return False
 
-            obj = settings.linear_mask_obj
-            obj_rot = obj.rotation_quaternion if obj.rotation_mode == "QUATERNION" else obj.rotation_euler
-            obj_rot_mat = mathutils.Matrix.LocRotScale(None, obj_rot, None)
+    bounds = (0.0, 0.0)
+    projection_axis = np.array(axis)
 
-            if obj.type == "EMPTY":
-                empty_loc = obj.matrix_world.to_translation()
-                local_axis = obj_rot_mat @ axis # transform world axis to object's local space
-                
-                empty_loc_projected = empty_loc.dot(local_axis)
-                
-                if (empty_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                    axis_min_bound = empty_loc_projected
-                    axis_min_bound_set = True
-                
-                if (empty_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                    axis_max_bound = empty_loc_projected
-                    axis_max_bound_set = True
-                
-                empty_tip_offset = local_axis * obj.empty_display_size * obj.scale
-                empty_loc = obj.matrix_world.to_translation() + empty_tip_offset # compute empty 'tip' location in world space
-                empty_loc_projected = empty_loc.dot(local_axis) # project on local axis
-                
-                if (empty_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                    axis_min_bound = empty_loc_projected
-                    axis_min_bound_set = True
-                
-                if (empty_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                    axis_max_bound = empty_loc_projected
-                    axis_max_bound_set = True
-            elif obj.type == "MESH":
-                for face in obj.data.polygons:
-                    for loop_id in face.loop_indices:
-                        vertex_index = obj.data.loops[loop_id].vertex_index
-                        vertex_loc = obj.matrix_world @ obj.data.vertices[vertex_index].co
-                        local_axis = obj_rot_mat @ axis # transform world axis to object's local space
-                        vertex_loc_projected = vertex_loc.dot(local_axis) # project on local axis
-
-                        if (vertex_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                            axis_min_bound = vertex_loc_projected
-                            axis_min_bound_set = True
-                        
-                        if (vertex_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                            axis_max_bound = vertex_loc_projected
-                            axis_max_bound_set = True
-            else:
-                return False
+    # in selection & object modes, bounds are shared by all meshes so that we build a single normalized [0:1] gradient
+    if settings.linear_mask_obj_mode == "SELECTION":
+        meshes_bounds = [mesh_bounds for mesh_bounds in (get_linear_mask_bounds(mesh, axis, False) for mesh in meshes) if mesh_bounds is not None]
+        if meshes_bounds:
+            bounds = (min(mesh_bounds[0] for mesh_bounds in meshes_bounds), max(mesh_bounds[1] for mesh_bounds in meshes_bounds))
+    elif settings.linear_mask_obj_mode == "OBJECT":
+        if settings.linear_mask_obj is None:
+            return False
 
-        origin_pos_set = True
+        bounds = get_linear_mask_bounds(settings.linear_mask_obj, axis, True)
+        if bounds is None:
+            return False
 
-    for mesh in meshes:
-        ref_obj = mesh # assume 'reference' object is self at first
+        projection_axis = get_linear_mask_axis(settings.linear_mask_obj, axis, True)
 
+    for mesh in meshes:
         # self or parent mode
-        if not origin_pos_set:
-            if parent_mode and ref_obj.parent:
-                ref_obj = ref_obj.parent
-            else:
-                continue
-
-            # need to reset these per object
-            axis_min_bound = 0.0
-            axis_min_bound_set = False
+        if settings.linear_mask_obj_mode != "SELECTION" and settings.linear_mask_obj_mode != "OBJECT":
+            ref_obj = mesh # assume 'reference' object is self at first
 
-            axis_max_bound = 0.0
-            axis_max_bound_set = False
+            if parent_mode:
+                if ref_obj.parent:
+                    ref_obj = ref_obj.parent
+                else:
+                    continue
 
-            if ref_obj.type == "EMPTY":
-                empty_loc = ref_obj.matrix_world.to_translation()
-                empty_loc_projected = empty_loc.dot(axis) # project on world axis at first
-                empty_rot_mat = ref_obj.rotation_quaternion if ref_obj.rotation_mode == "QUATERNION" else ref_obj.rotation_euler
-                
-                # unless we're in local space
-                if local_mode:
-                    local_axis = mathutils.Matrix.LocRotScale(None, empty_rot_mat, None) @ axis
-                    empty_loc_projected = empty_loc.dot(local_axis) # project on local axis
-                
-                if (empty_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                    axis_min_bound = empty_loc_projected
-                    axis_min_bound_set = True
-                
-                if (empty_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                    axis_max_bound = empty_loc_projected
-                    axis_max_bound_set = True
-                
-                empty_tip_offset = mathutils.Matrix.LocRotScale(None, empty_rot_mat, ref_obj.empty_display_size * ref_obj.scale) @ axis
-                empty_loc = ref_obj.matrix_world.to_translation() + empty_tip_offset # compute empty 'tip' location in world space
-                empty_loc_projected = empty_loc.dot(axis)  # project on world axis
-                
-                # unless we're in local space
-                if local_mode:
-                    local_axis = mathutils.Matrix.LocRotScale(None, empty_rot_mat, None) @ axis
-                    empty_loc_projected = empty_loc.dot(local_axis) # project on local axis
-                
-                if (empty_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                    axis_min_bound = empty_loc_projected
-                    axis_min_bound_set = True
-                
-                if (empty_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                    axis_max_bound = empty_loc_projected
-                    axis_max_bound_set = True
-            elif ref_obj.type == "MESH":
-                for face in ref_obj.data.polygons:
-                    for loop_id in face.loop_indices:
-                        vertex_index = ref_obj.data.loops[loop_id].vertex_index
-                        vertex_loc = ref_obj.matrix_world @ ref_obj.data.vertices[vertex_index].co
-                        vertex_loc_projected = vertex_loc.dot(axis) # project on world axis at first
-                        
-                        # unless we're in local space
-                        if local_mode:
-                            ref_obj_rot = ref_obj.rotation_quaternion if ref_obj.rotation_mode == "QUATERNION" else ref_obj.rotation_euler
-                            ref_obj_rot_mat = mathutils.Matrix.LocRotScale(None, ref_obj_rot, None)
-                            local_axis = ref_obj_rot_mat @ axis
-                            
-                            vertex_loc_projected = vertex_loc.dot(local_axis) # project on local axis
-
-                        if (vertex_loc_projected < axis_min_bound) or not axis_min_bound_set:
-                            axis_min_bound = vertex_loc_projected
-                            axis_min_bound_set = True
-                        
-                        if (vertex_loc_projected > axis_max_bound) or not axis_max_bound_set:
-                            axis_max_bound = vertex_loc_projected
-                            axis_max_bound_set = True
-            else:
+            bounds = get_linear_mask_bounds(ref_obj, axis, local_mode)
+            if bounds is None:
                 continue
 
-        elif settings.linear_mask_obj_mode == "OBJECT":
-            ref_obj = settings.linear_mask_obj
+            projection_axis = get_linear_mask_axis(ref_obj, axis, local_mode)
 
-        for face in obj.data.polygons:
-            for loop_id in face.loop_indices:
-                vertex_index = obj.data.loops[loop_id].vertex_index
-                vertex_loc = obj.matrix_world @ obj.data.vertices[vertex_index].co
-                vertex_loc_projected = vertex_loc.dot(axis) # project on world axis at first
+        axis_min_bound, axis_max_bound = bounds
 
-                # local mode
-                if local_mode or settings.linear_mask_obj_mode == "OBJECT":
-                    ref_obj_rot = ref_obj.rotation_quaternion if ref_obj.rotation_mode == "QUATERNION" else ref_obj.rotation_euler
-                    ref_obj_rot_mat = mathutils.Matrix.LocRotScale(None, ref_obj_rot, None)
-                    local_axis = ref_obj_rot_mat @ axis
+        # compute data per vertex, then expand it to loops
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
+        mask_data = (get_world_coords(mesh) @ projection_axis) - axis_min_bound
 
-                    vertex_loc_projected = vertex_loc.dot(local_axis) # project on local axis
+        if settings.linear_mask_normalize or settings.linear_mask_mode == "VCOL":
+            axis_range = axis_max_bound - axis_min_bound
+            # vertices outside of the reference bounds would raise negative ratios to a fractional power
+            mask_data = np.power(np.clip(mask_data / axis_range, 0.0, 1.0), settings.linear_mask_falloff) if axis_range > 0.0 else np.zeros(len(mask_data))
 
-                data_to_bake = (vertex_loc_projected - axis_min_bound)
-                if settings.linear_mask_normalize or settings.linear_mask_mode == "VCOL":
-                    data_to_bake = math.pow(data_to_bake / (axis_max_bound - axis_min_bound), settings.linear_mask_falloff)
+        if settings.linear_mask_clamp or settings.linear_mask_mode == "VCOL":
+            mask_data = np.clip(mask_data, 0.0, 1.0)
 
-                if settings.linear_mask_clamp or settings.linear_mask_mode == "VCOL":
-                    data_to_bake = max(min(data_to_bake, 1.0), 0.0)
-
-                bake_data(mesh, data_to_bake, settings.linear_mask_mode, settings.linear_mask_uv_index, settings.linear_mask_uv_channel, settings.uvmap_name, settings.linear_mask_rgba, settings.invert_v, loop_id)
+        bake_data(mesh, mask_data[loop_vertices], settings.linear_mask_mode, settings.linear_mask_uv_index, settings.linear_mask_uv_channel, settings.uvmap_name, settings.linear_mask_rgba, settings.invert_v)
 
     return True
 
@@ -1289,39 +2627,22 @@ def bake_random_value_per_object(context, meshes, empties):
     if not settings.random_per_object:
         return False
     
-    # initiate object ID/uniform value dictionary. Rather than generate a random value per object which may give poor randomization due to hazard, we can choose to output randomized uniform values (if 5 objects, then values would be 0.0, 0,25, 0.5, 0.75, 1.0 in a random order)
-    per_obj_random_uniform_values = []
-    
     mesh_count = len(meshes)
     
-    # offset object index & count if we only have one object so that uniform value is 0.5 (this is an arbitrary choice)
-    obj_index = 1 if mesh_count == 1 else 0
-    obj_count = 2 if mesh_count == 1 else (mesh_count - 1)
-    
-    for mesh in meshes:
-        # build uniform value
-        per_obj_random_uniform_values.append(obj_index / obj_count)
-    
-        obj_index += 1
-    
-    if obj_index == 0:
+    if mesh_count == 0:
         return False
     
-    random.shuffle(per_obj_random_uniform_values)
-    
-    # reset object index
-    obj_index = 0
-    
-    for mesh in meshes:
-        # blend between uniform random and completely random
-        data_to_bake = per_obj_random_uniform_values[obj_index]
-        data_to_bake = (data_to_bake * settings.random_per_object_uniform) + ((1 - settings.random_per_object_uniform) * random.uniform(0,1))
+    # rather than generate a random value per object which may give poor randomization due to hazard, we can choose to output randomized uniform values (if 5 objects, then values would be 0.0, 0,25, 0.5, 0.75, 1.0 in a random order)
+    # offset object index & count if we only have one object so that uniform value is 0.5 (this is an arbitrary choice)
+    per_obj_random_uniform_values = np.random.permutation(np.array((0.5,)) if mesh_count == 1 else np.arange(mesh_count) / (mesh_count - 1))
 
-        bake_data(mesh, data_to_bake, settings.random_per_object_mode, settings.random_per_object_uv_index, settings.random_per_object_uv_channel, settings.uvmap_name, settings.random_per_object_rgba, settings.invert_v)
-        
-        obj_index += 1
+    # blend between uniform random and completely random
+    per_obj_random_values = (per_obj_random_uniform_values * settings.random_per_object_uniform) + ((1 - settings.random_per_object_uniform) * np.random.uniform(0, 1, mesh_count))
+
+    for obj_index, mesh in enumerate(meshes):
+        bake_data(mesh, per_obj_random_values[obj_index], settings.random_per_object_mode, settings.random_per_object_uv_index, settings.random_per_object_uv_channel, settings.uvmap_name, settings.random_per_object_rgba, settings.invert_v)
     
-    return obj_index > 0
+    return True
 
 def bake_random_value_per_polygon(context, meshes, empties):
     """ """
@@ -1330,9 +2651,6 @@ def bake_random_value_per_polygon(context, meshes, empties):
     if not settings.random_per_poly:
         return False
 
-    # initiate vertex ID/uniform value dictionary. Rather than generate a random value per poly which may give poor randomization due to hazard, we can choose to output randomized uniform values (if 5 polys, then values would be 0.0, 0,25, 0.5, 0.75, 1.0 in a random order)
-    per_poly_random_uniform_values = []
-
     poly_count = 0
     # first, gather the total amount of polygons across all selected mesh objects
     for mesh in meshes:
@@ -1341,362 +2659,229 @@ def bake_random_value_per_polygon(context, meshes, empties):
     if poly_count == 0:
         return False
 
-    # offset poly index & count if we only have one poly so that uniform value is 0.5 (this is an arbitrary choice)
-    poly_index = 1 if poly_count == 1 else 0
-    poly_count = 2 if poly_count == 1 else poly_count
-
-    for mesh in meshes:
-        for face in mesh.data.polygons:
-            # build uniform value
-            per_poly_random_uniform_values.append(poly_index / poly_count)
+    rng = np.random.default_rng(settings.random_per_poly_seed)
 
-            # increment poly index
-            poly_index += 1
+    # rather than generate a random value per poly which may give poor randomization due to hazard, we can choose to output randomized uniform values (if 5 polys, then values would be 0.0, 0,25, 0.5, 0.75, 1.0 in a random order)
+    # offset poly index & count if we only have one poly so that uniform value is 0.5 (this is an arbitrary choice)
+    per_poly_random_uniform_values = rng.permutation(np.array((0.5,)) if poly_count == 1 else np.arange(poly_count) / poly_count)
 
-    random.shuffle(per_poly_random_uniform_values)
+    # blend between uniform random and completely random
+    per_poly_random_values = (per_poly_random_uniform_values * settings.random_per_poly_uniform) + ((1 - settings.random_per_poly_uniform) * rng.random(poly_count))
 
-    # reset poly index
     poly_index = 0
 
     for mesh in meshes:
-        for face in mesh.data.polygons:
-            # blend between uniform random and completely random
-            data_to_bake = per_poly_random_uniform_values[poly_index]
-            data_to_bake = (data_to_bake * settings.random_per_poly_uniform) + ((1 - settings.random_per_poly_uniform) * random.uniform(0,1))
+        loop_vertices, loop_starts, loop_totals = get_mesh_topology(mesh)
 
-            poly_index += 1
+        # loops are stored polygon after polygon
+        random_data = np.repeat(per_poly_random_values[poly_index:poly_index + len(loop_totals)], loop_totals)
+        poly_index += len(loop_totals)
 
-            for loop_id in face.loop_indices:
-                bake_data(mesh, data_to_bake, settings.random_per_poly_mode, settings.random_per_poly_uv_index, settings.random_per_poly_uv_channel, settings.uvmap_name, settings.random_per_poly_rgba, settings.invert_v, loop_id)
+        bake_data(mesh, random_data, settings.random_per_poly_mode, settings.random_per_poly_uv_index, settings.random_per_poly_uv_channel, settings.uvmap_name, settings.random_per_poly_rgba, settings.invert_v)
 
     return poly_index > 0
 
+def get_bake_parent_depths(settings):
+    """ Hierarchy depths to bake, from the root down: all of them in automatic mode, only the current one in manual mode """
+
+    if settings.parent_mode == "MANUAL":
+        return [min(settings.parent_depth, settings.parent_max_depth) - 1]
+
+    return list(range(settings.parent_max_depth))
+
+def get_parent_hierarchy(objs, max_depth):
+    """
+    Build the hierarchy table of objects: the index of each object's ancestor per depth, from the root down.
+    Ancestors shared by several objects (a tree trunk...) are only listed once.
+
+    :param objs: objects whose ancestors to gather
+    :param max_depth: number of ancestors to walk up
+    :return: unique ancestors, (len(objs), max_depth) array of indices into the ancestors, -1 where an object has no ancestor
+    :rtype: tuple
+    """
+    ancestors = []
+    ancestor_indices = {}
+    hierarchy = np.full((len(objs), max(max_depth, 0)), -1, dtype=np.int32)
+
+    chains = {}
+    for obj_index, obj in enumerate(objs):
+        chain = chains.get(obj)
+        if chain is None:
+            chain = []
+
+            # walk up the hierarchy by X levels, as long as parents are meshes or empties
+            parent_obj = obj
+            while len(chain) < max_depth and parent_obj.parent is not None and (parent_obj.parent.type == "MESH" or parent_obj.parent.type == "EMPTY"):
+                parent_obj = parent_obj.parent
+                if parent_obj not in ancestor_indices:
+                    ancestor_indices[parent_obj] = len(ancestors)
+                    ancestors.append(parent_obj)
+                chain.append(ancestor_indices[parent_obj])
+
+            # reverse the hierarchy
+            chain.reverse()
+            chains[obj] = chain
+
+        hierarchy[obj_index, :len(chain)] = chain
+
+    return (ancestors, hierarchy)
+
+def get_parent_locations(settings, matrices):
+    """ World locations of parents, relative to the origin object if any """
+
+    locations = matrices[:, :3, 3].copy()
+    if settings.origin:
+        locations -= np.array(settings.origin.matrix_world.to_translation())
+
+    return locations
+
+def get_bake_parent_layout(settings):
+    """
+    Allocate the output of every parent depth once. bake_parent & get_bake_parent_info share it so baked data always matches the info.
+    In automatic mode, UV outputs take the next U or V channel starting from the automatic UVMap. Vertex color outputs don't use up a UV channel.
+
+    :param settings: DataBaker settings
+    :return: list of (depth, ID, data, mode, uv_index, uv_channel, rgba), data being ("POSITION" or "AXIS", component index or None if packed)
+    :rtype: list
+    """
+    parent_auto_mode = settings.parent_mode == "AUTOMATIC"
+    axis_packed = settings.parent_axis and settings.parent_axis_channel_mode == "POSITION_PACKED"
+
+    # automatic processing will loop through all parents and build used uv channels as needed so we need a starting point
+    uv_channel_index = (settings.parent_automatic_uv_index * 2) + (0 if settings.parent_automatic_uv_channel == "U" else 1)
+
+    layout = []
+    for depth in get_bake_parent_depths(settings):
+        hierarchy_index = settings.parent_max_depth - (depth + 1)
+        prefix = "Parent " + str(hierarchy_index)
+
+        outputs = [] # ID, data, mode, uv_index, uv_channel, rgba
+        
+        # POSITION
+        if settings.parent_position:
+            if settings.parent_position_channel_mode == "INDIVIDUAL":
+                for xyz_comp in XYZLIST:
+                    comp_name = "parent_position_" + xyz_comp.lower()
+                    if not getattr(settings, comp_name):
+                        continue
+
+                    mode = getattr(settings, comp_name + "_mode")
+                    ID = prefix + (" Position And Axis " if axis_packed and mode == "UV" else " Position ") + xyz_comp
+                    outputs.append((ID, ("POSITION", XYZINDICES[xyz_comp]), mode, getattr(settings, comp_name + "_uv_index"), getattr(settings, comp_name + "_uv_channel"), getattr(settings, comp_name + "_rgba")))
+            else:
+                if settings.parent_position_channel_mode == "XYZ_PACKED":
+                    ID = prefix + " Position XYZ"
+                else:
+                    ID = prefix + " Position " + settings.parent_position_ab_packed_a_comp + settings.parent_position_ab_packed_b_comp
+                outputs.append((ID, ("POSITION", None), "UV", settings.parent_position_packed_uv_index, settings.parent_position_packed_uv_channel, 0))
+
+        # AXIS
+        if settings.parent_axis and settings.parent_axis_channel_mode != "POSITION_PACKED":
+            if settings.parent_axis_channel_mode == "INDIVIDUAL":
+                for xyz_comp in XYZLIST:
+                    comp_name = "parent_axis_" + xyz_comp.lower()
+                    if not getattr(settings, comp_name):
+                        continue
+
+                    outputs.append((prefix + " Axis " + xyz_comp, ("AXIS", XYZINDICES[xyz_comp]), getattr(settings, comp_name + "_mode"), getattr(settings, comp_name + "_uv_index"), getattr(settings, comp_name + "_uv_channel"), getattr(settings, comp_name + "_rgba")))
+            else:
+                if settings.parent_axis_channel_mode == "XYZ_PACKED":
+                    ID = prefix + " Axis XYZ"
+                else:
+                    ID = prefix + " Axis " + settings.parent_axis_ab_packed_a_comp + settings.parent_axis_ab_packed_b_comp
+                outputs.append((ID, ("AXIS", None), "UV", settings.parent_axis_packed_uv_index, settings.parent_axis_packed_uv_channel, 0))
+
+        for ID, data, mode, uv_index, uv_channel, rgba in outputs:
+            if parent_auto_mode and mode == "UV":
+                uv_index = uv_channel_index // 2
+                uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
+                uv_channel_index += 1
+
+            layout.append((depth, ID, data, mode, uv_index, uv_channel, rgba))
+
+    return layout
+
 def bake_parent(context, meshes, empties):
     """ """
 
     settings = context.scene.DataBakerSettings
 
-    parent_auto_mode = settings.parent_mode == "AUTOMATIC"
-
     if settings.parent_position == False and settings.parent_axis == False:
         return False
 
     if settings.parent_max_depth <= 0:
         return False
 
-    manual_max_depth = max(min(settings.parent_depth, settings.parent_max_depth), 1.0)
-
     # data might need a 'multiplier' to be normalized and packed/unpacked
     packing_multiplier = get_parent_position_data_multiplier(context) if get_parent_position_data_needs_multiplier(context) else 1.0
     packing_divisor = 1.0 / packing_multiplier
     add_bake_report("parent_position_multiplier", packing_multiplier)
     
-    signed_axis = mathutils.Vector((-1.0 if settings.invert_x else 1.0,
-                                    -1.0 if settings.invert_y else 1.0,
-                                    -1.0 if settings.invert_z else 1.0))
+    signed_axis = np.array((-1.0 if settings.invert_x else 1.0,
+                            -1.0 if settings.invert_y else 1.0,
+                            -1.0 if settings.invert_z else 1.0))
     signed_scale = signed_axis * settings.scale
 
-    for mesh in meshes:
-        ref_obj = settings.transform_obj if settings.transform_obj else mesh
+    # build the hierarchy table once, then evaluate every ancestor once no matter how many meshes share it
+    ref_objs = [settings.transform_obj] * len(meshes) if settings.transform_obj else meshes
+    ancestors, hierarchy = get_parent_hierarchy(ref_objs, settings.parent_max_depth)
 
-        # automatic processing will loop through all parents and build used_uv_channels as needed so we need a starting point
-        uv_channel_index = (settings.parent_automatic_uv_index * 2) + (0 if settings.parent_automatic_uv_channel == "U" else 1)
-        uv_index = uv_channel_index // 2
-        uv_channel = settings.parent_automatic_uv_channel
+    matrices = get_world_matrices(ancestors)
+    parent_locations = get_parent_locations(settings, matrices) * signed_scale
+    parent_axes = get_bake_axes(matrices, settings.parent_axis_component, signed_axis, False)
 
-        parent_obj = ref_obj
-        parent_objs = []
+    # per ancestor data, per layout data & mode
+    parent_data = {}
 
-        # walk up the hierarchy by X levels and build the list of all parents for that object
-        for depth_index in range(settings.parent_max_depth):
-            if (parent_obj != None) and (parent_obj.parent != None) and (parent_obj.parent.type == 'MESH' or parent_obj.parent.type == 'EMPTY'):
-                parent_obj = parent_obj.parent
-                parent_objs.append(parent_obj)
-            else:
-                break
+    if settings.parent_position:
+        if settings.parent_position_channel_mode == "INDIVIDUAL":
+            # prevent parent pivot to be exactly at 0,0,0 in case the parent is indeed at origin because then we couldn't mask it in-engine based on pivot's distance from origin so we need to shift it by at least some amount to indicate there's indeed a valid parent here
+            locations = parent_locations.copy()
+            locations[np.linalg.norm(locations, axis=1) < 1] = 1.001
 
-        # reverse the hierarchy
-        parent_objs.reverse()
-        
-        # complete the tree will nullptrs until max depth reached
-        while(len(parent_objs) < settings.parent_max_depth):
-            parent_objs.append(None)
-
-        # loop through parents from root to child
-        for depth, parent_obj in enumerate(parent_objs):
-            # only process the desired depth if in manual mode
-            if settings.parent_mode == "MANUAL":
-                if depth != (manual_max_depth + 1):
-                    continue
-            
-            # if this object has no parent at this depth, we still want to make sure to write 0 that will indicate that element has no parent at this hierarchy level
-            if parent_obj == None:
-                # NULL POSITION (no parent)
-                if settings.parent_position:
-                    # INDIVIDUAL POSITION
-                    if settings.parent_position_channel_mode == "INDIVIDUAL":
-                        for xyz_comp in XYZLIST:
-                            uv_index = uv_channel_index // 2
-                            uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                            
-                            use_vcol = False
-                            if xyz_comp == "X" and settings.parent_position_x:
-                                use_vcol = settings.parent_position_x_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_position_x_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_x_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_position_x_mode, settings.parent_position_x_uv_index, settings.parent_position_x_uv_channel, settings.uvmap_name, settings.parent_position_x_rgba, settings.invert_v)
-                            elif xyz_comp == "Y" and settings.parent_position_y:
-                                use_vcol = settings.parent_position_y_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_position_y_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_y_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_position_y_mode, settings.parent_position_y_uv_index, settings.parent_position_y_uv_channel, settings.uvmap_name, settings.parent_position_y_rgba, settings.invert_v)
-                            elif xyz_comp == "Z" and settings.parent_position_z:
-                                use_vcol = settings.parent_position_z_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_position_z_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_z_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_position_z_mode, settings.parent_position_z_uv_index, settings.parent_position_z_uv_channel, settings.uvmap_name, settings.parent_position_z_rgba, settings.invert_v)
-                            else:
-                                continue
-                            
-                            if parent_auto_mode and not use_vcol:
-                                uv_channel_index += 1
-
-                    # AB or XYZ PACKED POSITION
-                    else:
-                        uv_index = settings.parent_position_packed_uv_index
-                        uv_channel = settings.parent_position_packed_uv_channel
-                        if parent_auto_mode:
-                            uv_index = uv_channel_index // 2
-                            uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                            
-                            uv_channel_index += 1
-                        
-                        bake_data(mesh, 0.0, "UV", uv_index, uv_channel, settings.uvmap_name, 0, settings.invert_v)
-                
-                # NULL AXIS (no parent)
-                if settings.parent_axis:
-                    # INDIVIDUAL AXIS
-                    if settings.parent_axis_channel_mode == "INDIVIDUAL":
-                        for xyz_comp in XYZLIST:
-                            uv_index = uv_channel_index // 2
-                            uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-
-                            use_vcol = False
-                            if xyz_comp == "X" and settings.parent_axis_x:
-                                use_vcol = settings.parent_axis_x_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_axis_x_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_axis_x_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_axis_x_mode, settings.parent_axis_x_uv_index, settings.uvmap_name, settings.parent_axis_x_uv_channel, settings.parent_axis_x_rgba, settings.invert_v)
-                            elif xyz_comp == "Y" and settings.parent_axis_y:
-                                use_vcol = settings.parent_axis_y_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_axis_y_mode, uv_index, settings.uvmap_name, uv_channel, settings.parent_axis_y_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_axis_y_mode, settings.parent_axis_y_uv_index, settings.parent_axis_y_uv_channel, settings.uvmap_name, settings.parent_axis_y_rgba, settings.invert_v)
-                            elif xyz_comp == "Z" and settings.parent_axis_z:
-                                use_vcol = settings.parent_axis_z_mode == "VCOL"
-                                if parent_auto_mode:
-                                    bake_data(mesh, 0.0, settings.parent_axis_z_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_axis_z_rgba, settings.invert_v)
-                                else:
-                                    bake_data(mesh, 0.0, settings.parent_axis_z_mode, settings.parent_axis_z_uv_index, settings.parent_axis_z_uv_channel, settings.uvmap_name, settings.parent_axis_z_rgba, settings.invert_v)
-                            else:
-                                continue
-
-                            if parent_auto_mode and not use_vcol:
-                                uv_channel_index += 1
-
-                    # AB or XYZ PACKED AXIS
-                    elif settings.parent_axis_channel_mode != "POSITION_PACKED":
-                        uv_index = settings.parent_position_packed_uv_index
-                        uv_channel = settings.parent_position_packed_uv_channel
-                        if parent_auto_mode:
-                            uv_index = uv_channel_index // 2
-                            uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-
-                            uv_channel_index += 1
-
-                        bake_data(mesh, 0.0, "UV", uv_index, uv_channel, settings.uvmap_name, 0, settings.invert_v)
-                # no parent means we move onto the next object
-                continue
+            # packing axis is only available if we pack X/Y/Z components individually. Round position & pack axis in the fractional part
+            if settings.parent_axis and settings.parent_axis_channel_mode == "POSITION_PACKED":
+                locations = np.floor(locations) + (parent_axes + 1.0) * 0.5
 
-            # parent object is valid here
-            parent_obj = parent_objs[depth]
-            if parent_obj == None:
-                continue
+            for comp_index in range(3):
+                parent_data[(("POSITION", comp_index), "UV")] = locations[:, comp_index]
+                parent_data[(("POSITION", comp_index), "VCOL")] = (locations[:, comp_index] * packing_divisor + 1) * 0.5
+        else:
+            locations = parent_locations.copy()
 
-            parent_obj_quat = parent_obj.matrix_world.to_quaternion()
-            parent_axis_to_bake = get_bake_axis(parent_obj_quat, settings.parent_axis_component, signed_axis, False)
-
-            # POSITION
-            if settings.parent_position:
-                # get parent's position in world space, to scale
-                parent_location_to_bake = parent_obj.matrix_world.to_translation() * signed_scale
-
-                if settings.parent_position_channel_mode == "INDIVIDUAL":
-                    # prevent parent pivot to be exactly at 0,0,0 in case the parent is indeed at origin because then we couldn't mask it in-engine based on pivot's distance from origin so we need to shift it by at least some amount to indicate there's indeed a valid parent here
-                    if parent_location_to_bake.length < 1:
-                        parent_location_to_bake = mathutils.Vector((1.001,1.001,1.001))
-
-                    # packing axis is only available if we pack X/Y/Z components individually
-                    if settings.parent_axis_channel_mode == "POSITION_PACKED":
-                        parent_axis_to_bake = (parent_axis_to_bake + XYZUNITVECTOR) * 0.5
-
-                        # round position & pack axis in the fractional part
-                        parent_location_to_bake.x = math.floor(parent_location_to_bake.x) + parent_axis_to_bake.x
-                        parent_location_to_bake.y = math.floor(parent_location_to_bake.y) + parent_axis_to_bake.y
-                        parent_location_to_bake.z = math.floor(parent_location_to_bake.z) + parent_axis_to_bake.z
-
-                    for xyz_comp in XYZLIST:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-
-                        use_vcol = False
-                        if xyz_comp == "X" and settings.parent_position_x:
-                            data_to_bake = parent_location_to_bake.x
-
-                            use_vcol = settings.parent_position_x_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_position_x_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_x_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_position_x_mode, settings.parent_position_x_uv_index, settings.parent_position_x_uv_channel, settings.uvmap_name, settings.parent_position_x_rgba, settings.invert_v)
-                        elif xyz_comp == "Y" and settings.parent_position_y:
-                            data_to_bake = parent_location_to_bake.y
-                            
-                            use_vcol = settings.parent_position_y_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_position_y_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_y_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_position_y_mode, settings.parent_position_y_uv_index, settings.parent_position_y_uv_channel, settings.uvmap_name, settings.parent_position_y_rgba, settings.invert_v)
-                        elif xyz_comp == "Z" and settings.parent_position_z:
-                            data_to_bake = parent_location_to_bake.z
-
-                            use_vcol = settings.parent_position_z_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = data_to_bake * packing_divisor
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_position_z_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_position_z_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_position_z_mode, settings.parent_position_z_uv_index, settings.parent_position_z_uv_channel, settings.uvmap_name, settings.parent_position_z_rgba, settings.invert_v)
-                        else:
-                            continue
-                          
-                        if parent_auto_mode and not use_vcol:
-                            uv_channel_index += 1
-                        
-                # PACKED
-                else:
-                    # prevent parent pivot to be exactly at 0,0,0 in case the parent is indeed at origin because then we couldn't mask it in-engine based on pivot's distance from origin so we need to shift it by at least some amount to indicate there's indeed a valid parent here
-                    if parent_location_to_bake.length < 1:
-                        precision_offset = (1.0 / 65536.0) * packing_multiplier # 16bits precision?
-                        if settings.parent_position_channel_mode == "XYZ_PACKED":
-                            precision_offset = (1.0 / 256.0) * packing_multiplier # 8bits precision?
-                        parent_location_to_bake = mathutils.Vector((precision_offset, precision_offset, precision_offset))
-                    
-                    parent_location_to_bake = mathutils.Vector((
-                        max(min(parent_location_to_bake.x * packing_divisor, 1.0), -1.0),
-                        max(min(parent_location_to_bake.y * packing_divisor, 1.0), -1.0),
-                        max(min(parent_location_to_bake.z * packing_divisor, 1.0), -1.0)
-                        ))
+            precision_offset = (1.0 / 65536.0) * packing_multiplier # 16bits precision?
+            if settings.parent_position_channel_mode == "XYZ_PACKED":
+                precision_offset = (1.0 / 256.0) * packing_multiplier # 8bits precision?
+            locations[np.linalg.norm(locations, axis=1) < 1] = precision_offset
 
-                    parent_location_to_bake = (parent_location_to_bake + XYZUNITVECTOR) * 0.5
-                    
-                    # X/Y or X/Z or Y/Z POSITION
-                    if settings.parent_position_channel_mode == "AB_PACKED":
-                        data_to_bake = get_packed_ab_vector(parent_location_to_bake, settings.parent_position_ab_packed_a_comp, settings.parent_position_ab_packed_b_comp)
-                    # XYZ POSITION
-                    elif settings.parent_position_channel_mode == "XYZ_PACKED":
-                        data_to_bake = get_packed_xyz_vector(parent_location_to_bake)
-                    
-                    uv_index = settings.parent_position_packed_uv_index
-                    uv_channel = settings.parent_position_packed_uv_channel
-                    if parent_auto_mode:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                        
-                        uv_channel_index += 1
-                    
-                    bake_data(mesh, data_to_bake, "UV", uv_index, uv_channel, settings.uvmap_name, 0, settings.invert_v)
-
-            # AXIS
-            if settings.parent_axis and settings.parent_axis_channel_mode != "POSITION_PACKED":
-                if settings.parent_axis_channel_mode == "INDIVIDUAL":
-                    for xyz_comp in XYZLIST:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                        
-                        use_vcol = False
-                        if xyz_comp == "X" and settings.parent_axis_x:
-                            data_to_bake = parent_axis_to_bake.x
-                            
-                            use_vcol = settings.parent_axis_x_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_x_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_axis_x_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_x_mode, settings.parent_axis_x_uv_index, settings.parent_axis_x_uv_channel, settings.uvmap_name, settings.parent_axis_x_rgba, settings.invert_v)
-                        elif xyz_comp == "Y" and settings.parent_axis_y:
-                            data_to_bake = parent_axis_to_bake.y
-                            
-                            use_vcol = settings.parent_axis_y_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_y_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_axis_z_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_y_mode, settings.parent_axis_y_uv_index, settings.parent_axis_y_uv_channel, settings.uvmap_name, settings.parent_axis_y_rgba, settings.invert_v)
-                        elif xyz_comp == "Z" and settings.parent_axis_z:
-                            data_to_bake = parent_axis_to_bake.z
-                            
-                            use_vcol = settings.parent_axis_z_mode == "VCOL"
-                            if use_vcol:
-                                data_to_bake = (data_to_bake + 1) * 0.5
-                            
-                            if parent_auto_mode:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_z_mode, uv_index, uv_channel, settings.uvmap_name, settings.parent_axis_z_rgba, settings.invert_v)
-                            else:
-                                bake_data(mesh, data_to_bake, settings.parent_axis_z_mode, settings.parent_axis_z_uv_index, settings.parent_axis_z_uv_channel, settings.parent_axis_z_rgba, settings.invert_v)
-                        else:
-                            continue
-                        
-                        if parent_auto_mode and not use_vcol:
-                            uv_channel_index += 1
-                # PACKED
-                else:
-                    parent_axis_to_bake = (parent_axis_to_bake + XYZUNITVECTOR) * 0.5
-                
-                    # X/Y or X/Z or Y/Z AXIS
-                    if settings.parent_axis_channel_mode == "AB_PACKED":
-                        data_to_bake = get_packed_ab_vector(parent_axis_to_bake, settings.parent_axis_ab_packed_a_comp, settings.parent_axis_ab_packed_b_comp)
-                    # XYZ AXIS
-                    else:
-                        data_to_bake = get_packed_xyz_vector(parent_axis_to_bake)
-                    
-                    uv_index = settings.parent_axis_packed_uv_index
-                    uv_channel = settings.parent_axis_packed_uv_channel
-                    if parent_auto_mode:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                        
-                        uv_channel_index += 1
-                    
-                    bake_data(mesh, data_to_bake, "UV", uv_index, uv_channel, settings.uvmap_name, 0, settings.invert_v)
+            locations = (np.clip(locations * packing_divisor, -1.0, 1.0) + 1.0) * 0.5
+
+            # X/Y or X/Z or Y/Z POSITION
+            if settings.parent_position_channel_mode == "AB_PACKED":
+                parent_data[(("POSITION", None), "UV")] = get_packed_ab_vectors(locations, settings.parent_position_ab_packed_a_comp, settings.parent_position_ab_packed_b_comp)
+            # XYZ POSITION
+            else:
+                parent_data[(("POSITION", None), "UV")] = get_packed_xyz_vectors(locations)
+
+    if settings.parent_axis and settings.parent_axis_channel_mode != "POSITION_PACKED":
+        if settings.parent_axis_channel_mode == "INDIVIDUAL":
+            for comp_index in range(3):
+                parent_data[(("AXIS", comp_index), "UV")] = parent_axes[:, comp_index]
+                parent_data[(("AXIS", comp_index), "VCOL")] = (parent_axes[:, comp_index] + 1) * 0.5
+        else:
+            axes = (parent_axes + 1.0) * 0.5
+
+            # X/Y or X/Z or Y/Z AXIS
+            if settings.parent_axis_channel_mode == "AB_PACKED":
+                parent_data[(("AXIS", None), "UV")] = get_packed_ab_vectors(axes, settings.parent_axis_ab_packed_a_comp, settings.parent_axis_ab_packed_b_comp)
+            # XYZ AXIS
+            else:
+                parent_data[(("AXIS", None), "UV")] = get_packed_xyz_vectors(axes)
+
+    for depth, ID, data, mode, uv_index, uv_channel, rgba in get_bake_parent_layout(settings):
+        # meshes without a parent at this depth get 0, which indicates that element has no parent at this hierarchy level. Index -1 picks the appended 0
+        data_to_bake = np.append(parent_data[(data, mode)], 0.0)[hierarchy[:, depth]]
+        bake_data_per_mesh(meshes, data_to_bake, mode, uv_index, uv_channel, settings.uvmap_name, rgba, settings.invert_v)
             
     return True
 
@@ -1721,52 +2906,71 @@ def bake_direction(context, meshes, empties):
     if not settings.direction:
         return False
 
-    direction = mathutils.Vector((0.0, 0.0, 0.0))
+    directions = np.zeros((len(meshes), 3))
     
     # shared for all meshes
     if settings.direction_mode == "3DVECTOR":
-        normalized_direction = mathutils.Vector((settings.direction_vector_x, settings.direction_vector_y, settings.direction_vector_z)).normalized()
-
-        Direction = normalized_direction
+        directions[:] = mathutils.Vector((settings.direction_vector_x, settings.direction_vector_y, settings.direction_vector_z)).normalized()
     elif settings.direction_mode == "2DVECTOR":
-        normalized_direction = mathutils.Vector((settings.direction_vector_x, settings.direction_vector_y, 0.0)).normalized() # nullify Z
+        directions[:] = mathutils.Vector((settings.direction_vector_x, settings.direction_vector_y, 0.0)).normalized() # nullify Z
+    # one random direction per mesh
+    elif settings.direction_mode == "3DRAND":
+        # https://gist.github.com/andrewbolster/10274979
+        phi = np.random.uniform(0, np.pi * 2, len(meshes))
+        costheta = np.random.uniform(-1, 1, len(meshes))
+
+        theta = np.arccos(costheta)
+        directions[:, 0] = np.sin(theta) * np.cos(phi)
+        directions[:, 1] = np.sin(theta) * np.sin(phi)
+        directions[:, 2] = np.cos(theta)
+    elif settings.direction_mode == "2DRAND":
+        x = np.random.uniform(-math.pi, math.pi, len(meshes))
+
+        directions[:, 0] = np.cos(x)
+        directions[:, 1] = np.sin(x)
+
+    if settings.direction_pack_mode == "VCOL":
+        directions = (directions * 0.5) + 0.5
+
+        rgba = 'RGB' if (settings.direction_mode == "3DVECTOR" or settings.direction_mode == "3DRAND") else 'RG'
+    else:
+        rgba = ''
 
-        direction = normalized_direction
-    
-    for mesh in meshes:
-        if settings.direction_mode == "3DRAND":
-            # https://gist.github.com/andrewbolster/10274979
-            phi = np.random.uniform(0,np.pi*2)
-            costheta = np.random.uniform(-1,1)
+    for mesh_index, mesh in enumerate(meshes):
+        bake_data(mesh, directions[mesh_index], settings.direction_pack_mode, 0, 0, settings.uvmap_name, rgba, settings.invert_v)
 
-            theta = np.arccos( costheta )
-            x = np.sin( theta) * np.cos( phi )
-            y = np.sin( theta) * np.sin( phi )
-            z = np.cos( theta )
+    return True
 
-            direction = mathutils.Vector((x,y,z))
-        elif settings.direction_mode == "2DRAND":
-            x = np.random.uniform(-math.pi, math.pi)
-            cosx = math.cos(x)
-            sinx = math.sin(x)
+#################
+### BAKE INFO ###
 
-            direction = mathutils.Vector((cosx,sinx,0.0))
+# data derived from settings only, valid as long as the settings version doesn't change: { (settings pointer, key) : value }
+settings_cache = {}
+settings_cache_version = None
 
-        if settings.direction_pack_mode == "VCOL":
-            direction = (direction * HALFXYZVECTOR) + HALFXYZVECTOR
+def get_settings_cache(context, key, builder):
+    """ Return the cached value for the given key, building it again only if a setting changed since, see Properties.settings_version """
+    global settings_cache
+    global settings_cache_version
 
-            if (settings.direction_mode == "3DVECTOR" or settings.direction_mode == "3DRAND"):
-                bake_data(mesh, direction, settings.direction_pack_mode, 0, 0, settings.uvmap_name, 'RGB', settings.invert_v)
-            else:
-                bake_data(mesh, direction, settings.direction_pack_mode, 0, 0, settings.uvmap_name, 'RG', settings.invert_v)
-        else:
-            bake_data(mesh, direction, settings.direction_pack_mode, 0, 0, settings.uvmap_name, '', settings.invert_v)
+    if settings_cache_version != Properties.settings_version:
+        settings_cache = {}
+        settings_cache_version = Properties.settings_version
 
-    return True
+    key = (context.scene.DataBakerSettings.as_pointer(), key)
+    if key not in settings_cache:
+        settings_cache[key] = builder()
+    return settings_cache[key]
 
-#################
-### BAKE INFO ###
 def get_bake_info(context):
+    """ Return the UV, vertex color & normal info of the bake, built once per settings change. Don't modify the returned lists """
+    return get_settings_cache(context, "bake_info", lambda: build_bake_info(context))
+
+def get_bake_multiplier_needs(context):
+    """ Return whether position, parent position & shapekey offset need a multiplier, checked once per settings change """
+    return get_settings_cache(context, "multiplier_needs", lambda: (get_position_data_needs_multiplier(context), get_parent_position_data_needs_multiplier(context), get_shapekey_offset_data_needs_multiplier(context)))
+
+def build_bake_info(context):
     """ """
 
     info_uv   = []
@@ -2087,152 +3291,27 @@ def get_bake_parent_info(context):
     info_vcol = [] # ID, rgba_channel, requires multiplier?
     info_normal  = [] # normal_component
 
-    if settings.parent_position or settings.parent_axis:
-        # AUTOMATIC
-        parent_auto_mode = settings.parent_mode == "AUTOMATIC"
-
-        uv_channel_index = (settings.parent_automatic_uv_index * 2) + (0 if settings.parent_automatic_uv_channel == "U" else 1)
-        uv_index = uv_channel_index // 2
-        uv_channel = 0 if uv_channel_index % 2 == 0 else 1
-
-        manual_max_depth = max(min(settings.parent_depth, settings.parent_max_depth), 1.0)
-
-        ID = ""
-
-        for depth in range(settings.parent_max_depth):
-            if parent_auto_mode:
-                # only process the desired depth if in manual mode
-                if settings.parent_mode == "MANUAL":
-                    if depth != (manual_max_depth + 1):
-                        continue
-            
-            hierarchy_index = settings.parent_max_depth - (depth + 1)
-            
-            # parent position
-            if settings.parent_position:
-                if settings.parent_position_channel_mode == "INDIVIDUAL":
-                    axis_packed = settings.parent_axis and settings.parent_axis_channel_mode == "POSITION_PACKED" # requires 32 bits if True
-                    
-                    for xyz_comp in XYZLIST:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                        
-                        # X position?
-                        if xyz_comp == "X" and settings.parent_position_x:
-                            ID = "Parent " + str(hierarchy_index) + " Position X"
-                            if settings.parent_position_x_mode == "UV":
-                                if axis_packed:
-                                    ID = "Parent " + str(hierarchy_index) + " Position And Axis X"
-
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_position_x_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_position_x_uv_channel
-
-                                info_uv.append((ID, uv_channel_index_to_use, uv_channel_channel_to_use, axis_packed, axis_packed, False, settings.parent_position_channel_mode))
-                            elif settings.parent_position_x_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_position_x_rgba, True))
-                        # Y position?
-                        elif xyz_comp == "Y" and settings.parent_position_y:                    
-                            ID = "Parent " + str(hierarchy_index) + " Position Y"
-                            if settings.parent_position_y_mode == "UV":
-                                if axis_packed:
-                                    ID = "Parent " + str(hierarchy_index) + " Position And Axis Y"
-                                
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_position_y_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_position_y_uv_channel
-
-                                info_uv.append((ID, uv_channel_index_to_use, uv_channel_channel_to_use, axis_packed, axis_packed, False, settings.parent_position_channel_mode))
-                            elif settings.parent_position_y_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_position_y_rgba, True))
-                        # Z position?
-                        elif xyz_comp == "Z" and settings.parent_position_z:
-                            ID = "Parent " + str(hierarchy_index) + " Position Z"
-                            if settings.parent_position_z_mode == "UV":
-                                if axis_packed:
-                                    ID = "Parent " + str(hierarchy_index) + " Position And Axis Z"
-                                
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_position_z_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_position_z_uv_channel
-
-                                info_uv.append((ID, uv_channel_index_to_use, uv_channel_channel_to_use, axis_packed, axis_packed, False, settings.parent_position_channel_mode))
-                            elif settings.parent_position_z_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_position_z_rgba, True))
-                        else:
-                            continue
-                        
-                        uv_channel_index += 1
-                else:
-                    if settings.parent_position_channel_mode == "XYZ_PACKED":
-                        ID = "Parent " + str(hierarchy_index) + " Position XYZ"
-                    elif settings.parent_position_channel_mode == "AB_PACKED":
-                        ID = "Parent " + str(hierarchy_index) + " Position " + settings.parent_position_ab_packed_a_comp + settings.parent_position_ab_packed_b_comp
-
-                    uv_index = uv_channel_index // 2
-                    uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-
-                    uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_position_packed_uv_index
-                    uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_position_packed_uv_channel
-
-                    info_uv.append((ID, uv_channel_index_to_use, uv_channel_channel_to_use, False, True, True, settings.parent_position_channel_mode))
-
-                    uv_channel_index += 1
-            # parent axis
-            if settings.parent_axis:
-                if settings.parent_axis_channel_mode == "INDIVIDUAL":
-                    for xyz_comp in XYZLIST:
-                        uv_index = uv_channel_index // 2
-                        uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                        
-                        # X component?
-                        if xyz_comp == "X" and settings.parent_axis_x:
-                            ID = "Parent " + str(hierarchy_index) + " Axis X"
-                            if settings.parent_axis_x_mode == "UV":
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_axis_x_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_axis_x_uv_channel
-                                
-                                info_uv.append((ID, uv_index, uv_channel_index, False, False, False, settings.parent_axis_channel_mode))
-                            elif settings.parent_axis_x_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_axis_x_rgba, False))
-                        # Y component?
-                        elif xyz_comp == "Y" and settings.parent_axis_y:
-                            ID = "Parent " + str(hierarchy_index) + " Axis Y"
-                            if settings.parent_axis_y_mode == "UV":
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_axis_y_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_axis_y_uv_channel
-                                
-                                info_uv.append((ID, uv_index, uv_channel_index, False, False, False, settings.parent_axis_channel_mode))
-                            elif settings.parent_axis_y_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_axis_y_rgba, False))
-                        # Z component?
-                        elif xyz_comp == "Z" and settings.parent_axis_z:
-                            ID = "Parent " + str(hierarchy_index) + " Axis Z"
-                            if settings.parent_axis_z_mode == "UV":
-                                uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_axis_z_uv_index
-                                uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_axis_z_uv_channel
-                                
-                                info_uv.append((ID, uv_index, uv_channel_index, False, False, False, settings.parent_axis_channel_mode))
-                            elif settings.parent_axis_z_mode == "VCOL":
-                                info_vcol.append((ID, settings.parent_axis_z_rgba, False))
-                        else:
-                            continue
-
-                        uv_channel_index += 1
-                elif settings.parent_axis_channel_mode != "POSITION_PACKED":
-                    if settings.parent_axis_channel_mode == "XYZ_PACKED":
-                        ID = "Parent " + str(hierarchy_index) + " Axis XYZ"
-                    elif settings.parent_axis_channel_mode == "AB_PACKED":
-                        ID = "Parent " + str(hierarchy_index) + " Axis " + settings.parent_axis_ab_packed_a_comp + settings.parent_axis_ab_packed_b_comp
-                    else:
-                        continue
-                    
-                    uv_index = uv_channel_index // 2
-                    uv_channel = "U" if uv_channel_index % 2 == 0 else "V"
-                    
-                    uv_channel_index_to_use = uv_index if parent_auto_mode else settings.parent_axis_packed_uv_index
-                    uv_channel_channel_to_use = uv_channel if parent_auto_mode else settings.parent_axis_packed_uv_channel
-
-                    info_uv.append((ID, uv_index, uv_channel, False, True, False, settings.parent_axis_channel_mode))
-
-                    uv_channel_index += 1
+    if (settings.parent_position or settings.parent_axis) and settings.parent_max_depth > 0:
+        axis_packed = settings.parent_axis and settings.parent_axis_channel_mode == "POSITION_PACKED" # requires 32 bits if True
+
+        for depth, ID, data, mode, uv_index, uv_channel, rgba in get_bake_parent_layout(settings):
+            data_type, comp_index = data
+            if data_type == "POSITION":
+                channel_mode = settings.parent_position_channel_mode
+                if comp_index is None:
+                    info_uv.append((ID, uv_index, uv_channel, False, True, True, channel_mode))
+                elif mode == "UV":
+                    info_uv.append((ID, uv_index, uv_channel, axis_packed, axis_packed, False, channel_mode))
+                elif mode == "VCOL":
+                    info_vcol.append((ID, rgba, True))
+            else:
+                channel_mode = settings.parent_axis_channel_mode
+                if comp_index is None:
+                    info_uv.append((ID, uv_index, uv_channel, False, True, False, channel_mode))
+                elif mode == "UV":
+                    info_uv.append((ID, uv_index, uv_channel, False, False, False, channel_mode))
+                elif mode == "VCOL":
+                    info_vcol.append((ID, rgba, False))
 
     return (settings.parent_position or settings.parent_axis, info_uv, info_vcol, info_normal)
 
@@ -2344,6 +3423,18 @@ def export_xml(context):
 
     mesh_el = ET.SubElement(root, "Mesh", path=mesh_export_path)
 
+    # timings
+    timings_el = ET.SubElement(root, "Timings", total=str(report.total_time))
+
+    for report_timing in report.timings:
+        timing_sub_el = ET.SubElement(timings_el, "Stage",
+                                      name=report_timing.name,
+                                      time=str(report_timing.time),
+                                      meshes=str(report_timing.meshes),
+                                      loops=str(report_timing.loops),
+                                      uv_layers=str(report_timing.uv_layers),
+                                      bake_data_calls=str(report_timing.bake_data_calls))
+
     # write xml
     tree = ET.ElementTree(root)
     if settings.export_xml_mode == "MESHPATH" and report.mesh_path != "":
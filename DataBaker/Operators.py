@@ -12,11 +12,15 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import time
 
 from bpy.types import Operator
 
-from . import Functions
-from .Functions import bake, get_position_data_multiplier, get_parent_position_data_multiplier, get_shapekey_offset_data_multiplier, reset_bake_report
+# Functions is heavy (numpy...) and only imported by operators when they first execute, see auto_load
+
+BAKE_FRAME_TIME = 1.0 / 30.0 # seconds of baking per timer event, so the UI keeps redrawing while baking
+BAKE_TIMER_STEP = 0.01 # seconds between timer events
+BAKE_CHUNK_LOOPS = 10000 # loops baked by the first chunk, chunks are then sized from the measured bake rate
 
 #######################################################################################
 ###################################### OPERATORS ######################################
@@ -34,6 +38,7 @@ class DATABAKER_OT_BakeData(Operator):
     #     return Object and Object.type == 'MESH' and Object.mode == 'OBJECT'
 
     def execute(self, context):
+        from .Functions import bake
         success, verbose, msg = bake(context)
         if success:
             self.report({verbose}, msg)
@@ -42,6 +47,90 @@ class DATABAKER_OT_BakeData(Operator):
             self.report({verbose}, msg)
             return {'CANCELLED'}
 
+    def invoke(self, context, event):
+        """ Bake in chunks from timer events, reporting progress. ESC cancels the bake until its layers are written """
+        if bpy.app.background or context.window is None:
+            return self.execute(context)
+
+        from .Functions import iter_bake
+        self.bake_steps = iter_bake(bpy.context) # context is only valid during this call, the bake outlives it
+        self.progress, self.cancellable, chunk_loops = next(self.bake_steps)
+        self.chunk_loops = BAKE_CHUNK_LOOPS
+
+        window_manager = context.window_manager
+        self.timer = window_manager.event_timer_add(BAKE_TIMER_STEP, window=context.window)
+        window_manager.progress_begin(0.0, 1.0)
+        context.workspace.status_text_set("Baking data... ESC to cancel")
+
+        window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        """ """
+        if event.type == 'ESC' and self.cancellable:
+            self.bake_steps.close() # rolls the bake back
+            self.finish(context)
+            self.report({'WARNING'}, "Bake cancelled")
+            return {'CANCELLED'}
+
+        # other events are blocked, the selection mustn't change while baking
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'}
+
+        tick_start_time = time.perf_counter()
+        try:
+            while time.perf_counter() - tick_start_time < BAKE_FRAME_TIME:
+                chunk_start_time = time.perf_counter()
+                self.progress, self.cancellable, chunk_loops = self.bake_steps.send(self.chunk_loops)
+                chunk_time = time.perf_counter() - chunk_start_time
+
+                # size the next chunk to half the frame time from the measured rate, smoothed against outliers
+                if chunk_loops > 0 and chunk_time > 0.0:
+                    target_loops = chunk_loops * (BAKE_FRAME_TIME * 0.5) / chunk_time
+                    self.chunk_loops = max(int((self.chunk_loops + target_loops) * 0.5), 1)
+        except StopIteration as stop:
+            self.finish(context)
+            success, verbose, msg = stop.value
+            self.report({verbose}, msg)
+            return {'FINISHED'} if success else {'CANCELLED'}
+        except Exception:
+            self.finish(context)
+            raise
+
+        context.window_manager.progress_update(self.progress)
+        if not self.cancellable:
+            context.workspace.status_text_set("Writing baked data...")
+
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        """ Called when Blender stops the modal bake itself, e.g. when the window is closed """
+        self.bake_steps.close()
+        self.finish(context)
+
+    def finish(self, context):
+        """ """
+        window_manager = context.window_manager
+        window_manager.event_timer_remove(self.timer)
+        window_manager.progress_end()
+        context.workspace.status_text_set(None)
+
+class DATABAKER_OT_EstimateBake(Operator):
+    """ Projects the workload of a bake of the selection without baking anything. """
+    bl_idname = "gametools.databaker_estimatebake"
+    bl_label = "Estimate"
+    bl_category = "Game Tools"
+    bl_description = "Dry run: project the meshes, loops, UV layers, memory & time a bake of the selection would take, without modifying anything"
+
+    def execute(self, context):
+        from .Functions import estimate_bake
+        success, verbose, msg = estimate_bake(context)
+        self.report({verbose}, msg)
+        if success:
+            return {'FINISHED'}
+        else:
+            return {'CANCELLED'}
+
 class DATABAKER_OT_ClearReport(Operator):
     """ Bakes object & skeletal animations of the active mesh into textures, storing positional & normal data per vertex. """
     bl_idname = "gametools.databaker_clear_report"
@@ -52,9 +141,11 @@ class DATABAKER_OT_ClearReport(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.DataBakerReport.baked
+        report = context.scene.DataBakerReport
+        return report.baked or report.estimated
 
     def execute(self, context):
+        from .Functions import reset_bake_report
         reset_bake_report()
         return {'FINISHED'}
 
@@ -66,6 +157,7 @@ class DATABAKER_OT_GetPositionDataMultiplier(Operator):
     bl_description = "Compute Multiplier the position multiplier to use in your UE materials in case you store said position in vertex color OR pack its XYZ components in a single float"
     
     def execute(self, context):
+        from .Functions import get_position_data_multiplier
         report = context.scene.DataBakerReport
         report.position_multiplier = get_position_data_multiplier(context)
 
@@ -79,6 +171,7 @@ class DATABAKER_OT_GetParentPositionDataMultiplier(Operator):
     bl_description = "Compute Multiplier the parent position multiplier to use in your UE materials in case you store said position in vertex color OR pack its XYZ components in a single float"
     
     def execute(self, context):
+        from .Functions import get_parent_position_data_multiplier
         report = context.scene.DataBakerReport
         report.parent_position_multiplier = get_parent_position_data_multiplier(context)
 
@@ -92,7 +185,14 @@ class DATABAKER_OT_GetShapekeyOffsetDataMultiplier(Operator):
     bl_description = "Compute Multiplier the shapekey offset multiplier to use in your UE materials in case you store said offset in vertex color OR pack its XYZ components in a single float"
 
     def execute(self, context):
+        from .Functions import get_shapekey_offset_data_multiplier, begin_bake_cache, end_bake_cache
         report = context.scene.DataBakerReport
-        report.shapekey_offset_multiplier = get_shapekey_offset_data_multiplier(context)
+
+        # objects sharing a mesh only compute their offsets once
+        begin_bake_cache()
+        try:
+            report.shapekey_offset_multiplier = get_shapekey_offset_data_multiplier(context)
+        finally:
+            end_bake_cache()
 
         return {'FINISHED'}
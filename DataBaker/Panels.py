@@ -16,8 +16,6 @@ import bpy
 from bl_operators.presets import AddPresetBase
 from bl_ui.utils import PresetPanel
 
-from . import Functions
-from .Functions import get_bake_info, get_position_data_needs_multiplier, get_parent_position_data_needs_multiplier, get_shapekey_offset_data_needs_multiplier
 
 ####################################################################################
 ###################################### PANELS ######################################
@@ -107,6 +105,7 @@ class DATABAKER_OT_DataBaker_AddPreset(AddPresetBase, bpy.types.Operator):
     'settings.shapekey_offset_ab_packed_b_comp',
     'settings.shapekey_normal',
     'settings.shapekey_normal_channel_mode',
+    'settings.shapekey_normal_source',
     'settings.shapekey_normal_x',
     'settings.shapekey_normal_x_mode',
     'settings.shapekey_normal_x_uv_index',
@@ -165,6 +164,7 @@ class DATABAKER_OT_DataBaker_AddPreset(AddPresetBase, bpy.types.Operator):
     'settings.random_per_poly_uv_channel',
     'settings.random_per_poly_rgba',
     'settings.random_per_poly_uniform',
+    'settings.random_per_poly_seed',
     'settings.parent_mode',
     'settings.parent_depth',
     'settings.parent_max_depth',
@@ -229,6 +229,8 @@ class DATABAKER_OT_DataBaker_AddPreset(AddPresetBase, bpy.types.Operator):
     'settings.make_single_user',
     'settings.merge_mesh',
     'settings.clean_bake',
+    'settings.incremental_bake',
+    'settings.memory_budget',
     'settings.mesh_name',
     'settings.scale',
     'settings.invert_x',
@@ -242,6 +244,9 @@ class DATABAKER_OT_DataBaker_AddPreset(AddPresetBase, bpy.types.Operator):
     'settings.export_mesh_file_override',
     'settings.uvmap_name',
     'settings.invert_v',
+    'settings.color_attribute_name',
+    'settings.color_attribute_domain',
+    'settings.color_attribute_type',
     'settings.export_xml',
     'settings.export_xml_mode',
     'settings.export_xml_file_name',
@@ -308,6 +313,9 @@ class DATABAKER_PT_DataBaker(bpy.types.Panel):
         settings.fixed_value or
         settings.direction)
 
+        row = layout.row()
+        row.operator("gametools.databaker_estimatebake")
+
 ############
 ### DATA ###
 class DATABAKER_PT_Data(bpy.types.Panel):
@@ -1196,6 +1204,10 @@ class DATABAKER_PT_ShapekeyNormalPanel(bpy.types.Panel):
         row = layout.row()
         row.prop(settings, "shapekey_normal_channel_mode")
         row.enabled = bake_option_enabled
+
+        row = layout.row()
+        row.prop(settings, "shapekey_normal_source")
+        row.enabled = bake_option_enabled
         
         if settings.shapekey_normal_channel_mode == "INDIVIDUAL":
             bake_option_enabled = bake_option_enabled and (settings.shapekey_normal_x or settings.shapekey_normal_y or settings.shapekey_normal_z)
@@ -1786,6 +1798,10 @@ class DATABAKER_PT_RandomPerPolyPanel(bpy.types.Panel):
         row.prop(settings, "random_per_poly_uniform")
         row.enabled = settings.random_per_poly
 
+        row = layout.row()
+        row.prop(settings, "random_per_poly_seed")
+        row.enabled = settings.random_per_poly
+
 # PARENT #
 class DATABAKER_PT_ParentPanel(bpy.types.Panel):
     bl_idname = "DATABAKER_PT_parentpanel"
@@ -2693,9 +2709,8 @@ def draw_info_panel_multipliers(context, layout):
 
     box = layout.box()
 
-    pos_multiplier = get_position_data_needs_multiplier(context)
-    parent_pos_multiplier = get_parent_position_data_needs_multiplier(context)
-    shapekey_offset_multiplier = get_shapekey_offset_data_needs_multiplier(context)
+    from .Functions import get_bake_multiplier_needs # loaded on first use, see auto_load
+    pos_multiplier, parent_pos_multiplier, shapekey_offset_multiplier = get_bake_multiplier_needs(context)
 
     if pos_multiplier or parent_pos_multiplier or shapekey_offset_multiplier:
         box.label(text="MULTIPLIERS", icon="INFO")
@@ -2743,6 +2758,7 @@ class DATABAKER_PT_InfoPanel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
+        from .Functions import get_bake_info # loaded on first use, see auto_load
         info_uv, info_vcol, info_normal = get_bake_info(context)
         
         draw_info_panel_uvs(context, layout, info_uv)
@@ -2806,6 +2822,35 @@ class DATABAKER_PT_MeshUVPanel(bpy.types.Panel):
         row = layout.row()
         row.prop(settings, "invert_v")
 
+class DATABAKER_PT_MeshColorPanel(bpy.types.Panel):
+    bl_idname = "DATABAKER_PT_meshcolorpanel"
+    bl_parent_id = "DATABAKER_PT_meshmainpanel"
+    bl_label = "Color"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Game Tools"
+    bl_order = 3
+    
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        settings = scene.DataBakerSettings
+
+        row = layout.row()
+        row.prop(settings, "color_attribute_name", text="Name")
+
+        row = layout.row()
+        row.prop(settings, "color_attribute_domain")
+        # per vertex colors only keep one of the values random per poly writes to the corners of a vertex
+        if settings.color_attribute_domain == "POINT" and settings.random_per_poly and settings.random_per_poly_mode == "VCOL":
+            row = layout.row()
+            row.label(text="Random per poly needs the Face Corner domain", icon="ERROR")
+
+        row = layout.row()
+        row.prop(settings, "color_attribute_type")
+
 class DATABAKER_PT_MeshAdvPanel(bpy.types.Panel):
     bl_idname = "DATABAKER_PT_meshadvpanel"
     bl_parent_id = "DATABAKER_PT_meshmainpanel"
@@ -2836,6 +2881,19 @@ class DATABAKER_PT_MeshAdvPanel(bpy.types.Panel):
         row.prop(settings, "clean_bake")
         row.enabled = settings.duplicate_mesh
 
+        row = layout.row()
+        row.prop(settings, "incremental_bake")
+
+        if settings.incremental_bake:
+            from .Functions import get_incremental_bake_blockers # loaded on first use, see auto_load
+            blockers = get_incremental_bake_blockers(context)
+            if blockers:
+                row = layout.row()
+                row.label(text="Full bake: " + ", ".join(blockers), icon="INFO")
+
+        row = layout.row()
+        row.prop(settings, "memory_budget")
+
 class DATABAKER_PT_MeshExportPanel(bpy.types.Panel):
     bl_idname = "DATABAKER_PT_meshexportpanel"
     bl_parent_id = "DATABAKER_PT_meshmainpanel"
@@ -2959,17 +3017,22 @@ class DATABAKER_PT_ReportPanel(bpy.types.Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.DataBakerReport.baked
+        report = context.scene.DataBakerReport
+        return report.baked or report.estimated
     
     def draw(self, context):
         layout = self.layout
         scene = context.scene
         report = scene.DataBakerReport
 
-        if report.baked:
+        row = layout.row()
+        row.operator("gametools.databaker_clear_report")
+        row.scale_y = 2.0
+
+        if not report.baked:
             row = layout.row()
-            row.operator("gametools.databaker_clear_report")
-            row.scale_y = 2.0
+            row.label(text="Dry run", icon="INFO")
+            return
 
         row = layout.row()
         if report.success:
@@ -3009,6 +3072,10 @@ class DATABAKER_PT_ReportMeshPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.DataBakerReport.baked
+
     def draw_header(self, context):
         report = context.scene.DataBakerReport
         row = self.layout.row(align=True)
@@ -3061,6 +3128,10 @@ class DATABAKER_PT_ReportXMLPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.DataBakerReport.baked
+
     def draw_header(self, context):
         report = context.scene.DataBakerReport
         row = self.layout.row(align=True)
@@ -3080,6 +3151,95 @@ class DATABAKER_PT_ReportXMLPanel(bpy.types.Panel):
         else:
             row.label(text="Not exported", icon="X")
 
+class DATABAKER_PT_ReportTimingsPanel(bpy.types.Panel):
+    bl_idname = "DATABAKER_PT_infotimingspanel"
+    bl_parent_id = "DATABAKER_PT_reportpanel"
+    bl_label = "Timings"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Game Tools"
+    bl_order = 15
+
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.DataBakerReport.baked
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        report = scene.DataBakerReport
+
+        row = layout.row()
+        row.label(text="Total: %0.3fs" % report.total_time, icon="TIME")
+
+        for report_timing in report.timings:
+            box = layout.box()
+
+            row = box.row()
+            row.label(text=report_timing.name)
+            row.label(text="%0.3fs" % report_timing.time)
+
+            row = box.row()
+            row.label(text="Meshes: " + str(report_timing.meshes))
+            row.label(text="Loops: " + str(report_timing.loops))
+            row.enabled = False
+
+            row = box.row()
+            row.label(text="UV Layers: " + str(report_timing.uv_layers))
+            row.label(text="Writes: " + str(report_timing.bake_data_calls))
+            row.enabled = False
+
+class DATABAKER_PT_ReportEstimatePanel(bpy.types.Panel):
+    bl_idname = "DATABAKER_PT_infoestimatepanel"
+    bl_parent_id = "DATABAKER_PT_reportpanel"
+    bl_label = "Estimate"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Game Tools"
+    bl_order = 1
+
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.DataBakerReport.estimated
+
+    def draw_header(self, context):
+        report = context.scene.DataBakerReport
+        row = self.layout.row(align=True)
+        if report.estimate_over_budget:
+            row.label(text="", icon="ERROR")
+        else:
+            row.label(text="", icon="CHECKMARK")
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        report = scene.DataBakerReport
+
+        # bakes under a memory budget only project memory
+        if report.estimate_time > 0.0:
+            row = layout.row()
+            row.label(text="Time: %0.1fs" % report.estimate_time, icon="TIME")
+
+        row = layout.row()
+        row.label(text="Memory: %0.1f MB" % report.estimate_memory, icon="MEMORY")
+        if report.estimate_over_budget:
+            row = layout.row()
+            row.label(text="Over the memory budget (%d MB)" % scene.DataBakerSettings.memory_budget, icon="ERROR")
+
+        layout.separator()
+
+        row = layout.row()
+        row.label(text="Meshes: " + str(report.estimate_meshes))
+        row.label(text="Empties: " + str(report.estimate_empties))
+
+        row = layout.row()
+        row.label(text="Loops: " + str(report.estimate_loops))
+        row.label(text="New UV Layers: " + str(report.estimate_uv_layers))
+
 class DATABAKER_PT_ReportUnitPanel(bpy.types.Panel):
     bl_idname = "DATABAKER_PT_infounitpanel"
     bl_parent_id = "DATABAKER_PT_reportpanel"
@@ -3091,6 +3251,10 @@ class DATABAKER_PT_ReportUnitPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.DataBakerReport.baked
+
     def draw(self, context):
         layout = self.layout
         scene = context.scene
@@ -12,7 +12,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
+import sys
 
+from bpy.app.handlers import persistent
 from bpy.props import PointerProperty, BoolProperty, FloatProperty, EnumProperty, StringProperty, IntProperty, CollectionProperty, FloatVectorProperty
 from bpy.types import PropertyGroup
 
@@ -163,6 +165,11 @@ class DATABAKER_PG_SettingsPropertyGroup(PropertyGroup):
         ("OFFSET_PACKED", "Packed with Offset", "XYZ axis components are packed into the fractional part of the position XYZ components which are thus rounded to integers which *MAY* be an issue depending on the scene scale/exported scale. If positions are stored in centimeters, then precision loss is <1cm which is normally no big deal in-engine. There's very little to no reason NOT to choose this option in case you do bake position's XYZ component *individually* because axis is packed and unpacked in the position data with pretty much no side-effect, besides rounding")
     ]
     shapekey_normal_channel_mode: EnumProperty(name="Mode", items=shapekey_normal_channels, default=0, description="Select how the normal is baked")
+    shapekey_normal_sources = [
+        ("EVALUATED", "Evaluated", "Enable the shapekey and read the normals of the evaluated mesh. Takes modifiers into account but re-evaluates every mesh" ),
+        ("COMPUTED", "Computed", "Compute area weighted normals straight from the shapekey coordinates. Much faster on dense meshes but modifiers are ignored and normals may slightly differ from Blender's own"),
+    ]
+    shapekey_normal_source: EnumProperty(name="Source", items=shapekey_normal_sources, default=0, description="Select how the shapekey normals are obtained")
 
     shapekey_normal_x: BoolProperty(name="X", default=True, description="Bake the shapekey's offset X component")
     shapekey_normal_x_mode: EnumProperty(name="Mode", items=modes, default=0, description="How is the X component baked?")
@@ -256,6 +263,7 @@ class DATABAKER_PG_SettingsPropertyGroup(PropertyGroup):
     random_per_poly_uv_channel: EnumProperty(name="Channel", items=uv, default=0, description="Target UVMap channel")
     random_per_poly_rgba: EnumProperty(name="Channel", items=rgba, default=0, description="Target RGBA channel")
     random_per_poly_uniform: FloatProperty(name="Uniform", min=0.0, max=1.0, default=1.0, description="False for total randomness. True to ensure the whole [0:1] range is evenly used & distributed amongst selection (101 polygons > random values: 0.00, 0.01, 0.02, ..., 1.0). This DUPLICATES ALL VERTICES!")
+    random_per_poly_seed: IntProperty(name="Seed", min=0, default=0, description="Seed of the random generator. The same seed & selection always bake the same values")
 
     # parent
     parent_modes = [
@@ -361,6 +369,8 @@ class DATABAKER_PG_SettingsPropertyGroup(PropertyGroup):
     make_single_user: BoolProperty(name="Make Single-User", default=True, description="Bake might *not* proceed as expected if this option is False but the choice is yours. Linked meshes might lead to issues: UVs might be shared across objects yet bake might requires unique UVs per object. Disable at your own risk")
     merge_mesh: BoolProperty(name="Merge", default=True, description="Merge baked meshes. Safe to enable IF 'Duplicate' option is True, else use at your own risk")
     clean_bake: BoolProperty(name="Clean", default=True, description="Clean empties that were part of the bake process and duplicated (child/parent hierarchy, axis etc.). Only relevant IF 'Duplicate' option is True")
+    incremental_bake: BoolProperty(name="Incremental", default=False, description="Only bake meshes whose content (geometry, transforms, parents, shapekeys, settings...) changed since the last bake and reuse the previously baked data for the others. Features depending on the whole selection (multipliers, random values, selection-wide masks) force a full bake")
+    memory_budget: IntProperty(name="Memory Budget", min=0, default=0, description="Maximum memory in megabytes a bake is projected to use, see the Estimate button. Bakes projected to use more refuse to start. 0 for no budget")
     mesh_name: StringProperty(name="Name", default="BakedMesh.DATA", description="Merged object's name")
     scale: FloatProperty(name="Scale", min=0.001, default=100.0, description="Scaling factor. Defaults to 100 to go from 1 Blender unit (meter) to 1 UE unit (centimeter)")
     invert_x: BoolProperty(name="Invert X", default=False, description="Invert world X axis (must be False for UE)")
@@ -378,6 +388,19 @@ class DATABAKER_PG_SettingsPropertyGroup(PropertyGroup):
     uvmap_name: StringProperty(name="UVMap Name", default="UVMap.BakedData", description="UVMap to get or create for setting up the mesh UVs")
     invert_v: BoolProperty(name="Invert V", default=True, description="Invert UVMap's V axis & flip VAT texture(s) upside down (typically True for exporting to UE or DirectX apps in general, False for Unity or OpenGL apps in general)")
 
+    color_attribute_name: StringProperty(name="Color Attribute Name", default="", description="Color attribute to get or create for vertex color data. Defaults to the active color attribute")
+    color_attribute_domains = [
+        ("AUTO", "Auto", "Point, unless a feature baked to vertex color varies per face corner (random per poly)"),
+        ("POINT", "Point", "One color per vertex. Per-object and per-vertex data don't need more and it takes a fraction of the memory"),
+        ("CORNER", "Face Corner", "One color per face corner, like legacy vertex colors")
+    ]
+    color_attribute_domain: EnumProperty(name="Domain", items=color_attribute_domains, default=0, description="Select where vertex color data is stored when the color attribute is created. Existing color attributes keep their domain")
+    color_attribute_types = [
+        ("BYTE_COLOR", "Byte", "8 bits per channel"),
+        ("FLOAT_COLOR", "Float", "32 bits per channel")
+    ]
+    color_attribute_type: EnumProperty(name="Type", items=color_attribute_types, default=0, description="Select the precision of vertex color data when the color attribute is created. Existing color attributes keep their type")
+
     # xml
     export_xml: BoolProperty(name="Export", default=True, description="True to export an XML file containing informations relative to the bake (recommended)")
     export_xml_modes = [
@@ -389,11 +412,44 @@ class DATABAKER_PG_SettingsPropertyGroup(PropertyGroup):
     export_xml_file_path: StringProperty(name="Path", default="//", description="XML file path, not including file name", subtype='FILE_PATH')
     export_xml_override: BoolProperty(name="Override", default=True, description="True to override any existing .xml file")
 
+# incremented whenever a setting changes, through undo & file loads too, so data derived from settings (bake info...) can be cached between redraws
+settings_version = 0
+
+def update_settings_version(self, context):
+    """ """
+    global settings_version
+    settings_version += 1
+
+@persistent
+def update_settings_version_handler(*args):
+    """ Undo, redo & file loads change settings without calling their update callbacks """
+    global settings_version
+    settings_version += 1
+
+@persistent
+def clear_baked_layers_handler(*args):
+    """ Layers stored by an incremental bake belong to the file they were baked in. Functions is only cleared if it was loaded, see auto_load """
+    functions = sys.modules.get(__package__ + ".Functions")
+    if functions is not None:
+        functions.clear_baked_layers()
+
+for settings_prop in DATABAKER_PG_SettingsPropertyGroup.__annotations__.values():
+    settings_prop.keywords.setdefault("update", update_settings_version)
+
 class DATABAKER_PG_ReportAnimPropertyGroup(PropertyGroup):
     """ """
     ID: StringProperty(name="ID", default="", description="")
     name: StringProperty(name="Name", default="", description="")
 
+class DATABAKER_PG_ReportTimingPropertyGroup(PropertyGroup):
+    """ """
+    name: StringProperty(name="Stage", default="", description="")
+    time: FloatProperty(name="Time", default=0.0, description="Wall time in seconds")
+    meshes: IntProperty(name="Meshes", default=0, description="Meshes processed")
+    loops: IntProperty(name="Loops", default=0, description="Loops written")
+    uv_layers: IntProperty(name="UV Layers", default=0, description="UV layers created")
+    bake_data_calls: IntProperty(name="Writes", default=0, description="bake_data calls")
+
 class DATABAKER_PG_ReportPropertyGroup(PropertyGroup):
     """ """
     baked: BoolProperty(name="Baked", default=False, description="")
@@ -424,6 +480,19 @@ class DATABAKER_PG_ReportPropertyGroup(PropertyGroup):
 
     meshes_count: IntProperty(name="Meshes", default=0, description="")
     empties_count: IntProperty(name="Empties", default=0, description="")
+    reused_meshes_count: IntProperty(name="Reused", default=0, description="Meshes whose previously baked data was reused")
+
+    estimated: BoolProperty(name="Estimated", default=False, description="")
+    estimate_meshes: IntProperty(name="Meshes", default=0, description="")
+    estimate_empties: IntProperty(name="Empties", default=0, description="")
+    estimate_loops: IntProperty(name="Loops", default=0, description="")
+    estimate_uv_layers: IntProperty(name="UV Layers", default=0, description="UV layers to create")
+    estimate_memory: FloatProperty(name="Memory", default=0.0, description="Projected memory in megabytes")
+    estimate_time: FloatProperty(name="Time", default=0.0, description="Projected wall time in seconds")
+    estimate_over_budget: BoolProperty(name="Over Budget", default=False, description="")
+
+    timings: CollectionProperty(type=DATABAKER_PG_ReportTimingPropertyGroup)
+    total_time: FloatProperty(name="Total", default=0.0, description="")
 
 
     # transform_obj: PointerProperty(type=bpy.types.Object, name="Object", description="")
@@ -744,11 +813,23 @@ class DATABAKER_PG_ReportPropertyGroup(PropertyGroup):
     xml_path: StringProperty(name="Filepath", default="//", description="", subtype='FILE_PATH')
 
 
+SETTINGS_VERSION_HANDLERS = (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post)
+
 def register():
     bpy.types.Scene.DataBakerSettings = PointerProperty(type=DATABAKER_PG_SettingsPropertyGroup)
     bpy.types.Scene.DataBakerReport = PointerProperty(type=DATABAKER_PG_ReportPropertyGroup)
 
+    for handlers in SETTINGS_VERSION_HANDLERS:
+        handlers.append(update_settings_version_handler)
+    bpy.app.handlers.load_post.append(clear_baked_layers_handler)
+
 def unregister():
+    for handlers in SETTINGS_VERSION_HANDLERS:
+        if update_settings_version_handler in handlers:
+            handlers.remove(update_settings_version_handler)
+    if clear_baked_layers_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_baked_layers_handler)
+
     del bpy.types.Scene.DataBakerSettings
     del bpy.types.Scene.DataBakerReport
     
\ No newline at end of file
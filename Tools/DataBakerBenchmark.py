@@ -0,0 +1,309 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless DataBaker benchmark. Builds synthetic scenes, bakes them and times every stage of the bake.
+
+Usage:
+    blender -b --factory-startup --python Tools/DataBakerBenchmark.py -- [options]
+
+Options:
+    --objects 1 1000 10000      object counts to benchmark
+    --loops 64                  loops per object
+    --depths 1 4                hierarchy depths to benchmark
+    --no-shapekeys              don't add shapekeys to the synthetic meshes
+    --output results.json       where to write the results
+    --baseline baseline.json    fail if a stage is slower than the baseline
+    --write-baseline            write the results to the baseline file instead of comparing against it
+    --tolerance 0.25            allowed relative slowdown before a stage is considered a regression
+    --min-delta 0.05            slowdowns below this many seconds are considered noise
+    --no-memory                 skip the second, traced bake measuring the peak python memory of every scene
+    --startup-budget 0.5        also fail if registering the add-on takes longer than this many seconds, see Tools/DataBakerStartup.py to check it alone
+    --startup-runs 5            fresh Blender processes to measure registration in, the fastest one counts
+"""
+
+import bpy
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+import numpy as np
+
+try:
+    import resource # not available on Windows
+except ImportError:
+    resource = None
+
+# make the addon importable when running straight from the repository
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from DataBaker import Functions
+from DataBakerCommon import register_properties
+from DataBakerStartup import measure_startup, get_startup_regressions
+
+##############
+### SCENES ###
+def build_template_mesh(loop_count, shapekeys):
+    """ Build a grid of quads holding roughly loop_count loops, with an optional 'Key 1' shapekey """
+
+    quad_count = max(loop_count // 4, 1)
+    grid_size = max(int(math.ceil(math.sqrt(quad_count))), 1)
+
+    vertices = [(x / grid_size, y / grid_size, 0.0) for y in range(grid_size + 1) for x in range(grid_size + 1)]
+    faces = []
+    for quad_index in range(quad_count):
+        x = quad_index % grid_size
+        y = quad_index // grid_size
+        corner = y * (grid_size + 1) + x
+        faces.append((corner, corner + 1, corner + grid_size + 2, corner + grid_size + 1))
+
+    mesh = bpy.data.meshes.new("DataBakerBenchmark")
+    mesh.from_pydata(vertices, [], faces)
+    mesh.update()
+
+    if shapekeys:
+        obj = bpy.data.objects.new("DataBakerBenchmarkTemplate", mesh)
+        obj.shape_key_add(name="Basis")
+        shapekey = obj.shape_key_add(name="Key 1")
+
+        coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", coords)
+        coords = coords.reshape(-1, 3)
+        coords[:, 2] += np.sin(coords[:, 0] * math.pi) * 0.25 # bend the grid
+        shapekey.data.foreach_set("co", coords.ravel())
+
+        bpy.data.objects.remove(obj)
+
+    return mesh
+
+def build_scene(object_count, loop_count, depth, shapekeys):
+    """ Reset the file and build a scene of object_count meshes parented in chains of depth objects """
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    context = bpy.context
+
+    template = build_template_mesh(loop_count, shapekeys)
+    collection = context.scene.collection
+
+    objs = []
+    row_size = max(int(math.ceil(math.sqrt(object_count))), 1)
+    for obj_index in range(object_count):
+        obj = bpy.data.objects.new("DataBakerBenchmark.%d" % obj_index, template.copy())
+        collection.objects.link(obj)
+
+        if obj_index % depth:
+            obj.parent = objs[obj_index - 1]
+            obj.location = (0.0, 0.0, 1.0)
+            obj.rotation_euler = (0.0, 0.0, 0.3)
+        else:
+            obj.location = ((obj_index % row_size) * 2.0, (obj_index // row_size) * 2.0, 0.0)
+
+        objs.append(obj)
+
+    context.view_layer.update()
+
+    for obj in objs:
+        obj.select_set(True)
+    context.view_layer.objects.active = objs[0]
+
+    return objs
+
+def setup_settings(context, depth, output_dir):
+    """ Enable every bake feature """
+
+    settings = context.scene.DataBakerSettings
+
+    settings.position = True
+    settings.axis = True
+    settings.shapekey_offset = True
+    settings.shapekey_normal = True
+    settings.linear_mask = True
+    settings.sphere_mask = True
+    settings.random_per_collection = True
+    settings.random_per_object = True
+    settings.random_per_poly = True
+    settings.parent_position = True
+    settings.parent_axis = True
+    settings.parent_max_depth = min(max(depth, 1), 7)
+    settings.fixed_value = True
+    settings.direction = True
+
+    settings.export_mesh = True
+    settings.export_mesh_file_path = output_dir
+    settings.export_xml = False
+
+############
+### BAKE ###
+def run_bake(context):
+    """ Bake through DataBaker's own bake() and return the timing of each stage it reported """
+
+    success, verbose, msg = Functions.bake(context)
+    if not success:
+        raise RuntimeError("Bake failed: %s" % msg)
+
+    stages = {}
+    for timing in context.scene.DataBakerReport.timings:
+        stages[timing.name] = {
+            "time": timing.time,
+            "meshes": timing.meshes,
+            "loops": timing.loops,
+            "uv_layers": timing.uv_layers,
+            "bake_data_calls": timing.bake_data_calls,
+        }
+    return stages
+
+def measure_bake_memory(context):
+    """ Bake again and return the peak memory traced by python. Tracing slows python down unevenly, so it's kept out of the timed bake """
+
+    tracemalloc.start()
+    try:
+        run_bake(context)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+#################
+### BENCHMARK ###
+def get_peak_rss():
+    """ Peak resident memory of the process in bytes, or None if unknown """
+
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024 # bytes on macOS, kilobytes elsewhere
+
+def run_benchmark(args):
+    """ """
+
+    results = {
+        "blender": bpy.app.version_string,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scenes": {},
+    }
+
+    output_dir = tempfile.mkdtemp(prefix="databaker_benchmark_")
+
+    for object_count in args.objects:
+        for depth in args.depths:
+            scene_name = "objects_%d_loops_%d_depth_%d" % (object_count, args.loops, depth)
+            print("DataBaker benchmark: %s" % scene_name)
+
+            build_scene(object_count, args.loops, depth, not args.no_shapekeys)
+            register_properties()
+            setup_settings(bpy.context, depth, output_dir)
+
+            start_time = time.perf_counter()
+            stages = run_bake(bpy.context)
+
+            results["scenes"][scene_name] = {
+                "objects": object_count,
+                "loops_per_object": args.loops,
+                "depth": depth,
+                "time": time.perf_counter() - start_time,
+                "stages": stages,
+                "peak_memory": None,
+            }
+
+            # separate pass on a fresh scene, see measure_bake_memory
+            if not args.no_memory:
+                build_scene(object_count, args.loops, depth, not args.no_shapekeys)
+                setup_settings(bpy.context, depth, output_dir)
+                results["scenes"][scene_name]["peak_memory"] = measure_bake_memory(bpy.context)
+
+    results["peak_rss"] = get_peak_rss()
+    results["startup"] = measure_startup(args.startup_runs) if args.startup_budget is not None else None
+    return results
+
+def compare_to_baseline(results, baseline, tolerance, min_delta):
+    """ Return the list of stages slower than the baseline """
+
+    regressions = []
+    for scene_name, scene in results["scenes"].items():
+        baseline_scene = baseline.get("scenes", {}).get(scene_name)
+        if baseline_scene is None:
+            continue
+
+        for stage_name, stage in scene["stages"].items():
+            baseline_stage = baseline_scene["stages"].get(stage_name)
+            if baseline_stage is None:
+                continue
+
+            if stage["time"] > baseline_stage["time"] * (1.0 + tolerance) and (stage["time"] - baseline_stage["time"]) > min_delta:
+                regressions.append("%s / %s: %0.3fs, baseline %0.3fs" % (scene_name, stage_name, stage["time"], baseline_stage["time"]))
+
+    return regressions
+
+def parse_args():
+    """ Parse the arguments given after '--' """
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="DataBakerBenchmark")
+    parser.add_argument("--objects", type=int, nargs="+", default=[1, 1000, 10000])
+    parser.add_argument("--loops", type=int, default=64)
+    parser.add_argument("--depths", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--no-shapekeys", action="store_true")
+    parser.add_argument("--output", default="databaker_benchmark.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--write-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta", type=float, default=0.05)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--startup-budget", type=float, default=None)
+    parser.add_argument("--startup-runs", type=int, default=5)
+    return parser.parse_args(argv)
+
+def main():
+    """ """
+
+    args = parse_args()
+    results = run_benchmark(args)
+
+    with open(args.output, "w") as output_file:
+        json.dump(results, output_file, indent=2)
+    print("DataBaker benchmark: results written to %s" % args.output)
+
+    # a baseline is recorded whatever the startup time of this machine
+    if args.baseline is not None and args.write_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print("DataBaker benchmark: baseline written to %s" % args.baseline)
+
+    regressions = []
+
+    startup = results["startup"]
+    if startup is not None:
+        print("DataBaker benchmark: add-on registered in %0.3fs (budget %0.3fs)" % (startup["time"], args.startup_budget))
+        regressions.extend("startup %s" % regression for regression in get_startup_regressions(startup, args.startup_budget))
+
+    if args.baseline is not None and not args.write_baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions.extend(compare_to_baseline(results, baseline, args.tolerance, args.min_delta))
+
+    for regression in regressions:
+        print("DataBaker benchmark: REGRESSION %s" % regression)
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
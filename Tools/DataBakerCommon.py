@@ -0,0 +1,66 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Helpers shared by the DataBaker tools. Importable without Blender: bpy is only imported by the helpers needing it.
+"""
+
+import os
+import json
+
+################
+### MANIFEST ###
+def load_manifest(manifest_path):
+    """ Load a JSON or TOML manifest and return its jobs, with defaults applied and blend paths made absolute, see Tools/DataBakerJobs.py """
+
+    if manifest_path.lower().endswith(".toml"):
+        import tomllib
+        with open(manifest_path, "rb") as manifest_file:
+            manifest = tomllib.load(manifest_file)
+    else:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    defaults = manifest.get("defaults", {})
+
+    jobs = []
+    for job_index, job in enumerate(manifest.get("jobs", [])):
+        job = dict(defaults, **job)
+        job["settings"] = dict(defaults.get("settings", {}), **job.get("settings", {}))
+
+        if "blend" not in job:
+            raise ValueError("Job %d has no blend file" % job_index)
+        job["blend"] = os.path.normpath(os.path.join(manifest_dir, job["blend"]))
+        job.setdefault("name", os.path.splitext(os.path.basename(job["blend"]))[0])
+
+        jobs.append(job)
+
+    return jobs
+
+################
+### SETTINGS ###
+def register_properties():
+    """ Register the DataBaker settings, unless the addon is already enabled. Needs Blender & the repository in sys.path """
+
+    import bpy
+    from DataBaker import Properties
+
+    if hasattr(bpy.types.Scene, "DataBakerSettings"):
+        return
+
+    for cls in vars(Properties).values():
+        if isinstance(cls, type) and issubclass(cls, bpy.types.PropertyGroup) and cls.__module__ == Properties.__name__:
+            bpy.utils.register_class(cls)
+
+    Properties.register()
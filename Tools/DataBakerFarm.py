@@ -0,0 +1,256 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+DataBaker bake farm. Shards jobs across several background Blender processes, each one running Tools/DataBakerJobs.py, and gathers their reports.
+Runs with a regular python interpreter, not from Blender.
+
+Usage:
+    python Tools/DataBakerFarm.py --manifest manifest.json [options]
+    python Tools/DataBakerFarm.py --blend big.blend --preset MyPreset [options]
+
+Options:
+    --manifest manifest.json    jobs to bake, see Tools/DataBakerJobs.py
+    --blend big.blend           bake every collection of the scene's root collection as its own job
+    --preset MyPreset           preset of the --blend jobs
+    --mesh-path //export/       export_mesh_file_path of the --blend jobs
+    --xml-path //export/        export_xml_file_path of the --blend jobs
+    --blender blender           Blender executable
+    --workers 4                 concurrent Blender processes, defaults to the number of CPU cores
+    --shard-size 0              jobs per worker process, 0 splits jobs evenly across workers
+    --retries 1                 times a failed job is retried, alone in its own worker
+    --timeout 0                 seconds before a worker is killed, 0 to never time out
+    --report farm.json          where to write the summary
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from DataBakerCommon import load_manifest
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+JOBS_SCRIPT = os.path.join(TOOLS_DIR, "DataBakerJobs.py")
+
+COLLECTIONS_TAG = "DATABAKER_COLLECTIONS:"
+
+############
+### JOBS ###
+def get_blend_collections(blender, blend_path):
+    """ List the collections of a blend file's root collection with a short lived Blender process """
+
+    expr = "import bpy, json; print(%r + json.dumps([c.name for c in bpy.context.scene.collection.children]))" % COLLECTIONS_TAG
+    process = subprocess.run([blender, "-b", "--factory-startup", blend_path, "--python-expr", expr], capture_output=True, text=True)
+
+    for line in process.stdout.splitlines():
+        if line.startswith(COLLECTIONS_TAG):
+            return json.loads(line[len(COLLECTIONS_TAG):])
+
+    raise RuntimeError("Couldn't list the collections of %s:\n%s" % (blend_path, process.stderr))
+
+def get_blend_jobs(args):
+    """ One job per collection of --blend """
+
+    blend_path = os.path.abspath(args.blend)
+    blend_name = os.path.splitext(os.path.basename(blend_path))[0]
+
+    jobs = []
+    for collection_name in get_blend_collections(args.blender, blend_path):
+        job = {
+            "name": "%s/%s" % (blend_name, collection_name),
+            "blend": blend_path,
+            "collection": collection_name,
+            "settings": {},
+        }
+        if args.preset:
+            job["preset"] = args.preset
+        if args.mesh_path:
+            job["mesh_path"] = args.mesh_path
+        if args.xml_path:
+            job["xml_path"] = args.xml_path
+        jobs.append(job)
+
+    return jobs
+
+def make_job_names_unique(jobs):
+    """ Results are matched to their job by name """
+
+    names = set()
+    for job in jobs:
+        name = job["name"]
+        suffix = 1
+        while job["name"] in names:
+            job["name"] = "%s.%d" % (name, suffix)
+            suffix += 1
+        names.add(job["name"])
+
+##############
+### SHARDS ###
+def get_shards(jobs, workers, shard_size):
+    """ Split jobs into shards, keeping jobs of the same blend file next to each other so workers open each file once """
+
+    if shard_size <= 0:
+        shard_size = max(int(math.ceil(len(jobs) / max(workers, 1))), 1)
+
+    blend_order = list(dict.fromkeys(job["blend"] for job in jobs))
+    jobs = sorted(jobs, key=lambda job: blend_order.index(job["blend"]))
+
+    return [jobs[shard_start:shard_start + shard_size] for shard_start in range(0, len(jobs), shard_size)]
+
+def read_job_results(results_path):
+    """ Read the JSON lines a worker appended, see DataBakerJobs.append_job_result. A line cut short by a killed worker is ignored """
+
+    results = []
+    if not os.path.isfile(results_path):
+        return results
+
+    with open(results_path) as results_file:
+        for line in results_file:
+            try:
+                results.append(json.loads(line))
+            except ValueError:
+                break
+
+    return results
+
+def run_shard(blender, shard, shard_dir, shard_name, timeout):
+    """
+    Bake a shard in its own Blender process.
+
+    :return: results of the shard's jobs, jobs without a result failed with the worker
+    :rtype: list
+    """
+    manifest_path = os.path.join(shard_dir, shard_name + ".json")
+    report_path = os.path.join(shard_dir, shard_name + ".report.json")
+    results_path = os.path.join(shard_dir, shard_name + ".results.jsonl")
+    log_path = os.path.join(shard_dir, shard_name + ".log")
+
+    with open(manifest_path, "w") as manifest_file:
+        json.dump({"jobs": shard}, manifest_file, indent=2)
+
+    command = [blender, "-b", "--factory-startup", "--python", JOBS_SCRIPT, "--", manifest_path, "--report", report_path, "--results", results_path]
+
+    worker_msg = ""
+    with open(log_path, "w") as log_file:
+        try:
+            subprocess.run(command, stdout=log_file, stderr=subprocess.STDOUT, timeout=timeout if timeout > 0 else None)
+        except subprocess.TimeoutExpired:
+            worker_msg = "Worker timed out after %ds, see %s" % (timeout, log_path)
+
+    # results are written as each job completes, jobs finished before a timeout or crash are kept
+    results = read_job_results(results_path)
+
+    # jobs the worker never reported, because it timed out or crashed
+    reported_names = {result["name"] for result in results}
+    for job in shard:
+        if job["name"] not in reported_names:
+            results.append({
+                "name": job["name"],
+                "blend": job["blend"],
+                "success": False,
+                "msg": worker_msg or "Worker exited without reporting the job, see %s" % log_path,
+                "time": 0.0,
+                "report": None,
+            })
+
+    return results
+
+def run_farm(args, jobs):
+    """ Run every job across the workers, retrying failed jobs alone in their own worker """
+
+    shard_dir = tempfile.mkdtemp(prefix="databaker_farm_")
+    print("DataBaker farm: %d jobs, %d workers, logs in %s" % (len(jobs), args.workers, shard_dir))
+
+    results = {}
+    attempts = {job["name"]: 0 for job in jobs}
+
+    shards = get_shards(jobs, args.workers, args.shard_size)
+    while shards:
+        shard_names = ["shard%d_attempt%d" % (shard_index, attempts[shard[0]["name"]]) for shard_index, shard in enumerate(shards)]
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            shard_results = list(executor.map(lambda shard, shard_name: run_shard(args.blender, shard, shard_dir, shard_name, args.timeout), shards, shard_names))
+
+        # retry failed jobs one per worker, so a faulty job can't take others down with it
+        failed_jobs = []
+        for shard, shard_result in zip(shards, shard_results):
+            for result in shard_result:
+                attempts[result["name"]] += 1
+                result["attempts"] = attempts[result["name"]]
+                results[result["name"]] = result
+
+            for job in shard:
+                if not results[job["name"]]["success"] and attempts[job["name"]] <= args.retries:
+                    print("DataBaker farm: retrying %s" % job["name"])
+                    failed_jobs.append(job)
+
+        shards = [[job] for job in failed_jobs]
+
+    return [results[job["name"]] for job in jobs]
+
+def parse_args():
+    """ """
+
+    parser = argparse.ArgumentParser(prog="DataBakerFarm")
+    parser.add_argument("--manifest", default=None)
+    parser.add_argument("--blend", default=None)
+    parser.add_argument("--preset", default=None)
+    parser.add_argument("--mesh-path", default=None)
+    parser.add_argument("--xml-path", default=None)
+    parser.add_argument("--blender", default="blender")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--shard-size", type=int, default=0)
+    parser.add_argument("--retries", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=0)
+    parser.add_argument("--report", default="databaker_farm.json")
+
+    args = parser.parse_args()
+    if (args.manifest is None) == (args.blend is None):
+        parser.error("either --manifest or --blend is required")
+
+    return args
+
+def main():
+    """ """
+
+    args = parse_args()
+
+    jobs = load_manifest(args.manifest) if args.manifest else get_blend_jobs(args)
+    make_job_names_unique(jobs)
+
+    start_time = time.perf_counter()
+    results = run_farm(args, jobs)
+
+    summary = {
+        "time": time.perf_counter() - start_time,
+        "workers": args.workers,
+        "succeeded": sum(1 for result in results if result["success"]),
+        "failed": sum(1 for result in results if not result["success"]),
+        "bake_time": sum(result["time"] for result in results),
+        "jobs": results,
+    }
+
+    with open(args.report, "w") as report_file:
+        json.dump(summary, report_file, indent=2)
+    print("DataBaker farm: %d succeeded, %d failed in %0.1fs, summary written to %s" % (summary["succeeded"], summary["failed"], summary["time"], args.report))
+
+    return 1 if summary["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,279 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless DataBaker job runner. Bakes every job of a manifest in a single Blender session.
+
+Usage:
+    blender -b --factory-startup --python Tools/DataBakerJobs.py -- manifest.json [options]
+
+Options:
+    --report report.json        where to write the consolidated report
+    --results results.jsonl     also append each job result to this file as a JSON line as soon as the job is done
+    --jobs name1 name2          only run these jobs
+
+Manifest (JSON or TOML):
+    {
+        "defaults": { "preset": "MyPreset", "mesh_path": "//export/" },
+        "jobs": [
+            {
+                "name": "Rock",                 # defaults to the blend file name
+                "blend": "assets/rock.blend",   # relative to the manifest
+                "collection": "Bake",           # bake every object of this collection...
+                "objects": ["Rock", "Pebble"],  # ...and/or these objects, the first one being active
+                "preset": "MyPreset",           # name of a DATABAKER_MT_DataBaker_Presets preset
+                "settings": { "scale": 100.0 }, # settings overrides, pointers are object names
+                "mesh_path": "//export/",       # export_mesh_file_path
+                "mesh_file_name": "SM_<ObjectName>",  # export_mesh_file_name
+                "xml_path": "//export/",        # export_xml_file_path
+                "xml_file_name": "SM_<ObjectName>"    # export_xml_file_name
+            }
+        ]
+    }
+
+Jobs are grouped by blend file so every file is only opened once, as long as baking doesn't modify the file's objects (duplicate_mesh).
+"""
+
+import bpy
+import os
+import sys
+import json
+import time
+import argparse
+import traceback
+
+# make the addon importable when running straight from the repository
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from DataBaker import Functions
+from DataBakerCommon import load_manifest, register_properties
+
+PRESET_SUBDIR = "operator/databaker_data" # see DATABAKER_MT_DataBaker_Presets
+
+# job keys mapped to the settings they override
+OUTPUT_SETTINGS = {
+    "mesh_path": "export_mesh_file_path",
+    "mesh_file_name": "export_mesh_file_name",
+    "xml_path": "export_xml_file_path",
+    "xml_file_name": "export_xml_file_name",
+}
+
+################
+### SETTINGS ###
+def get_settings_snapshot(settings):
+    """ Return the values of every writable setting """
+
+    snapshot = {}
+    for prop in settings.bl_rna.properties:
+        if prop.identifier == "rna_type" or prop.is_readonly or prop.type == "COLLECTION":
+            continue
+        snapshot[prop.identifier] = getattr(settings, prop.identifier)
+
+    return snapshot
+
+def restore_settings_snapshot(settings, snapshot):
+    """ """
+    for identifier, value in snapshot.items():
+        setattr(settings, identifier, value)
+
+def apply_preset(preset_name):
+    """ Execute a DataBaker preset file, like picking it from the presets menu """
+
+    preset_path = bpy.utils.preset_find(preset_name, PRESET_SUBDIR)
+    if preset_path is None:
+        raise ValueError("Preset '%s' not found in %s" % (preset_name, PRESET_SUBDIR))
+
+    bpy.utils.execfile(preset_path)
+
+def apply_job_settings(settings, job):
+    """ Apply a job's preset, output paths and settings overrides """
+
+    if job.get("preset"):
+        apply_preset(job["preset"])
+
+    overrides = dict(job["settings"])
+    for job_key, setting_name in OUTPUT_SETTINGS.items():
+        if job_key in job:
+            overrides[setting_name] = job[job_key]
+
+    for setting_name, value in overrides.items():
+        prop = settings.bl_rna.properties.get(setting_name)
+        if prop is None:
+            raise ValueError("Unknown setting '%s'" % setting_name)
+
+        if prop.type == "POINTER" and isinstance(value, str):
+            value = bpy.data.objects[value]
+        elif prop.type == "ENUM" and prop.is_enum_flag:
+            value = set(value)
+
+        setattr(settings, setting_name, value)
+
+#################
+### SELECTION ###
+def select_job_objects(context, job):
+    """ Select the collection and/or objects of a job, the first one being active """
+
+    objs = []
+    if job.get("collection"):
+        collection = bpy.data.collections.get(job["collection"])
+        if collection is None:
+            raise ValueError("Collection '%s' not found" % job["collection"])
+        objs.extend(collection.all_objects)
+
+    for obj_name in job.get("objects", []):
+        obj = bpy.data.objects.get(obj_name)
+        if obj is None:
+            raise ValueError("Object '%s' not found" % obj_name)
+        if obj not in objs:
+            objs.append(obj)
+
+    if not objs:
+        raise ValueError("Job selects no object")
+
+    for obj in context.view_layer.objects:
+        obj.select_set(False)
+
+    for obj in objs:
+        obj.select_set(True)
+
+    context.view_layer.objects.active = objs[0]
+
+def remove_new_objects(existing_objs):
+    """ Remove the objects a bake added to the file, e.g. duplicated or merged meshes """
+
+    for obj in [obj for obj in bpy.data.objects if obj not in existing_objs]:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+    for mesh in [mesh for mesh in bpy.data.meshes if mesh.users == 0]:
+        bpy.data.meshes.remove(mesh)
+
+############
+### JOBS ###
+def run_job(context, job):
+    """ Bake a single job in the currently opened file and return its report """
+
+    settings = context.scene.DataBakerSettings
+    apply_job_settings(settings, job)
+    select_job_objects(context, job)
+
+    start_time = time.perf_counter()
+    success, level, msg = Functions.bake(context)
+
+    return {
+        "name": job["name"],
+        "blend": job["blend"],
+        "success": success,
+        "msg": msg,
+        "time": time.perf_counter() - start_time,
+        "report": Functions.get_bake_report_dict(context),
+    }
+
+def append_job_result(results_path, result):
+    """ Append a job result as a JSON line, so it survives the process being killed before the report is written """
+
+    with open(results_path, "a") as results_file:
+        results_file.write(json.dumps(result) + "\n")
+
+def run_jobs(jobs, results_path = None):
+    """ Run every job, opening each blend file only once when possible. Results are also appended to results_path as they complete """
+
+    results = []
+
+    # group jobs per file, keeping the manifest order otherwise
+    blend_order = list(dict.fromkeys(job["blend"] for job in jobs))
+    jobs = sorted(jobs, key=lambda job: blend_order.index(job["blend"]))
+
+    loaded_blend = None
+    file_settings = None
+    file_objs = None
+
+    for job in jobs:
+        print("DataBaker jobs: %s" % job["name"])
+
+        try:
+            if job["blend"] != loaded_blend:
+                loaded_blend = None
+                bpy.ops.wm.open_mainfile(filepath=job["blend"])
+                register_properties()
+                loaded_blend = job["blend"]
+                file_settings = get_settings_snapshot(bpy.context.scene.DataBakerSettings)
+                file_objs = set(bpy.data.objects)
+            else:
+                restore_settings_snapshot(bpy.context.scene.DataBakerSettings, file_settings)
+
+            result = run_job(bpy.context, job)
+
+            # baking in place modifies the file's objects, the next job has to reopen it
+            if bpy.context.scene.DataBakerSettings.duplicate_mesh:
+                remove_new_objects(file_objs)
+            else:
+                loaded_blend = None
+        except Exception:
+            loaded_blend = None
+            result = {
+                "name": job["name"],
+                "blend": job["blend"],
+                "success": False,
+                "msg": traceback.format_exc(),
+                "time": 0.0,
+                "report": None,
+            }
+
+        print("DataBaker jobs: %s %s" % (job["name"], "done" if result["success"] else "FAILED: " + result["msg"]))
+        results.append(result)
+        if results_path is not None:
+            append_job_result(results_path, result)
+
+    return results
+
+def parse_args():
+    """ Parse the arguments given after '--' """
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="DataBakerJobs")
+    parser.add_argument("manifest")
+    parser.add_argument("--report", default="databaker_jobs.json")
+    parser.add_argument("--results", default=None)
+    parser.add_argument("--jobs", nargs="+", default=None)
+    return parser.parse_args(argv)
+
+def main():
+    """ """
+
+    args = parse_args()
+
+    jobs = load_manifest(args.manifest)
+    if args.jobs is not None:
+        jobs = [job for job in jobs if job["name"] in args.jobs]
+
+    start_time = time.perf_counter()
+    results = run_jobs(jobs, args.results)
+
+    report = {
+        "manifest": os.path.abspath(args.manifest),
+        "time": time.perf_counter() - start_time,
+        "succeeded": sum(1 for result in results if result["success"]),
+        "failed": sum(1 for result in results if not result["success"]),
+        "jobs": results,
+    }
+
+    with open(args.report, "w") as report_file:
+        json.dump(report, report_file, indent=2)
+    print("DataBaker jobs: %d succeeded, %d failed, report written to %s" % (report["succeeded"], report["failed"], args.report))
+
+    return 1 if report["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
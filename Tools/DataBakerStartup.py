@@ -0,0 +1,181 @@
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTIBILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Headless add-on startup check. Registers the add-on in fresh Blender processes, times the registration and checks it neither
+imports a Functions module nor relies on a stale class order, see auto_load.MODULES. Also run by Tools/DataBakerBenchmark.py.
+
+Usage:
+    blender -b --factory-startup --python Tools/DataBakerStartup.py -- [options]
+
+Options:
+    --budget 0.5                fail if registering the add-on takes longer than this many seconds
+    --runs 5                    fresh Blender processes to measure registration in, the fastest one counts
+    --print-order               print auto_load.MODULES with every class sorted by its dependencies, then by bl_order, instead of checking startup
+"""
+
+import bpy
+import os
+import sys
+import json
+import argparse
+import importlib
+import subprocess
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPOSITORY_DIR)
+
+import auto_load
+
+###############
+### STARTUP ###
+STARTUP_TAG = "DATABAKER_STARTUP:"
+
+# registers the add-on like auto_load does, in a fresh Blender process. The class order is checked before registering, untimed
+STARTUP_PROBE = """
+import sys, json, time, importlib
+sys.path.insert(0, %r)
+start_time = time.perf_counter()
+
+import bpy
+import auto_load
+modules = [importlib.import_module(name) for name, class_names in auto_load.MODULES]
+
+check_start_time = time.perf_counter()
+order_errors = auto_load.get_ordered_classes_errors(modules)
+start_time += time.perf_counter() - check_start_time
+
+for cls in auto_load.get_ordered_classes(modules):
+    bpy.utils.register_class(cls)
+for module in modules:
+    if hasattr(module, "register"):
+        module.register()
+
+startup_time = time.perf_counter() - start_time
+
+print(%r + json.dumps({
+    "time": startup_time,
+    "functions_loaded": sorted(name for name in sys.modules if name.endswith(".Functions")),
+    "order_errors": order_errors,
+}))
+"""
+
+def measure_startup(runs):
+    """ Time the add-on registration in fresh Blender processes and return the fastest run """
+
+    probe = STARTUP_PROBE % (REPOSITORY_DIR, STARTUP_TAG)
+
+    startup = None
+    for run_index in range(runs):
+        process = subprocess.run([bpy.app.binary_path, "-b", "--factory-startup", "--python-expr", probe], capture_output=True, text=True)
+
+        run = None
+        for line in process.stdout.splitlines():
+            if line.startswith(STARTUP_TAG):
+                run = json.loads(line[len(STARTUP_TAG):])
+
+        if run is None:
+            raise RuntimeError("Startup probe failed:\n%s" % process.stderr)
+
+        if startup is None or run["time"] < startup["time"]:
+            startup = run
+
+    return startup
+
+def get_startup_regressions(startup, budget):
+    """ Return what's wrong with a startup run, see measure_startup """
+
+    regressions = []
+    if startup["time"] > budget:
+        regressions.append("registered in %0.3fs, over the %0.3fs budget" % (startup["time"], budget))
+    if startup["functions_loaded"]:
+        regressions.append("Functions modules loaded at registration: %s" % ", ".join(startup["functions_loaded"]))
+    regressions.extend(startup["order_errors"])
+
+    return regressions
+
+#############
+### ORDER ###
+def toposort(deps_dict):
+    """ Sort classes after their dependencies, then by bl_order. Classes keep the order of deps_dict otherwise """
+
+    sorted_list = []
+    sorted_values = set()
+    while len(deps_dict) > 0:
+        unsorted = []
+        sorted_list_sub = []  # helper for additional sorting by bl_order - in panels
+        for value, deps in deps_dict.items():
+            if len(deps) == 0:
+                sorted_list_sub.append(value)
+                sorted_values.add(value)
+            else:
+                unsorted.append(value)
+        if not sorted_list_sub:
+            raise RuntimeError("Circular class dependencies: %s" % ", ".join(cls.__name__ for cls in unsorted))
+        deps_dict = {value: deps_dict[value] - sorted_values for value in unsorted}
+        sorted_list_sub.sort(key=lambda cls: getattr(cls, "bl_order", 0))
+        sorted_list.extend(sorted_list_sub)
+    return sorted_list
+
+def get_modules_order():
+    """ Return auto_load.MODULES source, with the classes of every module sorted. Modules keep their order """
+
+    modules = [importlib.import_module(name) for name, class_names in auto_load.MODULES]
+    deps_dict = auto_load.get_register_deps_dict(modules)
+
+    lines = ["MODULES = ("]
+    for module in modules:
+        # classes in definition order, dependencies on earlier modules are already registered
+        module_classes = [value for value in module.__dict__.values() if isinstance(value, type) and value in deps_dict and value.__module__ == module.__name__]
+        module_deps_dict = {cls: deps_dict[cls] & set(module_classes) for cls in module_classes}
+
+        lines.append("    (%s, (" % json.dumps(module.__name__))
+        lines.extend("        %s," % json.dumps(cls.__name__) for cls in toposort(module_deps_dict))
+        lines.append("    )),")
+    lines.append(")")
+
+    return "\n".join(lines)
+
+############
+### MAIN ###
+def parse_args():
+    """ Parse the arguments given after '--' """
+
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(prog="DataBakerStartup")
+    parser.add_argument("--budget", type=float, default=0.5)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--print-order", action="store_true")
+    return parser.parse_args(argv)
+
+def main():
+    """ """
+
+    args = parse_args()
+
+    if args.print_order:
+        print(get_modules_order())
+        return 0
+
+    startup = measure_startup(args.runs)
+
+    print("DataBaker startup: add-on registered in %0.3fs (budget %0.3fs)" % (startup["time"], args.budget))
+    regressions = get_startup_regressions(startup, args.budget)
+    for regression in regressions:
+        print("DataBaker startup: REGRESSION %s" % regression)
+
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,6 +22,8 @@ import xml.etree.ElementTree as ET
 import uuid
 import time
 
+from ..DataBaker import Estimate
+
 #######################################################################################
 ###################################### FUNCTIONS ######################################
 #######################################################################################
@@ -100,6 +102,12 @@ def reset_bake_report():
     report.tex_normal_remapped = False
     report.tex_sampling_mode = "STACK_SINGLE"
 
+    report.estimated = False
+    report.estimate_samples = 0
+    report.estimate_memory = 0.0
+    report.estimate_time = 0.0
+    report.estimate_over_budget = False
+
     report.xml = False
     report.xml_path = ""
 
@@ -614,6 +622,15 @@ def bake(context):
         add_bake_report("msg", msg)
         return (False, 'ERROR', msg)
 
+    # refuse to start a bake that wouldn't fit in the memory budget, the time projection is left to the dry run
+    if settings.memory_budget > 0:
+        estimate = get_bake_estimate(context, objs_to_bake, num_frames, num_verts, tex_width, tex_height, include_time = False)
+        if add_bake_report_estimate(estimate, settings.memory_budget):
+            msg = Estimate.get_over_budget_message(estimate, settings.memory_budget)
+            add_bake_report("success", False)
+            add_bake_report("msg", msg)
+            return (False, 'ERROR', msg)
+
     bake_name = get_bake_name(context, active_object)
     add_bake_report("name", bake_name)
 
@@ -3461,6 +3478,198 @@ def get_best_texture_resolution(context, num_frames, num_vertices):
 
     return (True, "", tex_width, tex_height, bake_frame_height, bake_frame_width)
 
+################
+### ESTIMATE ###
+
+# a python float in a list: 8 bytes for the reference, 24 for the float object
+PYTHON_FLOAT_SIZE = 32
+
+def measure_estimate_calibration(repeat = 3):
+    """
+    Micro-benchmark the operations a bake is made of on a throwaway grid mesh & image, see Estimate.get_calibration.
+
+    :param repeat: runs per operation, the fastest one is kept
+    :return: seconds per vertex to bake one frame, seconds per pixel to remap a buffer and to generate a texture
+    :rtype: dict
+    """
+    grid = Estimate.CALIBRATION_GRID
+
+    mesh = Estimate.new_calibration_mesh("VATBaker.Calibration")
+    image = None
+    try:
+        vertex_count = len(mesh.vertices)
+
+        ref_positions = [vertex.co.copy() for vertex in mesh.vertices]
+        vertices_offsets = [0.0] * (vertex_count * 4)
+        vertices_normals = [0.0] * (vertex_count * 4)
+        signed_axis = mathutils.Vector((1.0, -1.0, 1.0))
+        signed_scale = signed_axis * 100.0
+
+        # mirrors one frame of get_animation_vertices_buffers: a mesh copy & the per vertex work
+        def bake_frame():
+            posed_mesh = mesh.copy()
+            posed_mesh.transform(mathutils.Matrix.Identity(4))
+
+            min_bounds = mathutils.Vector((float('inf'), float('inf'), float('inf')))
+            for vertex_index, vertex in enumerate(posed_mesh.vertices):
+                buffer_vertex_index = vertex_index * 4
+
+                x, y, z = (vertex.co - ref_positions[vertex.index]) * signed_scale
+                vertices_offsets[buffer_vertex_index + 0] = x
+                vertices_offsets[buffer_vertex_index + 1] = y
+                vertices_offsets[buffer_vertex_index + 2] = z
+                vertices_offsets[buffer_vertex_index + 3] = 1.0
+
+                min_bounds = mathutils.Vector((min(min_bounds.x, vertex.co.x),
+                                               min(min_bounds.y, vertex.co.y),
+                                               min(min_bounds.z, vertex.co.z)))
+
+                x, y, z = vertex.normal * signed_axis
+                vertices_normals[buffer_vertex_index + 0] = x
+                vertices_normals[buffer_vertex_index + 1] = y
+                vertices_normals[buffer_vertex_index + 2] = z
+                vertices_normals[buffer_vertex_index + 3] = 1.0
+
+            bpy.data.meshes.remove(posed_mesh)
+
+        # one pixel per vertex
+        image = bpy.data.images.new(name="VATBaker.Calibration", width=grid + 1, height=grid + 1, alpha=True, float_buffer=True)
+        image.file_format = 'OPEN_EXR'
+        pixel_count = vertex_count
+
+        def generate_pixels():
+            image.pixels = vertices_offsets
+            image.pack()
+
+        calibration = {
+            "vertex": Estimate.time_operation(bake_frame, repeat) / vertex_count,
+            "remap": Estimate.time_operation(lambda: get_remapped_vertices_normal_buffer(vertices_normals), repeat) / vertex_count,
+            "texture": Estimate.time_operation(generate_pixels, repeat) / pixel_count,
+        }
+    finally:
+        bpy.data.meshes.remove(mesh)
+        if image is not None:
+            bpy.data.images.remove(image)
+
+    return calibration
+
+def get_bake_estimate(context, objs_to_bake, num_frames, num_verts, tex_width, tex_height, include_time = True):
+    """
+    Project the memory & time of a bake from its frames, vertices & texture size. The cost of evaluating the scene is measured on the current frame.
+    Retargeting (see mesh_target_prop) isn't accounted for.
+
+    :param context: Blender current execution context
+    :param objs_to_bake: objects to bake
+    :param num_frames: amount of frames to bake, padding included
+    :param num_verts: amount of vertices to bake per frame
+    :param tex_width: VAT texture(s) width
+    :param tex_height: VAT texture(s) height
+    :param include_time: False to skip the time projection, its calibration & the scene evaluation it measures
+    :return: frames, vertices, samples (frames x vertices), texture size, projected memory in bytes, projected time in seconds or None
+    :rtype: dict
+    """
+    settings = context.scene.VATBakerSettings
+
+    num_pixels = int(tex_width * tex_height)
+    num_textures = (1 if settings.offset_tex else 0) + (1 if settings.normal_tex else 0)
+    num_remaps = (1 if settings.offset_tex_remap else 0) + (1 if settings.normal_tex_remap else 0)
+
+    ##########
+    # MEMORY #
+
+    # offset & normal buffers are python lists of RGBA floats, images hold RGBA float32 pixels
+    memory = 2 * num_pixels * 4 * PYTHON_FLOAT_SIZE
+    if settings.invert_v:
+        memory += 2 * num_pixels * 4 * 8 # inverted copies reference the same floats
+    memory += num_textures * num_pixels * 4 * 4
+
+    ########
+    # TIME #
+
+    bake_time = None
+    if include_time:
+        calibration = Estimate.get_calibration("VATBaker", measure_estimate_calibration)
+
+        # every object is evaluated on every frame when baking an animation
+        frame_evaluations = 0
+        if settings.bake_mode == 'ANIMATION':
+            frame_evaluations = num_frames * len(objs_to_bake)
+            frame_time = Estimate.time_operation(lambda: context.scene.frame_set(context.scene.frame_current), 1)
+        else: # settings.bake_mode == 'MESHSEQUENCE'
+            frame_time = 0.0
+
+        bake_time = frame_evaluations * frame_time
+        bake_time += num_frames * num_verts * calibration["vertex"]
+        bake_time += num_pixels * num_remaps * calibration["remap"]
+        bake_time += num_pixels * num_textures * calibration["texture"]
+
+    return {
+        "frames": num_frames,
+        "vertices": num_verts,
+        "samples": num_frames * num_verts,
+        "tex_width": int(tex_width),
+        "tex_height": int(tex_height),
+        "memory": memory,
+        "time": bake_time,
+    }
+
+def add_bake_report_estimate(estimate, memory_budget):
+    """
+    Add an estimate to the report, see Estimate.add_report_estimate.
+
+    :param memory_budget: maximum projected memory in megabytes, 0 for no budget
+    :return: is the projected memory over budget?
+    :rtype: bool
+    """
+    add_bake_report("estimate_samples", estimate["samples"])
+
+    return Estimate.add_report_estimate(add_bake_report, estimate, memory_budget)
+
+def estimate_bake(context):
+    """
+    Dry run: project the workload of baking the selection into the report, without modifying the scene. The selection is restored afterwards.
+
+    :param context: Blender current execution context
+    :return: success, message verbose, message
+    :rtype: tuple
+    """
+    settings = context.scene.VATBakerSettings
+    reset_bake_report()
+
+    selected_objs = set(context.selected_objects)
+    active_obj = context.view_layer.objects.active
+
+    try:
+        success, msg, objs_to_bake, active_object = get_bake_selection(context)
+        if not success:
+            return (False, 'ERROR', msg)
+
+        success, msg, bake_frames_info = get_bake_frames(context, objs_to_bake)
+        if not success:
+            return (False, 'ERROR', msg)
+
+        frames_to_bake, bake_start_frame, bake_end_frame = bake_frames_info
+        num_verts = get_bake_vertices(context, objs_to_bake)
+        add_bake_report("num_verts", num_verts)
+
+        success, msg, tex_width, tex_height, bake_frame_height, bake_frame_width = get_best_texture_resolution(context, len(frames_to_bake), num_verts)
+        if not success:
+            return (False, 'ERROR', msg)
+
+        estimate = get_bake_estimate(context, objs_to_bake, len(frames_to_bake), num_verts, tex_width, tex_height)
+    finally:
+        for obj in context.view_layer.objects:
+            obj.select_set(obj in selected_objs)
+        context.view_layer.objects.active = active_obj
+
+    over_budget = add_bake_report_estimate(estimate, settings.memory_budget)
+
+    msg = "Bake projected to take %0.1fs and use %0.1f MB" % (estimate["time"], estimate["memory"] / (1024.0 * 1024.0))
+    if over_budget:
+        return (True, 'WARNING', msg + ", over the %d MB memory budget" % settings.memory_budget)
+
+    return (True, 'INFO', msg)
+
 ###########
 ### XML ###
 def export_xml(context):
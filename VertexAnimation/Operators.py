@@ -16,8 +16,7 @@ import bpy
 from bpy.types import Operator
 from bpy.props import StringProperty
 
-from . import Functions
-from .Functions import bake, reset_bake_report
+# Functions is heavy (bmesh, geonodes...) and only imported by operators when they first execute, see auto_load
 
 #######################################################################################
 ###################################### OPERATORS ######################################
@@ -44,6 +43,7 @@ class VATBAKER_OT_Bake(Operator):
             return False
 
     def execute(self, context):
+        from .Functions import bake
         success, verbose, msg = bake(context)
         if success:
             self.report({verbose}, msg)
@@ -52,6 +52,26 @@ class VATBAKER_OT_Bake(Operator):
             self.report({verbose}, msg)
             return {'CANCELLED'}
 
+class VATBAKER_OT_Estimate(Operator):
+    """ Projects the workload of a bake of the selection without baking anything. """
+    bl_idname = "gametools.vatbaker_estimate"
+    bl_label = "Estimate"
+    bl_category = "Game Tools"
+    bl_description = "Dry run: project the frames, vertices, texture size, memory & time a bake of the selection would take, without modifying anything"
+
+    @classmethod
+    def poll(cls, context):
+        return VATBAKER_OT_Bake.poll(context)
+
+    def execute(self, context):
+        from .Functions import estimate_bake
+        success, verbose, msg = estimate_bake(context)
+        self.report({verbose}, msg)
+        if success:
+            return {'FINISHED'}
+        else:
+            return {'CANCELLED'}
+
 class VATBAKER_OT_ExportReport(Operator):
     """ """
     bl_idname = "gametools.vatbaker_export_report"
@@ -78,8 +98,10 @@ class VATBAKER_OT_ClearReport(Operator):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.VATBakerReport.baked
+        report = context.scene.VATBakerReport
+        return report.baked or report.estimated
 
     def execute(self, context):
+        from .Functions import reset_bake_report
         reset_bake_report()
         return {'FINISHED'}
\ No newline at end of file
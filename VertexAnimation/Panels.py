@@ -75,7 +75,8 @@ class VATBAKER_OT_VertexAnimation_AddPreset(AddPresetBase, bpy.types.Operator):
         'settings.export_tex_max_height',
         'settings.tex_force_power_of_two',
         'settings.tex_force_power_of_two_square',
-        'settings.tex_packing_mode'
+        'settings.tex_packing_mode',
+        'settings.memory_budget'
     ]
 
     preset_subdir = 'operator/databaker_vat'
@@ -123,6 +124,10 @@ class VATBAKER_PT_VertexAnimation(bpy.types.Panel):
         row.scale_y = 2.0
         row.enabled = settings.offset_tex or settings.normal_tex
 
+        row = layout.row()
+        row.operator("gametools.vatbaker_estimate")
+        row.enabled = settings.offset_tex or settings.normal_tex
+
 #############
 ### SCENE ###
 class VATBAKER_PT_FramePanel(bpy.types.Panel):
@@ -315,6 +320,9 @@ class VATBAKER_PT_TexMainPanel(bpy.types.Panel):
         row = layout.row()
         row.prop(settings, "tex_packing_mode")
 
+        row = layout.row()
+        row.prop(settings, "memory_budget")
+
 class VATBAKER_PT_TexOffsetPanel(bpy.types.Panel):
     bl_idname = "VATBAKER_PT_texnoffsetpanel"
     bl_parent_id = "VATBAKER_PT_texmainpanel"
@@ -494,7 +502,8 @@ class VATBAKER_PT_ReportPanel(bpy.types.Panel):
 
     @classmethod
     def poll(cls, context):
-        return context.scene.VATBakerReport.baked
+        report = context.scene.VATBakerReport
+        return report.baked or report.estimated
 
     # def draw_header(self, context):
     #     report = context.scene.VATBakerReport
@@ -509,13 +518,17 @@ class VATBAKER_PT_ReportPanel(bpy.types.Panel):
         scene = context.scene
         report = scene.VATBakerReport
 
-        if report.baked:
+        row = layout.row()
+        row.scale_y = 2.0
+        col = row.split()
+        col.operator("gametools.vatbaker_export_report")
+        col = row.split()
+        col.operator("gametools.vatbaker_clear_report")
+
+        if not report.baked:
             row = layout.row()
-            row.scale_y = 2.0
-            col = row.split()
-            col.operator("gametools.vatbaker_export_report")
-            col = row.split()
-            col.operator("gametools.vatbaker_clear_report")
+            row.label(text="Dry run", icon="INFO")
+            return
 
         row = layout.row()
         if report.success:
@@ -533,6 +546,55 @@ class VATBAKER_PT_ReportPanel(bpy.types.Panel):
         row = layout.row()
         row.label(text=report.name)
 
+class VATBAKER_PT_ReportEstimatePanel(bpy.types.Panel):
+    bl_idname = "VATBAKER_PT_infoestimatepanel"
+    bl_parent_id = "VATBAKER_PT_reportpanel"
+    bl_label = "Estimate"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "Game Tools"
+    bl_order = 0
+
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.VATBakerReport.estimated
+
+    def draw_header(self, context):
+        report = context.scene.VATBakerReport
+        row = self.layout.row(align=True)
+        if report.estimate_over_budget:
+            row.label(text="", icon="ERROR")
+        else:
+            row.label(text="", icon="CHECKMARK")
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        report = scene.VATBakerReport
+
+        # bakes under a memory budget only project memory
+        if report.estimate_time > 0.0:
+            row = layout.row()
+            row.label(text="Time: %0.1fs" % report.estimate_time, icon="TIME")
+
+        row = layout.row()
+        row.label(text="Memory: %0.1f MB" % report.estimate_memory, icon="MEMORY")
+        if report.estimate_over_budget:
+            row = layout.row()
+            row.label(text="Over the memory budget (%d MB)" % scene.VATBakerSettings.memory_budget, icon="ERROR")
+
+        layout.separator()
+
+        row = layout.row()
+        row.label(text="Frames: " + str(report.num_frames_padded or report.num_frames))
+        row.label(text="Vertices: " + str(report.num_verts))
+
+        row = layout.row()
+        row.label(text="Samples: " + str(report.estimate_samples))
+        row.label(text="Texture: %dx%d" % (report.tex_width, report.tex_height))
+
 class VATBAKER_PT_ReportTexPanel(bpy.types.Panel):
     bl_idname = "VATBAKER_PT_infotexpanel"
     bl_parent_id = "VATBAKER_PT_reportpanel"
@@ -640,6 +702,10 @@ class VATBAKER_PT_ReportMeshPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.VATBakerReport.baked
+
     def draw_header(self, context):
         report = context.scene.VATBakerReport
         row = self.layout.row(align=True)
@@ -721,6 +787,10 @@ class VATBAKER_PT_ReportXMLPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.VATBakerReport.baked
+
     def draw_header(self, context):
         report = context.scene.VATBakerReport
         row = self.layout.row(align=True)
@@ -892,6 +962,10 @@ class VATBAKER_PT_ReportUnitPanel(bpy.types.Panel):
 
     bl_options = {'DEFAULT_CLOSED'}
 
+    @classmethod
+    def poll(cls, context):
+        return context.scene.VATBakerReport.baked
+
     def draw(self, context):
         layout = self.layout
         scene = context.scene
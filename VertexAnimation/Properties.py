@@ -94,6 +94,8 @@ class VATBAKER_PG_SettingsPropertyGroup(PropertyGroup):
     export_tex_max_width: IntProperty(name="Max Width", min=2, max=8192, default=4096, description="Maximum allowed image width. Total image size must at least equal num_vertices*num_frames to bake. tex_width may have an effect on how the animation is stored in the images depending on the selected maximum width vs amount of vertices to bake and the use of 'Power of Two' setting.")
     export_tex_max_height: IntProperty(name="Max Height", min=2, max=8192, default=4096, description="Maximum allowed image height. Total image size must at least equal num_vertices*num_frames to bake.")
 
+    memory_budget: IntProperty(name="Memory Budget", min=0, default=0, description="Maximum memory in megabytes a bake is projected to use, see the Estimate button. Bakes projected to use more refuse to start. 0 for no budget")
+
     tex_force_power_of_two: BoolProperty(name="Power of Two", default=False, description="Forces images to be of power of two. Image width and height may still differ, see 'Square' option if that's an issue. This isn't recommended as non-power-of-two textures ensure tight data packing, are supported by most game engines nowadays and aren't supposed be mipmapped anyway. In case there are more vertices to bake each frame than the maximum allowed image width, vertex data will have to 'overflow' and be stored on multiple lines.")
     tex_force_power_of_two_square: BoolProperty(name="Square", default=False, description="Forces images width and height to be equal in case 'Power of Two' is enabled. I don't see any reason why you would want to this but it is an option. You can choose how the extra texture space is handled with the 'Fill' option.")
     tex_packing_modes = [
@@ -203,6 +205,12 @@ class VATBAKER_PG_ReportPropertyGroup(PropertyGroup):
     ]
     tex_sampling_mode: EnumProperty(name="Sampling", items=tex_sampling_modes, default=0, description="Defines how VAT texture(s) are meant to be sampled in your shader/game engine. Please read the tooltips carefully")
 
+    estimated: BoolProperty(name="Estimated", default=False, description="")
+    estimate_samples: IntProperty(name="Samples", default=0, description="Frames x vertices")
+    estimate_memory: FloatProperty(name="Memory", default=0.0, description="Projected memory in megabytes")
+    estimate_time: FloatProperty(name="Time", default=0.0, description="Projected wall time in seconds")
+    estimate_over_budget: BoolProperty(name="Over Budget", default=False, description="")
+
     xml: BoolProperty(name="XML", default=False, description="")
     xml_path: StringProperty(name="Filepath", default="//", description="", subtype='FILE_PATH')
 
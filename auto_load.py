@@ -12,11 +12,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import bpy
-import typing
-import inspect
-import pkgutil
 import importlib
-from pathlib import Path
 
 __all__ = (
     "init",
@@ -26,6 +22,139 @@ __all__ = (
 
 blender_version = bpy.app.version
 
+# modules holding classes to register, with their classes in registration order. Functions modules aren't listed on purpose:
+# they're heavy (numpy, xml...) and only imported by operators & panels when first needed.
+# Classes are ordered ahead of time rather than sorted on every init: property groups come after the ones they point to,
+# child panels after their parent, then by bl_order. Regenerate & check the order with Tools/DataBakerStartup.py when adding a class
+MODULES = (
+    ("DataBaker.Properties", (
+        "DATABAKER_PG_SettingsPropertyGroup",
+        "DATABAKER_PG_ReportAnimPropertyGroup",
+        "DATABAKER_PG_ReportTimingPropertyGroup",
+        "DATABAKER_PG_ReportPropertyGroup",
+    )),
+    ("DataBaker.Panels", (
+        "DATABAKER_MT_DataBaker_Presets",
+        "DATABAKER_OT_DataBaker_AddPreset",
+        "DATABAKER_PT_DataBaker_Preset",
+        "DATABAKER_PT_DataBaker",
+        "DATABAKER_UL_ReportUVMapList",
+        "DATABAKER_PT_Data",
+        "DATABAKER_PT_MeshMainPanel",
+        "DATABAKER_PT_XMLPanel",
+        "DATABAKER_PT_InfoPanel",
+        "DATABAKER_PT_ReportPanel",
+        "DATABAKER_PT_TransformPanel",
+        "DATABAKER_PT_ParentPanel",
+        "DATABAKER_PT_XMLExportPanel",
+        "DATABAKER_PT_ReportEstimatePanel",
+        "DATABAKER_PT_MeshUVPanel",
+        "DATABAKER_PT_ReportMeshPanel",
+        "DATABAKER_PT_MeshColorPanel",
+        "DATABAKER_PT_ReportXMLPanel",
+        "DATABAKER_PT_ReportUnitPanel",
+        "DATABAKER_PT_ReportTimingsPanel",
+        "DATABAKER_PT_ShapekeyPanel",
+        "DATABAKER_PT_MeshExportPanel",
+        "DATABAKER_PT_MaskPanel",
+        "DATABAKER_PT_RandomPanel",
+        "DATABAKER_PT_MiscPanel",
+        "DATABAKER_PT_MeshAdvPanel",
+        "DATABAKER_PT_PositionPanel",
+        "DATABAKER_PT_ShapekeyOffsetPanel",
+        "DATABAKER_PT_ShapekeyNormalPanel",
+        "DATABAKER_PT_SphereMaskPanel",
+        "DATABAKER_PT_LinearMaskPanel",
+        "DATABAKER_PT_RandomPerCollectionPanel",
+        "DATABAKER_PT_RandomPerObjectPanel",
+        "DATABAKER_PT_RandomPerPolyPanel",
+        "DATABAKER_PT_ParentPositionPanel",
+        "DATABAKER_PT_ParentAxisPanel",
+        "DATABAKER_PT_FixedValuePanel",
+        "DATABAKER_PT_DirectionPanel",
+        "DATABAKER_PT_AxisPanel",
+        "DATABAKER_PT_MeshAdvExportPanel",
+        "DATABAKER_PT_ShapekeyOffsetXPanel",
+        "DATABAKER_PT_ShapekeyOffsetYPanel",
+        "DATABAKER_PT_ShapekeyOffsetZPanel",
+        "DATABAKER_PT_ShapekeyOffsetXYZPanel",
+        "DATABAKER_PT_ShapekeyOffsetABPanel",
+        "DATABAKER_PT_ShapekeyNormalXPanel",
+        "DATABAKER_PT_ShapekeyNormalYPanel",
+        "DATABAKER_PT_ShapekeyNormalZPanel",
+        "DATABAKER_PT_ShapekeyNormalXYZPanel",
+        "DATABAKER_PT_ShapekeyNormalABPanel",
+        "DATABAKER_PT_ParentPositionXPanel",
+        "DATABAKER_PT_ParentPositionYPanel",
+        "DATABAKER_PT_ParentPositionZPanel",
+        "DATABAKER_PT_ParentPositionXYZPanel",
+        "DATABAKER_PT_ParentPositionABPanel",
+        "DATABAKER_PT_ParentAxisXPanel",
+        "DATABAKER_PT_ParentAxisYPanel",
+        "DATABAKER_PT_ParentAxisZPanel",
+        "DATABAKER_PT_ParentAxisXYZPanel",
+        "DATABAKER_PT_ParentAxisABPanel",
+        "DATABAKER_PT_PositionXPanel",
+        "DATABAKER_PT_PositionXYZPanel",
+        "DATABAKER_PT_PositionABPanel",
+        "DATABAKER_PT_AxisXPanel",
+        "DATABAKER_PT_AxisXYZPanel",
+        "DATABAKER_PT_AxisABPanel",
+        "DATABAKER_PT_PositionYPanel",
+        "DATABAKER_PT_AxisYPanel",
+        "DATABAKER_PT_PositionZPanel",
+        "DATABAKER_PT_AxisZPanel",
+    )),
+    ("DataBaker.Operators", (
+        "DATABAKER_OT_BakeData",
+        "DATABAKER_OT_EstimateBake",
+        "DATABAKER_OT_ClearReport",
+        "DATABAKER_OT_GetPositionDataMultiplier",
+        "DATABAKER_OT_GetParentPositionDataMultiplier",
+        "DATABAKER_OT_GetShapekeyOffsetDataMultiplier",
+    )),
+    ("VertexAnimation.Properties", (
+        "VATBAKER_PG_SettingsPropertyGroup",
+        "VATBAKER_PG_ReportAnimObjPropertyGroup",
+        "VATBAKER_PG_ReportAnimPropertyGroup",
+        "VATBAKER_PG_ReportPropertyGroup",
+    )),
+    ("VertexAnimation.Panels", (
+        "VATBAKER_MT_VertexAnimation_Presets",
+        "VATBAKER_OT_VertexAnimation_AddPreset",
+        "VATBAKER_PT_VertexAnimation_Preset",
+        "VATBAKER_PT_VertexAnimation",
+        "VATBAKER_UL_ReportAnimsList",
+        "VATBAKER_UL_ReportAnimsObjsList",
+        "VATBAKER_PT_FramePanel",
+        "VATBAKER_PT_MeshMainPanel",
+        "VATBAKER_PT_TexMainPanel",
+        "VATBAKER_PT_XMLPanel",
+        "VATBAKER_PT_ReportPanel",
+        "VATBAKER_PT_TexOffsetPanel",
+        "VATBAKER_PT_ReportEstimatePanel",
+        "VATBAKER_PT_TexNormalPanel",
+        "VATBAKER_PT_XMLExportPanel",
+        "VATBAKER_PT_ReportTexPanel",
+        "VATBAKER_PT_MeshUVPanel",
+        "VATBAKER_PT_TexExportPanel",
+        "VATBAKER_PT_ReportMeshPanel",
+        "VATBAKER_PT_MeshExportPanel",
+        "VATBAKER_PT_ReportXMLPanel",
+        "VATBAKER_PT_ReportAnimsPanel",
+        "VATBAKER_PT_ReportFramesPanel",
+        "VATBAKER_PT_ReportUnitPanel",
+        "VATBAKER_PT_TexAdvExportPanel",
+        "VATBAKER_PT_MeshAdvExportPanel",
+    )),
+    ("VertexAnimation.Operators", (
+        "VATBAKER_OT_Bake",
+        "VATBAKER_OT_Estimate",
+        "VATBAKER_OT_ExportReport",
+        "VATBAKER_OT_ClearReport",
+    )),
+)
+
 modules = None
 ordered_classes = None
 
@@ -34,8 +163,8 @@ def init():
     global modules
     global ordered_classes
 
-    modules = get_all_submodules(Path(__file__).parent)
-    ordered_classes = get_ordered_classes_to_register(modules)
+    modules = get_all_submodules()
+    ordered_classes = get_ordered_classes(modules)
 
 
 def register():
@@ -64,31 +193,32 @@ def unregister():
 #################################################
 
 
-def get_all_submodules(directory):
-    return list(iter_submodules(directory, __package__))
+def get_all_submodules():
+    return [importlib.import_module("." + name, __package__) for name, class_names in MODULES]
 
 
-def iter_submodules(path, package_name):
-    for name in sorted(iter_submodule_names(path)):
-        yield importlib.import_module("." + name, package_name)
-
+# Find classes to register
+#################################################
 
-def iter_submodule_names(path, root=""):
-    for _, module_name, is_package in pkgutil.iter_modules([str(path)]):
-        if is_package:
-            sub_path = path / module_name
-            sub_root = root + module_name + "."
-            yield from iter_submodule_names(sub_path, sub_root)
-        else:
-            yield root + module_name
 
+def get_ordered_classes(modules):
+    return [getattr(module, class_name) for module, (name, class_names) in zip(modules, MODULES) for class_name in class_names]
 
-# Find classes to register
-#################################################
 
+def get_ordered_classes_errors(modules):
+    # the precomputed order must hold every class & resolve their dependencies, see Tools/DataBakerStartup.py.
+    # Registered classes aren't inspected: call it before registering
+    ordered_classes = get_ordered_classes(modules)
+    deps_dict = get_register_deps_dict(modules)
 
-def get_ordered_classes_to_register(modules):
-    return toposort(get_register_deps_dict(modules))
+    errors = ["%s isn't listed in MODULES" % cls.__name__ for cls in deps_dict if cls not in ordered_classes]
+    registered = set()
+    for cls in ordered_classes:
+        for dependency in deps_dict.get(cls, ()):
+            if dependency not in registered:
+                errors.append("%s is registered before %s" % (cls.__name__, dependency.__name__))
+        registered.add(cls)
+    return errors
 
 
 def get_register_deps_dict(modules):
@@ -107,7 +237,8 @@ def iter_my_register_deps(cls, my_classes, my_classes_by_idname):
 
 
 def iter_my_deps_from_annotations(cls, my_classes):
-    for value in typing.get_type_hints(cls, {}, {}).values():
+    # annotations are property definitions, read them as is rather than resolving them as type hints
+    for value in cls.__dict__.get("__annotations__", {}).values():
         dependency = get_dependency_from_annotation(value)
         if dependency is not None:
             if dependency in my_classes:
@@ -152,7 +283,7 @@ def get_classes_in_modules(modules):
 
 def iter_classes_in_module(module):
     for value in module.__dict__.values():
-        if inspect.isclass(value):
+        if isinstance(value, type):
             yield value
 
 
@@ -175,25 +306,3 @@ def get_register_base_types():
             "GizmoGroup",
         ]
     )
-
-
-# Find order to register to solve dependencies
-#################################################
-
-
-def toposort(deps_dict):
-    sorted_list = []
-    sorted_values = set()
-    while len(deps_dict) > 0:
-        unsorted = []
-        sorted_list_sub = []  # helper for additional sorting by bl_order - in panels
-        for value, deps in deps_dict.items():
-            if len(deps) == 0:
-                sorted_list_sub.append(value)
-                sorted_values.add(value)
-            else:
-                unsorted.append(value)
-        deps_dict = {value: deps_dict[value] - sorted_values for value in unsorted}
-        sorted_list_sub.sort(key=lambda cls: getattr(cls, "bl_order", 0))
-        sorted_list.extend(sorted_list_sub)
-    return sorted_list